@@ -5,7 +5,7 @@ import logging
 from typing import Dict, Optional, Any
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Response, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
@@ -67,8 +67,8 @@ async def login(
     try:
         auth_service = AuthService(db)
         
-        # Verify JWT token
-        jwt_payload = await auth_service.verify_jwt_token(request.jwt_token)
+        # Verify JWT token with Supabase so revoked tokens cannot open a session
+        jwt_payload = await auth_service.verify_jwt_token(request.jwt_token, strict=True)
         if not jwt_payload:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -362,18 +362,26 @@ async def update_preferences(
 
 @router.get("/sessions")
 async def get_user_sessions(
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of sessions to return"),
+    offset: int = Query(0, ge=0, description="Number of sessions to skip"),
     user_id: str = Depends(require_authentication),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
-    Get all active sessions for the current user.
+    Get the active sessions for the current user.
     
-    This endpoint returns information about all active sessions
-    for the authenticated user.
+    This endpoint returns a page of the active sessions for the
+    authenticated user, most recently used first.
     """
     try:
         auth_service = AuthService(db)
-        sessions = await auth_service.get_user_sessions(user_id)
+        sessions = await auth_service.get_user_sessions_page(user_id, limit=limit, offset=offset)
+        
+        # Only count separately when the page does not already tell us the total
+        if offset == 0 and len(sessions) < limit:
+            total_count = len(sessions)
+        else:
+            total_count = await auth_service.count_user_sessions(user_id)
         
         session_info = []
         for session in sessions:
@@ -391,7 +399,7 @@ async def get_user_sessions(
         
         return {
             "sessions": session_info,
-            "total_count": len(session_info)
+            "total_count": total_count
         }
         
     except Exception as e:
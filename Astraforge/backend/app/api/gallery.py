@@ -2,11 +2,11 @@
 Gallery API endpoints for mission browsing, search, and discovery.
 """
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from ..core.database import get_db
 from ..core.auth import get_current_user
@@ -17,6 +17,19 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/gallery", tags=["gallery"])
 
+_MISSION_SUMMARIES = TypeAdapter(List[MissionSummaryResponse])
+
+
+def _json_response(content: Union[str, bytes]) -> Response:
+    """
+    Wrap JSON produced by pydantic's serializer in a response.
+    
+    The gallery service builds its response models from trusted rows, so they
+    are serialized once here instead of being re-validated against the
+    response_model and passed through jsonable_encoder on the way out.
+    """
+    return Response(content=content, media_type="application/json")
+
 
 # Response schemas
 class FeaturedMissionsResponse(BaseModel):
@@ -67,7 +80,7 @@ async def get_featured_missions(
     limit: int = Query(10, ge=1, le=50, description="Maximum number of missions"),
     db: AsyncSession = Depends(get_db),
     current_user: Optional[str] = Depends(get_current_user)
-) -> FeaturedMissionsResponse:
+) -> Response:
     """
     Get featured missions for the gallery homepage.
     
@@ -79,10 +92,10 @@ async def get_featured_missions(
         gallery_service = GalleryService(db)
         missions = await gallery_service.get_featured_missions(limit, current_user)
         
-        return FeaturedMissionsResponse(
+        return _json_response(FeaturedMissionsResponse(
             missions=missions,
             total_count=len(missions)
-        )
+        ).model_dump_json())
         
     except Exception as e:
         logger.error(f"Error getting featured missions: {e}")
@@ -95,7 +108,7 @@ async def get_example_missions(
     difficulty: Optional[int] = Query(None, ge=1, le=5, description="Difficulty level"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of missions"),
     db: AsyncSession = Depends(get_db)
-) -> ExampleMissionsResponse:
+) -> Response:
     """
     Get example missions for learning and inspiration.
     
@@ -107,12 +120,12 @@ async def get_example_missions(
         gallery_service = GalleryService(db)
         missions = await gallery_service.get_example_missions(category, difficulty, limit)
         
-        return ExampleMissionsResponse(
+        return _json_response(ExampleMissionsResponse(
             missions=missions,
             category=category,
             difficulty=difficulty,
             total_count=len(missions)
-        )
+        ).model_dump_json())
         
     except Exception as e:
         logger.error(f"Error getting example missions: {e}")
@@ -124,7 +137,7 @@ async def get_popular_missions(
     time_period: str = Query("week", pattern="^(day|week|month)$", description="Time period"),
     limit: int = Query(10, ge=1, le=50, description="Maximum number of missions"),
     db: AsyncSession = Depends(get_db)
-) -> PopularMissionsResponse:
+) -> Response:
     """
     Get popular missions based on recent activity.
     
@@ -135,11 +148,11 @@ async def get_popular_missions(
         gallery_service = GalleryService(db)
         missions = await gallery_service.get_popular_missions(time_period, limit)
         
-        return PopularMissionsResponse(
+        return _json_response(PopularMissionsResponse(
             missions=missions,
             time_period=time_period,
             total_count=len(missions)
-        )
+        ).model_dump_json())
         
     except Exception as e:
         logger.error(f"Error getting popular missions: {e}")
@@ -151,6 +164,7 @@ async def search_missions(
     q: str = Query(..., min_length=1, description="Search query"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     target_body: Optional[str] = Query(None, description="Filter by target body"),
     vehicle_type: Optional[str] = Query(None, description="Filter by vehicle type"),
     difficulty_min: Optional[int] = Query(None, ge=1, le=5, description="Minimum difficulty"),
@@ -161,7 +175,7 @@ async def search_missions(
     sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order"),
     db: AsyncSession = Depends(get_db),
     current_user: Optional[str] = Depends(get_current_user)
-) -> MissionListResponse:
+) -> Response:
     """
     Advanced mission search with filtering and ranking.
     
@@ -191,10 +205,11 @@ async def search_missions(
             filters=filters,
             user_id=current_user,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            cursor=cursor
         )
         
-        return results
+        return _json_response(results.model_dump_json())
         
     except ValueError as e:
         logger.error(f"Search validation error: {e}")
@@ -210,6 +225,7 @@ class AdvancedSearchRequest(BaseModel):
     filters: SearchFilters = SearchFilters()
     page: int = Field(1, ge=1, description="Page number")
     page_size: int = Field(20, ge=1, le=100, description="Items per page")
+    cursor: Optional[str] = Field(None, description="next_cursor from the previous page")
 
 
 @router.post("/search/advanced", response_model=MissionListResponse)
@@ -217,7 +233,7 @@ async def advanced_search_missions(
     request: AdvancedSearchRequest,
     db: AsyncSession = Depends(get_db),
     current_user: Optional[str] = Depends(get_current_user)
-) -> MissionListResponse:
+) -> Response:
     """
     Advanced mission search with complex filters.
     
@@ -232,10 +248,11 @@ async def advanced_search_missions(
             filters=request.filters.model_dump(exclude_unset=True),
             user_id=current_user,
             page=request.page,
-            page_size=request.page_size
+            page_size=request.page_size,
+            cursor=request.cursor
         )
         
-        return results
+        return _json_response(results.model_dump_json())
         
     except ValueError as e:
         logger.error(f"Advanced search validation error: {e}")
@@ -321,13 +338,13 @@ async def get_gallery_stats(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/suggestions")
+@router.get("/suggestions", response_model=List[MissionSummaryResponse])
 async def get_mission_suggestions(
     based_on: Optional[str] = Query(None, description="Base suggestions on mission ID"),
     limit: int = Query(5, ge=1, le=20, description="Maximum number of suggestions"),
     db: AsyncSession = Depends(get_db),
     current_user: Optional[str] = Depends(get_current_user)
-) -> List[MissionSummaryResponse]:
+) -> Response:
     """
     Get mission suggestions for discovery.
     
@@ -341,7 +358,7 @@ async def get_mission_suggestions(
         # In the future, this could use ML-based recommendations
         suggestions = await gallery_service.get_featured_missions(limit, current_user)
         
-        return suggestions
+        return _json_response(_MISSION_SUMMARIES.dump_json(suggestions))
         
     except Exception as e:
         logger.error(f"Error getting mission suggestions: {e}")
@@ -4,7 +4,7 @@ Vehicle presets API endpoints.
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -15,7 +15,9 @@ from app.schemas.vehicle_presets import (
     VehiclePresetCreate,
     VehiclePresetUpdate,
     VehiclePresetResponse,
-    VehiclePresetListResponse
+    VehiclePresetListResponse,
+    VehiclePresetSummary,
+    VehiclePresetStatsResponse
 )
 
 router = APIRouter(prefix="/vehicle-presets", tags=["vehicle-presets"])
@@ -64,7 +66,7 @@ async def list_vehicle_presets(
     limit: int = Query(50, ge=1, le=100, description="Maximum number of presets to return"),
     offset: int = Query(0, ge=0, description="Number of presets to skip"),
     db: AsyncSession = Depends(get_db)
-) -> VehiclePresetListResponse:
+) -> Response:
     """List vehicle presets with optional filtering."""
     service = VehiclePresetService(db)
     
@@ -76,14 +78,45 @@ async def list_vehicle_presets(
         offset=offset
     )
     
-    preset_responses = [VehiclePresetResponse.from_db_model(preset) for preset in presets]
+    # Serialize once in pydantic-core; returning a Response skips FastAPI's
+    # re-validation of the whole list against response_model
+    response = VehiclePresetListResponse.from_db_models(presets, limit=limit, offset=offset)
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+@router.get("/summary", response_model=List[VehiclePresetSummary])
+async def list_vehicle_preset_summaries(
+    vehicle_type: Optional[VehicleType] = Query(None, description="Filter by vehicle type"),
+    is_public: Optional[bool] = Query(None, description="Filter by public status"),
+    created_by: Optional[str] = Query(None, description="Filter by creator"),
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of presets to return"),
+    offset: int = Query(0, ge=0, description="Number of presets to skip"),
+    db: AsyncSession = Depends(get_db)
+) -> List[VehiclePresetSummary]:
+    """List lightweight vehicle preset summaries without spacecraft configurations."""
+    service = VehiclePresetService(db)
     
-    return VehiclePresetListResponse(
-        presets=preset_responses,
-        total=len(preset_responses),
+    presets = await service.list_preset_summaries(
+        vehicle_type=vehicle_type,
+        is_public=is_public,
+        created_by=created_by,
         limit=limit,
         offset=offset
     )
+    
+    return [VehiclePresetSummary.from_db_model(preset) for preset in presets]
+
+
+@router.get("/stats", response_model=VehiclePresetStatsResponse)
+async def get_vehicle_preset_stats(
+    db: AsyncSession = Depends(get_db)
+) -> VehiclePresetStatsResponse:
+    """Get preset counts and per-vehicle-type averages."""
+    service = VehiclePresetService(db)
+    
+    stats = await service.get_preset_stats()
+    
+    return VehiclePresetStatsResponse(**stats)
 
 
 @router.get("/{preset_id}", response_model=VehiclePresetResponse)
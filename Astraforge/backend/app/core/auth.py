@@ -1,6 +1,7 @@
 """
 Authentication middleware and dependencies for FastAPI.
 """
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
@@ -8,8 +9,13 @@ from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .database import get_db
-from ..services.auth_service import AuthService, AuthenticationError
+from .database import AsyncSessionLocal, get_db
+from ..services.auth_service import (
+    AuthService,
+    AuthenticationError,
+    close_request_token_scope,
+    open_request_token_scope
+)
 from ..models.database import UserSession
 
 logger = logging.getLogger(__name__)
@@ -170,6 +176,35 @@ async def get_optional_user(
     return auth_context.user_id if auth_context.is_authenticated else None
 
 
+async def cleanup_expired_sessions_once() -> int:
+    """
+    Delete expired sessions using a dedicated database session.
+    
+    Returns:
+        Number of sessions cleaned up
+    """
+    async with AsyncSessionLocal() as db:
+        return await AuthService(db).cleanup_expired_sessions()
+
+
+async def run_session_cleanup(interval_seconds: float) -> None:
+    """
+    Periodically delete expired sessions until cancelled.
+    
+    Started from the application lifespan so cleanup never runs on a
+    request's critical path.
+    
+    Args:
+        interval_seconds: Delay between cleanup runs
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await cleanup_expired_sessions_once()
+        except Exception as e:
+            logger.error(f"Error during session cleanup: {e}")
+
+
 class AuthMiddleware:
     """Authentication middleware for session cleanup and management."""
     
@@ -177,86 +212,88 @@ class AuthMiddleware:
         self.app = app
         self._last_cleanup = datetime.now()
         self._cleanup_interval = timedelta(hours=1)  # Cleanup every hour
+        self._cleanup_task: Optional[asyncio.Task] = None
     
     async def __call__(self, scope, receive, send):
         """ASGI middleware implementation."""
         # Periodic session cleanup
         if scope["type"] == "http":
-            await self._maybe_cleanup_sessions(scope)
+            self._maybe_cleanup_sessions()
         
         await self.app(scope, receive, send)
     
-    async def _maybe_cleanup_sessions(self, scope):
-        """Perform periodic session cleanup."""
+    def _maybe_cleanup_sessions(self):
+        """Start a background session cleanup if one is due and none is running."""
         now = datetime.now()
-        if now - self._last_cleanup > self._cleanup_interval:
-            try:
-                # Import here to avoid circular imports
-                from ..core.database import get_db
-                from ..services.auth_service import AuthService
-                
-                # Get database session
-                db_gen = get_db()
-                db = await db_gen.__anext__()
-                
-                try:
-                    auth_service = AuthService(db)
-                    cleaned_count = await auth_service.cleanup_expired_sessions()
-                    if cleaned_count > 0:
-                        logger.info(f"Cleaned up {cleaned_count} expired sessions")
-                finally:
-                    await db.close()
-                
-                self._last_cleanup = now
-                
-            except Exception as e:
-                logger.error(f"Error during session cleanup: {e}")
+        if now - self._last_cleanup <= self._cleanup_interval:
+            return
+        if self._cleanup_task is not None and not self._cleanup_task.done():
+            return
+        
+        # Run off the request path; the triggering request does not wait
+        self._last_cleanup = now
+        self._cleanup_task = asyncio.create_task(cleanup_expired_sessions_once())
 
 
 class JWTValidationMiddleware:
-    """Middleware for validating JWT tokens and setting user context."""
+    """
+    Middleware for validating JWT tokens and setting user context.
+    
+    Verified payloads are remembered for the rest of the request, so
+    dependencies that verify the same token again do no extra work.
+    """
     
     def __init__(self, app):
         self.app = app
     
     async def __call__(self, scope, receive, send):
         """ASGI middleware implementation."""
-        if scope["type"] == "http":
-            # Extract and validate JWT token if present
-            headers = dict(scope.get("headers", []))
-            auth_header = headers.get(b"authorization", b"").decode()
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        token_scope = open_request_token_scope()
+        try:
+            await self._validate(scope)
+            await self.app(scope, receive, send)
+        finally:
+            close_request_token_scope(token_scope)
+    
+    async def _validate(self, scope):
+        """Verify the bearer token, if any, and attach the user context to scope."""
+        # Extract and validate JWT token if present
+        headers = dict(scope.get("headers", []))
+        auth_header = headers.get(b"authorization", b"").decode()
+        
+        if auth_header.startswith("Bearer "):
+            token = auth_header[7:]  # Remove "Bearer " prefix
             
-            if auth_header.startswith("Bearer "):
-                token = auth_header[7:]  # Remove "Bearer " prefix
-                
-                # Import here to avoid circular imports
-                from ..services.auth_service import AuthService
-                from ..core.database import get_db
+            # Import here to avoid circular imports
+            from ..services.auth_service import AuthService
+            from ..core.database import get_db
+            
+            try:
+                # Get database session
+                db_gen = get_db()
+                db = await db_gen.__anext__()
                 
                 try:
-                    # Get database session
-                    db_gen = get_db()
-                    db = await db_gen.__anext__()
+                    auth_service = AuthService(db)
+                    jwt_payload = await auth_service.verify_jwt_token(token)
                     
-                    try:
-                        auth_service = AuthService(db)
-                        jwt_payload = await auth_service.verify_jwt_token(token)
-                        
-                        if jwt_payload:
-                            # Add user context to scope for downstream use
-                            scope["user_context"] = {
-                                "user_id": jwt_payload["user_id"],
-                                "email": jwt_payload.get("email"),
-                                "is_authenticated": True,
-                                "jwt_payload": jwt_payload
-                            }
-                    finally:
-                        await db.close()
-                        
-                except Exception as e:
-                    logger.error(f"Error validating JWT token: {e}")
-        
-        await self.app(scope, receive, send)
+                    if jwt_payload:
+                        # Add user context to scope for downstream use
+                        scope["user_context"] = {
+                            "user_id": jwt_payload["user_id"],
+                            "email": jwt_payload.get("email"),
+                            "is_authenticated": True,
+                            "jwt_payload": jwt_payload
+                        }
+                finally:
+                    await db.close()
+                    
+            except Exception as e:
+                logger.error(f"Error validating JWT token: {e}")
 
 
 # Export dependencies and classes
@@ -266,6 +303,8 @@ __all__ = [
     'get_current_user',
     'require_authentication',
     'get_optional_user',
+    'cleanup_expired_sessions_once',
+    'run_session_cleanup',
     'AuthMiddleware',
     'JWTValidationMiddleware'
 ]
\ No newline at end of file
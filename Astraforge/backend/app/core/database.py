@@ -1,13 +1,36 @@
 """
 Database connection and session management for AstraForge.
 """
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import NullPool
 
 from .config import settings
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_engine_options() -> Dict[str, Any]:
+    """Use orjson for JSON column (de)serialization when it is installed."""
+    if not ORJSON_AVAILABLE:
+        return {}
+    return {
+        "json_serializer": lambda obj: orjson.dumps(obj).decode(),
+        "json_deserializer": orjson.loads,
+    }
+
+
+def _connect_args() -> Dict[str, Any]:
+    """Size asyncpg's prepared statement cache so hot queries skip server-side parsing."""
+    if not settings.DATABASE_URL.startswith("postgresql+asyncpg"):
+        return {}
+    return {"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE}
+
 
 # Create async engine
 engine = create_async_engine(
@@ -15,6 +38,8 @@ engine = create_async_engine(
     echo=settings.DEBUG,
     poolclass=NullPool if settings.ENVIRONMENT == "test" else None,
     pool_pre_ping=True,
+    connect_args=_connect_args(),
+    **_json_engine_options(),
 )
 
 # Create async session factory
@@ -1,22 +1,51 @@
 """
 AstraForge FastAPI Application
 """
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core.auth import run_session_cleanup
 from app.core.config import settings
+from app.services.gallery_service import run_gallery_stats_refresh
 # from app.core.auth import AuthMiddleware, JWTValidationMiddleware
 # from app.api.vehicle_presets import router as vehicle_presets_router
 # from app.api.missions import router as missions_router
 # from app.api.auth import router as auth_router
 # from app.api.gallery import router as gallery_router
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run background maintenance tasks for the lifetime of the app."""
+    tasks = []
+    if settings.SESSION_CLEANUP_INTERVAL_SECONDS > 0:
+        tasks.append(asyncio.create_task(
+            run_session_cleanup(settings.SESSION_CLEANUP_INTERVAL_SECONDS)
+        ))
+    if settings.GALLERY_STATS_REFRESH_INTERVAL_SECONDS > 0:
+        tasks.append(asyncio.create_task(
+            run_gallery_stats_refresh(settings.GALLERY_STATS_REFRESH_INTERVAL_SECONDS)
+        ))
+    
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+
 app = FastAPI(
     title="AstraForge API",
     description="Space Mission Simulator API",
     version="0.1.0",
     docs_url="/docs" if settings.ENVIRONMENT != "production" else None,
     redoc_url="/redoc" if settings.ENVIRONMENT != "production" else None,
+    lifespan=lifespan,
 )
 
 # Configure CORS - Allow all origins for development
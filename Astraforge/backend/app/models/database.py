@@ -6,8 +6,8 @@ from typing import Optional
 from uuid import uuid4
 
 from sqlalchemy import (
-    Boolean, Column, DateTime, Float, Integer, String, Text, JSON,
-    ForeignKey, Index
+    BigInteger, Boolean, Column, DateTime, Float, Integer, String, Text, JSON,
+    ForeignKey, Index, text
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import declarative_base
@@ -50,6 +50,20 @@ class Mission(Base):
         Index('idx_missions_created_at', 'created_at'),
         Index('idx_missions_is_public', 'is_public'),
         Index('idx_missions_difficulty', 'difficulty_rating'),
+        # Ordered public listings (featured, popular) and the search filters
+        Index(
+            'idx_missions_public_difficulty_created', text('difficulty_rating DESC'), text('created_at DESC'),
+            postgresql_where=text('is_public')
+        ),
+        Index('idx_missions_public_created', text('created_at DESC'), postgresql_where=text('is_public')),
+        Index(
+            'idx_missions_public_target_body_difficulty', text("(trajectory->>'target_body')"),
+            'difficulty_rating', postgresql_where=text('is_public')
+        ),
+        Index(
+            'idx_missions_public_vehicle_type', text("(spacecraft_config->>'vehicle_type')"),
+            postgresql_where=text('is_public')
+        ),
     )
 
 
@@ -183,6 +197,7 @@ class UserSession(Base):
     
     # Session information
     session_token = Column(String(255), nullable=False, unique=True)
+    token_hash = Column(BigInteger, nullable=True)  # Leading 64 bits of sha256(session_token)
     user_id = Column(String(100), nullable=True)  # Null for anonymous sessions
     email = Column(String(255), nullable=True)
     
@@ -197,10 +212,15 @@ class UserSession(Base):
     
     # Indexes
     __table_args__ = (
-        Index('idx_user_sessions_token', 'session_token'),
         Index('idx_user_sessions_user_id', 'user_id'),
         Index('idx_user_sessions_expires_at', 'expires_at'),
         Index('idx_user_sessions_active', 'is_active'),
+        # Partial indexes covering only live sessions for hot auth lookups
+        Index('idx_user_sessions_token_hash_active', 'token_hash', postgresql_where=text('is_active')),
+        Index(
+            'idx_user_sessions_user_active_recent', 'user_id', 'last_accessed',
+            postgresql_include=['expires_at'], postgresql_where=text('is_active')
+        ),
     )
 
 
@@ -7,6 +7,7 @@ including multi-objective optimization with Pareto front calculation.
 
 from .genetic_algorithm import (
     GeneticAlgorithm,
+    GeneVector,
     Individual,
     Population,
     SelectionMethod,
@@ -30,6 +31,7 @@ from .multi_objective import (
 
 __all__ = [
     'GeneticAlgorithm',
+    'GeneVector',
     'Individual',
     'Population',
     'SelectionMethod',
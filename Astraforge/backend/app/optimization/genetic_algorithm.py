@@ -7,9 +7,13 @@ and evolution operators.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Callable, Tuple, Union
+from collections.abc import MutableMapping
+from concurrent.futures import Executor
+from functools import partial
+from typing import List, Dict, Any, Optional, Callable, Tuple, Union, Iterator, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
+import os
 import random
 import numpy as np
 from uuid import uuid4, UUID
@@ -39,16 +43,99 @@ class MutationMethod(str, Enum):
     ADAPTIVE = "adaptive"
 
 
-@dataclass
+class GeneVector(MutableMapping):
+    """
+    Gene storage backed by a fixed-order float64 array.
+    
+    Behaves like a ``Dict[str, float]`` so callers can keep using
+    ``individual.genes[name]``, while operators work on ``vec`` as a single
+    vector. Individuals created from the same layout share the ``names``
+    tuple and the name -> position index.
+    """
+    __slots__ = ('names', 'vec', '_index')
+    
+    def __init__(
+        self,
+        names: Sequence[str],
+        vec: Optional[Sequence[float]] = None,
+        index: Optional[Dict[str, int]] = None
+    ):
+        """
+        Initialize gene vector.
+        
+        Args:
+            names: Gene names in storage order
+            vec: Gene values aligned with names (zeros if omitted)
+            index: Precomputed name -> position mapping to share between vectors
+        """
+        self.names = tuple(names)
+        if vec is None:
+            self.vec = np.zeros(len(self.names))
+        else:
+            self.vec = np.asarray(vec, dtype=np.float64)
+        if self.vec.shape != (len(self.names),):
+            raise ValueError("Gene names and values must have same length")
+        self._index = index if index is not None else {
+            name: i for i, name in enumerate(self.names)
+        }
+    
+    @classmethod
+    def from_dict(cls, genes: Dict[str, float]) -> 'GeneVector':
+        """Build a gene vector from a name -> value mapping."""
+        return cls(list(genes.keys()), np.fromiter(genes.values(), dtype=np.float64, count=len(genes)))
+    
+    def __getitem__(self, name: str) -> float:
+        return float(self.vec[self._index[name]])
+    
+    def __setitem__(self, name: str, value: float):
+        position = self._index.get(name)
+        if position is not None:
+            self.vec[position] = value
+            return
+        
+        # New gene: extend the layout without touching the shared index
+        self.names = self.names + (name,)
+        self.vec = np.append(self.vec, float(value))
+        self._index = {**self._index, name: len(self.names) - 1}
+    
+    def __delitem__(self, name: str):
+        position = self._index[name]
+        self.names = self.names[:position] + self.names[position + 1:]
+        self.vec = np.delete(self.vec, position)
+        self._index = {n: i for i, n in enumerate(self.names)}
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def __repr__(self) -> str:
+        return f"GeneVector({dict(zip(self.names, self.vec.tolist(), strict=True))!r})"
+    
+    def copy(self) -> 'GeneVector':
+        """Copy values while sharing the (immutable) layout."""
+        return GeneVector(self.names, self.vec.copy(), self._index)
+    
+    def with_values(self, vec: np.ndarray) -> 'GeneVector':
+        """Wrap an existing value array (no copy) in this layout."""
+        return GeneVector(self.names, vec, self._index)
+
+
+@dataclass(slots=True)
 class Individual:
     """
     Represents an individual solution in the genetic algorithm.
     
     Each individual contains genes (parameters), fitness values,
-    and metadata for tracking evolution progress.
+    and metadata for tracking evolution progress. Genes may be passed as a
+    plain dict; they are stored as a ``GeneVector``.
     """
     id: UUID = field(default_factory=uuid4)
-    genes: Dict[str, float] = field(default_factory=dict)
+    genes: Union[Dict[str, float], GeneVector] = field(default_factory=dict)
     fitness: Optional[float] = None
     objectives: Dict[str, float] = field(default_factory=dict)
     constraints_violated: List[str] = field(default_factory=list)
@@ -57,6 +144,8 @@ class Individual:
     
     def __post_init__(self):
         """Validate individual after initialization."""
+        if not isinstance(self.genes, GeneVector):
+            self.genes = GeneVector.from_dict(self.genes)
         if not self.genes:
             raise ValueError("Individual must have at least one gene")
     
@@ -70,20 +159,46 @@ class Individual:
         """Check if individual has been evaluated."""
         return self.fitness is not None
     
+    @property
+    def gene_names(self) -> Tuple[str, ...]:
+        """Gene names in storage order."""
+        return self.genes.names
+    
+    @property
+    def gene_vec(self) -> np.ndarray:
+        """Gene values as a float64 array aligned with ``gene_names``."""
+        return self.genes.vec
+    
+    @gene_vec.setter
+    def gene_vec(self, values: np.ndarray):
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape != self.genes.vec.shape:
+            raise ValueError("Gene names and values must have same length")
+        self.genes.vec = values
+    
+    def _reset_eval_state(self):
+        """Drop fitness, objectives and constraint results (needs re-evaluation)."""
+        self.fitness = None
+        self.objectives = {}
+        self.constraints_violated = []
+    
     def copy(self) -> 'Individual':
         """Create a deep copy of the individual."""
-        return Individual(
-            id=uuid4(),
-            genes=self.genes.copy(),
-            fitness=self.fitness,
-            objectives=self.objectives.copy(),
-            constraints_violated=self.constraints_violated.copy(),
-            generation=self.generation,
-            parent_ids=[self.id]
-        )
+        # Assign slots directly: the genes are already validated
+        clone = object.__new__(Individual)
+        clone.id = uuid4()
+        clone.genes = self.genes.copy()
+        clone.fitness = self.fitness
+        clone.objectives = self.objectives.copy()
+        clone.constraints_violated = self.constraints_violated.copy()
+        clone.generation = self.generation
+        clone.parent_ids = [self.id]
+        return clone
     
     def get_gene_vector(self, gene_names: List[str]) -> np.ndarray:
         """Get genes as numpy array in specified order."""
+        if tuple(gene_names) == self.genes.names:
+            return self.genes.vec.copy()
         return np.array([self.genes[name] for name in gene_names])
     
     def set_gene_vector(self, gene_names: List[str], values: np.ndarray):
@@ -91,6 +206,10 @@ class Individual:
         if len(gene_names) != len(values):
             raise ValueError("Gene names and values must have same length")
         
+        if tuple(gene_names) == self.genes.names:
+            self.gene_vec = np.array(values, dtype=np.float64)
+            return
+        
         for name, value in zip(gene_names, values):
             self.genes[name] = float(value)
 
@@ -185,6 +304,59 @@ class Population:
         self.individuals = evaluated + unevaluated
 
 
+def create_offspring_pair(
+    parent1: Individual,
+    parent2: Individual,
+    gene1: np.ndarray,
+    gene2: np.ndarray
+) -> Tuple[Individual, Individual]:
+    """Build two unevaluated offspring around freshly computed gene arrays."""
+    parent_ids = [parent1.id, parent2.id]
+    return (
+        Individual(
+            genes=parent1.genes.with_values(gene1),
+            generation=parent1.generation,
+            parent_ids=parent_ids
+        ),
+        Individual(
+            genes=parent2.genes.with_values(gene2),
+            generation=parent2.generation,
+            parent_ids=list(parent_ids)
+        )
+    )
+
+
+def evaluate_individual(
+    fitness_function: Callable[[Individual], float],
+    constraint_functions: List[Callable[[Individual], bool]],
+    individual: Individual
+) -> Tuple[float, List[str], Dict[str, float]]:
+    """
+    Evaluate constraints and fitness for an individual.
+    
+    Results are returned rather than stored on the individual, and the
+    function is kept at module level, so it can run in worker processes.
+    
+    Returns:
+        Tuple of (fitness, names of violated constraints, objective values)
+    """
+    # Check constraints
+    constraints_violated = []
+    for constraint_func in constraint_functions:
+        if not constraint_func(individual):
+            constraints_violated.append(constraint_func.__name__)
+    
+    # Calculate fitness
+    try:
+        fitness = fitness_function(individual)
+    except Exception as e:
+        # Handle evaluation errors by assigning poor fitness
+        fitness = float('-inf')
+        constraints_violated.append(f"evaluation_error: {str(e)}")
+    
+    return fitness, constraints_violated, individual.objectives
+
+
 class GeneticOperator(ABC):
     """Abstract base class for genetic operators."""
     
@@ -268,7 +440,8 @@ class GeneticAlgorithm:
         constraint_functions: Optional[List[Callable[[Individual], bool]]] = None,
         selection_operator: Optional[SelectionOperator] = None,
         crossover_operator: Optional[CrossoverOperator] = None,
-        mutation_operator: Optional[MutationOperator] = None
+        mutation_operator: Optional[MutationOperator] = None,
+        evaluation_executor: Optional[Executor] = None
     ):
         """
         Initialize genetic algorithm.
@@ -281,16 +454,24 @@ class GeneticAlgorithm:
             selection_operator: Custom selection operator (optional)
             crossover_operator: Custom crossover operator (optional)
             mutation_operator: Custom mutation operator (optional)
+            evaluation_executor: Executor used to evaluate individuals in
+                parallel (optional). Fitness and constraint functions must be
+                picklable for process pools. The caller owns its lifecycle.
         """
         self.config = config
         self.fitness_function = fitness_function
         self.gene_bounds = gene_bounds
         self.constraint_functions = constraint_functions or []
         
+        # Shared gene layout for all individuals created by this GA
+        self.gene_names: Tuple[str, ...] = tuple(gene_bounds.keys())
+        self._gene_index = {name: i for i, name in enumerate(self.gene_names)}
+        
         # Initialize operators (will be set in operators.py)
         self.selection_operator = selection_operator
         self.crossover_operator = crossover_operator
         self.mutation_operator = mutation_operator
+        self.evaluation_executor = evaluation_executor
         
         # Evolution tracking
         self.current_generation = 0
@@ -322,33 +503,44 @@ class GeneticAlgorithm:
     
     def _create_random_individual(self) -> Individual:
         """Create a random individual within gene bounds."""
-        genes = {}
-        for gene_name, (min_val, max_val) in self.gene_bounds.items():
-            genes[gene_name] = random.uniform(min_val, max_val)
+        values = [
+            random.uniform(min_val, max_val)
+            for min_val, max_val in self.gene_bounds.values()
+        ]
         
-        return Individual(genes=genes)
+        return Individual(genes=GeneVector(self.gene_names, values, self._gene_index))
     
     def evaluate_population(self, population: Population):
         """Evaluate fitness for all individuals in population."""
-        for individual in population:
-            if not individual.is_evaluated:
+        pending = [individual for individual in population if not individual.is_evaluated]
+        if self.evaluation_executor is None or len(pending) < 2:
+            for individual in pending:
                 self._evaluate_individual(individual)
+            return
+        
+        evaluate = partial(evaluate_individual, self.fitness_function, self.constraint_functions)
+        self._apply_evaluations(pending, evaluate)
+    
+    def _apply_evaluations(
+        self,
+        pending: List[Individual],
+        evaluate: Callable[[Individual], Tuple[float, List[str], Dict[str, float]]]
+    ):
+        """Evaluate individuals on the executor and store the results."""
+        chunksize = max(1, len(pending) // (4 * (os.cpu_count() or 1)))
+        results = self.evaluation_executor.map(evaluate, pending, chunksize=chunksize)
+        for individual, (fitness, constraints_violated, objectives) in zip(pending, results, strict=True):
+            individual.fitness = fitness
+            individual.constraints_violated = constraints_violated
+            individual.objectives = objectives
     
     def _evaluate_individual(self, individual: Individual):
         """Evaluate a single individual."""
-        # Check constraints
-        individual.constraints_violated = []
-        for constraint_func in self.constraint_functions:
-            if not constraint_func(individual):
-                individual.constraints_violated.append(constraint_func.__name__)
-        
-        # Calculate fitness
-        try:
-            individual.fitness = self.fitness_function(individual)
-        except Exception as e:
-            # Handle evaluation errors by assigning poor fitness
-            individual.fitness = float('-inf')
-            individual.constraints_violated.append(f"evaluation_error: {str(e)}")
+        (
+            individual.fitness,
+            individual.constraints_violated,
+            individual.objectives
+        ) = evaluate_individual(self.fitness_function, self.constraint_functions, individual)
     
     def evolve_generation(self) -> Population:
         """Evolve population for one generation."""
@@ -357,6 +549,7 @@ class GeneticAlgorithm:
         
         # Evaluate current population
         self.evaluate_population(self.population)
+        self._record_operator_feedback(self.population)
         
         # Track statistics
         self._update_statistics()
@@ -377,27 +570,9 @@ class GeneticAlgorithm:
                 new_population.add_individual(elite)
         
         # Generate offspring
-        while len(new_population) < self.config.population_size:
-            # Selection
-            parents = self.selection_operator.select(self.population, 2)
-            if len(parents) < 2:
-                break
-            
-            # Crossover
-            if random.random() < self.config.crossover_rate:
-                offspring1, offspring2 = self.crossover_operator.crossover(parents[0], parents[1])
-            else:
-                offspring1, offspring2 = parents[0].copy(), parents[1].copy()
-            
-            # Mutation
-            offspring1 = self.mutation_operator.mutate(offspring1, self.config.mutation_rate)
-            offspring2 = self.mutation_operator.mutate(offspring2, self.config.mutation_rate)
-            
-            # Add to new population
-            if len(new_population) < self.config.population_size:
-                new_population.add_individual(offspring1)
-            if len(new_population) < self.config.population_size:
-                new_population.add_individual(offspring2)
+        offspring = self._breed(self.population, self.config.population_size - len(new_population))
+        for child in offspring:
+            new_population.add_individual(child)
         
         # Update population and generation
         self.population = new_population
@@ -406,6 +581,77 @@ class GeneticAlgorithm:
         
         return self.population
     
+    def _breed(self, parent_population: Population, num_offspring: int) -> List[Individual]:
+        """Create mutated offspring using selection and crossover."""
+        # Selection and crossover decisions for the whole generation
+        pairs: List[Tuple[Individual, Individual, bool]] = []
+        while 2 * len(pairs) < num_offspring:
+            parents = self.selection_operator.select(parent_population, 2)
+            if len(parents) < 2:
+                break
+            pairs.append((parents[0], parents[1], random.random() < self.config.crossover_rate))
+        
+        offspring = self._crossover_pairs(pairs)
+        del offspring[num_offspring:]
+        return self._mutate_offspring(offspring)
+    
+    def _crossover_pairs(self, pairs: List[Tuple[Individual, Individual, bool]]) -> List[Individual]:
+        """Apply crossover to selected pairs, in one batch when the operator supports it."""
+        crossover_batch = getattr(self.crossover_operator, 'crossover_batch', None)
+        crossed = [(parent1, parent2) for parent1, parent2, do_crossover in pairs if do_crossover]
+        
+        batch_results = None
+        if crossover_batch is not None and crossed:
+            gene_names = crossed[0][0].gene_names
+            if all(p1.gene_names == gene_names and p2.gene_names == gene_names for p1, p2 in crossed):
+                offspring1, offspring2 = crossover_batch(
+                    np.stack([parent1.gene_vec for parent1, _ in crossed]),
+                    np.stack([parent2.gene_vec for _, parent2 in crossed])
+                )
+                batch_results = iter(zip(offspring1, offspring2, strict=True))
+        
+        offspring: List[Individual] = []
+        for parent1, parent2, do_crossover in pairs:
+            if not do_crossover:
+                offspring.extend((parent1.copy(), parent2.copy()))
+            elif batch_results is not None:
+                gene1, gene2 = next(batch_results)
+                offspring.extend(create_offspring_pair(parent1, parent2, gene1, gene2))
+            else:
+                offspring.extend(self.crossover_operator.crossover(parent1, parent2))
+        
+        return offspring
+    
+    def _mutate_offspring(self, offspring: List[Individual]) -> List[Individual]:
+        """Mutate offspring, in one batch when the operator supports it."""
+        if not offspring:
+            return offspring
+        
+        mutate_batch = getattr(self.mutation_operator, 'mutate_batch', None)
+        gene_names = offspring[0].gene_names
+        if mutate_batch is None or any(ind.gene_names != gene_names for ind in offspring):
+            return [
+                self.mutation_operator.mutate(ind, self.config.mutation_rate)
+                for ind in offspring
+            ]
+        
+        pop_matrix = np.stack([ind.gene_vec for ind in offspring])
+        mutated = mutate_batch(pop_matrix, self.config.mutation_rate, gene_names)
+        for individual, genes in zip(offspring, mutated, strict=True):
+            individual.gene_vec = genes
+            
+            # Reset fitness (needs re-evaluation)
+            individual._reset_eval_state()
+        
+        return offspring
+    
+    def _record_operator_feedback(self, population: Population):
+        """Let adaptive operators learn from an evaluated population."""
+        for operator in (self.crossover_operator, self.mutation_operator):
+            record_generation = getattr(operator, 'record_generation', None)
+            if record_generation is not None:
+                record_generation(population)
+    
     def _update_statistics(self):
         """Update evolution statistics."""
         stats = self.population.get_fitness_statistics()
@@ -8,7 +8,7 @@ Pareto dominance, non-dominated sorting, and Pareto front management.
 from typing import List, Dict, Any, Callable, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-import random
+from functools import partial
 import numpy as np
 from .genetic_algorithm import Individual, Population, GeneticAlgorithm, GAConfig
 
@@ -328,6 +328,44 @@ class CrowdingDistance:
         return distances
 
 
+def evaluate_objectives(
+    objectives: List[ObjectiveFunction],
+    constraint_functions: List[Callable[[Individual], bool]],
+    individual: Individual
+) -> Tuple[float, List[str], Dict[str, float]]:
+    """
+    Evaluate constraints and the combined objective fitness for an individual.
+    
+    Counterpart of ``evaluate_individual`` for multi-objective runs; safe to
+    run in worker processes.
+    
+    Returns:
+        Tuple of (fitness, names of violated constraints, objective values)
+    """
+    # Check constraints first
+    constraints_violated = []
+    for constraint_func in constraint_functions:
+        if not constraint_func(individual):
+            constraints_violated.append(constraint_func.__name__)
+    
+    # Evaluate all objectives
+    individual.objectives.clear()
+    total_fitness = 0.0
+    for obj in objectives:
+        try:
+            value = obj.evaluate(individual)
+            # Contribute to combined fitness
+            if obj.objective_type == ObjectiveType.MAXIMIZE:
+                total_fitness += obj.weight * value
+            else:
+                total_fitness -= obj.weight * value
+        except Exception as e:
+            constraints_violated.append(f"objective_error_{obj.name}: {str(e)}")
+            return float('-inf'), constraints_violated, individual.objectives
+    
+    return total_fitness, constraints_violated, individual.objectives
+
+
 class MultiObjectiveGA(GeneticAlgorithm):
     """Multi-objective genetic algorithm implementation."""
     
@@ -384,41 +422,28 @@ class MultiObjectiveGA(GeneticAlgorithm):
     
     def evaluate_population(self, population: Population):
         """Evaluate population with multi-objective functions."""
-        for individual in population:
-            if not individual.is_evaluated:
+        pending = [individual for individual in population if not individual.is_evaluated]
+        if self.evaluation_executor is None or len(pending) < 2:
+            for individual in pending:
                 self._evaluate_individual_multi_objective(individual)
+            return
+        
+        evaluate = partial(evaluate_objectives, self.objectives, self.constraint_functions)
+        self._apply_evaluations(pending, evaluate)
     
     def _evaluate_individual_multi_objective(self, individual: Individual):
         """Evaluate individual with all objective functions."""
-        # Check constraints first
-        individual.constraints_violated = []
-        for constraint_func in self.constraint_functions:
-            if not constraint_func(individual):
-                individual.constraints_violated.append(constraint_func.__name__)
-        
-        # Evaluate all objectives
-        individual.objectives.clear()
-        total_fitness = 0.0
-        
-        for obj in self.objectives:
-            try:
-                value = obj.evaluate(individual)
-                # Contribute to combined fitness
-                if obj.objective_type == ObjectiveType.MAXIMIZE:
-                    total_fitness += obj.weight * value
-                else:
-                    total_fitness -= obj.weight * value
-            except Exception as e:
-                individual.fitness = float('-inf')
-                individual.constraints_violated.append(f"objective_error_{obj.name}: {str(e)}")
-                return
-        
-        individual.fitness = total_fitness
+        (
+            individual.fitness,
+            individual.constraints_violated,
+            individual.objectives
+        ) = evaluate_objectives(self.objectives, self.constraint_functions, individual)
     
     def evolve_generation(self) -> Population:
         """Evolve population using NSGA-II-like approach."""
         # Evaluate population
         self.evaluate_population(self.population)
+        self._record_operator_feedback(self.population)
         
         # Perform non-dominated sorting
         self.pareto_fronts = NonDominatedSorting.sort(self.population, self.objectives)
@@ -448,6 +473,7 @@ class MultiObjectiveGA(GeneticAlgorithm):
         
         # Evaluate combined population
         self.evaluate_population(combined_population)
+        self._record_operator_feedback(combined_population)
         
         # Select next generation
         self.population = self._nsga2_environmental_selection(combined_population)
@@ -490,27 +516,8 @@ class MultiObjectiveGA(GeneticAlgorithm):
         
         offspring_population = Population(max_size=self.config.population_size)
         
-        while len(offspring_population) < self.config.population_size:
-            # Selection
-            parents = self.selection_operator.select(parent_population, 2)
-            if len(parents) < 2:
-                break
-            
-            # Crossover
-            if random.random() < self.config.crossover_rate:
-                offspring1, offspring2 = self.crossover_operator.crossover(parents[0], parents[1])
-            else:
-                offspring1, offspring2 = parents[0].copy(), parents[1].copy()
-            
-            # Mutation
-            offspring1 = self.mutation_operator.mutate(offspring1, self.config.mutation_rate)
-            offspring2 = self.mutation_operator.mutate(offspring2, self.config.mutation_rate)
-            
-            # Add to offspring population
-            if len(offspring_population) < self.config.population_size:
-                offspring_population.add_individual(offspring1)
-            if len(offspring_population) < self.config.population_size:
-                offspring_population.add_individual(offspring2)
+        for child in self._breed(parent_population, self.config.population_size):
+            offspring_population.add_individual(child)
         
         return offspring_population
     
@@ -5,28 +5,101 @@ This module implements various genetic operators that can be used
 with the genetic algorithm framework.
 """
 
+import math
 import random
+from abc import abstractmethod
+from collections import deque
+from functools import lru_cache
+from itertools import islice
 import numpy as np
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
 from .genetic_algorithm import (
-    Individual, Population, SelectionOperator, 
-    CrossoverOperator, MutationOperator
+    Individual, Population, GeneticOperator, SelectionOperator, 
+    CrossoverOperator, MutationOperator, create_offspring_pair
 )
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _polynomial_mutation_numpy(
+    pop_matrix: np.ndarray,
+    mask: np.ndarray,
+    u: np.ndarray,
+    base_vec: np.ndarray,
+    span_vec: np.ndarray,
+    inv_eta: float
+) -> np.ndarray:
+    """Vectorized polynomial mutation; returns a new matrix."""
+    # Normalize gene values
+    normalized = (pop_matrix - base_vec) / span_vec
+    
+    # Calculate delta: both branches share |delta| = 1 - base ** (1 / (eta + 1))
+    lower_half = u <= 0.5
+    base = np.where(lower_half, 2 * u, 2 * (1 - u))
+    delta = np.where(lower_half, -1.0, 1.0) * (1 - base ** inv_eta)
+    
+    # Apply mutation, clamp to [0, 1] and denormalize
+    new_normalized = np.clip(normalized + delta, 0.0, 1.0)
+    return np.where(mask, base_vec + new_normalized * span_vec, pop_matrix)
+
+
+def _polynomial_mutation_kernel(
+    pop_matrix: np.ndarray,
+    mask: np.ndarray,
+    u: np.ndarray,
+    base_vec: np.ndarray,
+    span_vec: np.ndarray,
+    inv_eta: float
+):
+    """Fused single-pass polynomial mutation; updates pop_matrix in place."""
+    rows, cols = pop_matrix.shape
+    for i in range(rows):
+        for j in range(cols):
+            if not mask[i, j]:
+                continue
+            normalized = (pop_matrix[i, j] - base_vec[j]) / span_vec[j]
+            if u[i, j] <= 0.5:
+                delta = (2.0 * u[i, j]) ** inv_eta - 1.0
+            else:
+                delta = 1.0 - (2.0 * (1.0 - u[i, j])) ** inv_eta
+            normalized = min(1.0, max(0.0, normalized + delta))
+            pop_matrix[i, j] = base_vec[j] + normalized * span_vec[j]
+
+
+if NUMBA_AVAILABLE:
+    _polynomial_mutation_kernel = njit(cache=True, fastmath=True)(_polynomial_mutation_kernel)
+
+
+@lru_cache(maxsize=64)
+def _common_genes(names1: Tuple[str, ...], names2: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Genes present in both layouts, in the order of the first."""
+    shared = set(names2)
+    return tuple(name for name in names1 if name in shared)
+
 
 class TournamentSelection(SelectionOperator):
     """Tournament selection operator."""
     
-    def __init__(self, tournament_size: int = 3):
+    # Largest tournament drawn by rejection sampling instead of random.sample
+    SMALL_TOURNAMENT_SIZE = 4
+    
+    def __init__(self, tournament_size: int = 3, seed: Optional[int] = None):
         """
         Initialize tournament selection.
         
         Args:
             tournament_size: Number of individuals in each tournament
+            seed: Seed for the operator's random number generator (optional)
         """
         if tournament_size <= 0:
             raise ValueError("Tournament size must be positive")
         self.tournament_size = tournament_size
+        self._rng = random.Random(seed)
     
     def apply(self, *args, **kwargs):
         """Apply tournament selection (delegates to select method)."""
@@ -43,29 +116,48 @@ class TournamentSelection(SelectionOperator):
             return []
         
         parents = []
+        tournament_size = min(self.tournament_size, len(evaluated_individuals))
         for _ in range(num_parents):
             # Select tournament participants
-            tournament_size = min(self.tournament_size, len(evaluated_individuals))
-            tournament = random.sample(evaluated_individuals, tournament_size)
+            tournament = self._sample_tournament(evaluated_individuals, tournament_size)
             
             # Select winner (highest fitness)
             winner = max(tournament, key=lambda x: x.fitness if x.fitness is not None else float('-inf'))
             parents.append(winner)
         
         return parents
+    
+    def _sample_tournament(self, candidates: List[Individual], tournament_size: int) -> List[Individual]:
+        """Draw distinct tournament participants."""
+        if tournament_size > self.SMALL_TOURNAMENT_SIZE:
+            return self._rng.sample(candidates, tournament_size)
+        
+        # Small tournaments: a few randrange draws with duplicate rejection
+        # are cheaper than random.sample's pool/set bookkeeping
+        randrange = self._rng.randrange
+        num_candidates = len(candidates)
+        indices: List[int] = []
+        while len(indices) < tournament_size:
+            index = randrange(num_candidates)
+            if index not in indices:
+                indices.append(index)
+        
+        return [candidates[index] for index in indices]
 
 
 class RouletteWheelSelection(SelectionOperator):
     """Roulette wheel (fitness proportionate) selection operator."""
     
-    def __init__(self, scaling_factor: float = 1.0):
+    def __init__(self, scaling_factor: float = 1.0, seed: Optional[int] = None):
         """
         Initialize roulette wheel selection.
         
         Args:
             scaling_factor: Factor to scale fitness values for selection pressure
+            seed: Seed for the operator's random number generator (optional)
         """
         self.scaling_factor = scaling_factor
+        self._rng = random.Random(seed)
     
     def apply(self, *args, **kwargs):
         """Apply roulette wheel selection (delegates to select method)."""
@@ -87,13 +179,16 @@ class RouletteWheelSelection(SelectionOperator):
         else:
             adjusted_fitness = [f + 1e-6 for f in fitness_values]  # Add small value to avoid zero
         
-        # Apply scaling
-        scaled_fitness = [f ** self.scaling_factor for f in adjusted_fitness]
+        # Apply scaling (skipped for the default factor, where it is a no-op)
+        if self.scaling_factor == 1.0:
+            scaled_fitness = adjusted_fitness
+        else:
+            scaled_fitness = [f ** self.scaling_factor for f in adjusted_fitness]
         total_fitness = sum(scaled_fitness)
         
         if total_fitness == 0:
             # Fallback to random selection
-            return random.sample(evaluated_individuals, min(num_parents, len(evaluated_individuals)))
+            return self._rng.sample(evaluated_individuals, min(num_parents, len(evaluated_individuals)))
         
         # Calculate selection probabilities
         probabilities = [f / total_fitness for f in scaled_fitness]
@@ -101,7 +196,7 @@ class RouletteWheelSelection(SelectionOperator):
         # Select parents
         parents = []
         for _ in range(num_parents):
-            r = random.random()
+            r = self._rng.random()
             cumulative_prob = 0.0
             
             for i, prob in enumerate(probabilities):
@@ -119,16 +214,19 @@ class RouletteWheelSelection(SelectionOperator):
 class UniformCrossover(CrossoverOperator):
     """Uniform crossover operator."""
     
-    def __init__(self, swap_probability: float = 0.5):
+    def __init__(self, swap_probability: float = 0.5, seed: Optional[int] = None):
         """
         Initialize uniform crossover.
         
         Args:
             swap_probability: Probability of swapping each gene
+            seed: Seed for the operator's random number generator (optional)
         """
         if not 0 <= swap_probability <= 1:
             raise ValueError("Swap probability must be between 0 and 1")
         self.swap_probability = swap_probability
+        self._rng = random.Random(seed)
+        self._nprng = np.random.default_rng(seed)
     
     def apply(self, *args, **kwargs):
         """Apply uniform crossover (delegates to crossover method)."""
@@ -136,16 +234,23 @@ class UniformCrossover(CrossoverOperator):
     
     def crossover(self, parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
         """Perform uniform crossover between two parents."""
+        if parent1.gene_names == parent2.gene_names:
+            # Same layout: build both offspring directly from a swap mask
+            gene1, gene2 = self.crossover_batch(
+                parent1.gene_vec[np.newaxis, :], parent2.gene_vec[np.newaxis, :]
+            )
+            return create_offspring_pair(parent1, parent2, gene1[0], gene2[0])
+        
         # Create offspring copies
         offspring1 = parent1.copy()
         offspring2 = parent2.copy()
         
         # Get common genes
-        common_genes = set(parent1.genes.keys()) & set(parent2.genes.keys())
+        common_genes = _common_genes(parent1.gene_names, parent2.gene_names)
         
         # Perform uniform crossover
         for gene_name in common_genes:
-            if random.random() < self.swap_probability:
+            if self._rng.random() < self.swap_probability:
                 # Swap genes
                 offspring1.genes[gene_name] = parent2.genes[gene_name]
                 offspring2.genes[gene_name] = parent1.genes[gene_name]
@@ -155,33 +260,64 @@ class UniformCrossover(CrossoverOperator):
         offspring2.parent_ids = [parent1.id, parent2.id]
         
         # Reset fitness (needs re-evaluation)
-        offspring1.fitness = None
-        offspring2.fitness = None
-        offspring1.objectives.clear()
-        offspring2.objectives.clear()
-        offspring1.constraints_violated.clear()
-        offspring2.constraints_violated.clear()
+        offspring1._reset_eval_state()
+        offspring2._reset_eval_state()
         
         return offspring1, offspring2
+    
+    def crossover_batch(self, parents1: np.ndarray, parents2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Perform uniform crossover for many parent pairs at once.
+        
+        Args:
+            parents1: (pairs, genes) matrix of first parents
+            parents2: (pairs, genes) matrix of second parents
+            
+        Returns:
+            Tuple of offspring matrices
+        """
+        swap = self._nprng.random(parents1.shape) < self.swap_probability
+        return np.where(swap, parents2, parents1), np.where(swap, parents1, parents2)
 
 
 class SinglePointCrossover(CrossoverOperator):
     """Single-point crossover operator."""
     
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize single-point crossover.
+        
+        Args:
+            seed: Seed for the operator's random number generator (optional)
+        """
+        self._rng = random.Random(seed)
+        self._nprng = np.random.default_rng(seed)
+    
     def apply(self, *args, **kwargs):
         """Apply single-point crossover (delegates to crossover method)."""
         return self.crossover(*args, **kwargs)
     
     def crossover(self, parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
         """Perform single-point crossover between two parents."""
+        if parent1.gene_names == parent2.gene_names and len(parent1.gene_names) > 1:
+            # Same layout: splice the gene vectors at the crossover point
+            crossover_point = self._rng.randint(1, len(parent1.gene_names) - 1)
+            gene1 = parent1.gene_vec
+            gene2 = parent2.gene_vec
+            return create_offspring_pair(
+                parent1, parent2,
+                np.concatenate((gene1[:crossover_point], gene2[crossover_point:])),
+                np.concatenate((gene2[:crossover_point], gene1[crossover_point:]))
+            )
+        
         # Get common genes
-        common_genes = list(set(parent1.genes.keys()) & set(parent2.genes.keys()))
+        common_genes = _common_genes(parent1.gene_names, parent2.gene_names)
         if len(common_genes) <= 1:
             # Not enough genes for crossover, return copies
             return parent1.copy(), parent2.copy()
         
         # Select crossover point
-        crossover_point = random.randint(1, len(common_genes) - 1)
+        crossover_point = self._rng.randint(1, len(common_genes) - 1)
         
         # Create offspring
         offspring1 = parent1.copy()
@@ -198,14 +334,21 @@ class SinglePointCrossover(CrossoverOperator):
         offspring2.parent_ids = [parent1.id, parent2.id]
         
         # Reset fitness
-        offspring1.fitness = None
-        offspring2.fitness = None
-        offspring1.objectives.clear()
-        offspring2.objectives.clear()
-        offspring1.constraints_violated.clear()
-        offspring2.constraints_violated.clear()
+        offspring1._reset_eval_state()
+        offspring2._reset_eval_state()
         
         return offspring1, offspring2
+    
+    def crossover_batch(self, parents1: np.ndarray, parents2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Perform single-point crossover for many parent pairs at once."""
+        num_pairs, num_genes = parents1.shape
+        if num_genes <= 1:
+            return parents1.copy(), parents2.copy()
+        
+        # One crossover point per pair; genes from the point onward are swapped
+        points = self._nprng.integers(1, num_genes, size=num_pairs)
+        swap = np.arange(num_genes) >= points[:, np.newaxis]
+        return np.where(swap, parents2, parents1), np.where(swap, parents1, parents2)
 
 
 class ArithmeticCrossover(CrossoverOperator):
@@ -228,12 +371,19 @@ class ArithmeticCrossover(CrossoverOperator):
     
     def crossover(self, parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
         """Perform arithmetic crossover between two parents."""
+        if parent1.gene_names == parent2.gene_names:
+            # Same layout: blend straight into fresh offspring buffers
+            gene1 = np.empty_like(parent1.gene_vec)
+            gene2 = np.empty_like(parent2.gene_vec)
+            self.crossover_into(parent1.gene_vec, parent2.gene_vec, gene1, gene2)
+            return create_offspring_pair(parent1, parent2, gene1, gene2)
+        
         # Create offspring
         offspring1 = parent1.copy()
         offspring2 = parent2.copy()
         
         # Get common genes
-        common_genes = set(parent1.genes.keys()) & set(parent2.genes.keys())
+        common_genes = _common_genes(parent1.gene_names, parent2.gene_names)
         
         # Perform arithmetic crossover
         for gene_name in common_genes:
@@ -249,173 +399,258 @@ class ArithmeticCrossover(CrossoverOperator):
         offspring2.parent_ids = [parent1.id, parent2.id]
         
         # Reset fitness
-        offspring1.fitness = None
-        offspring2.fitness = None
-        offspring1.objectives.clear()
-        offspring2.objectives.clear()
-        offspring1.constraints_violated.clear()
-        offspring2.constraints_violated.clear()
+        offspring1._reset_eval_state()
+        offspring2._reset_eval_state()
         
         return offspring1, offspring2
+    
+    def crossover_into(
+        self,
+        gene1: np.ndarray,
+        gene2: np.ndarray,
+        out1: np.ndarray,
+        out2: np.ndarray
+    ):
+        """
+        Blend two parent gene vectors into preallocated offspring buffers.
+        
+        Computes ``out1 = alpha * gene1 + (1 - alpha) * gene2`` and
+        ``out2 = (1 - alpha) * gene1 + alpha * gene2`` without temporaries.
+        """
+        # out1 = gene2 + alpha * (gene1 - gene2)
+        np.subtract(gene1, gene2, out=out1)
+        out1 *= self.alpha
+        out1 += gene2
+        # out2 = gene1 + gene2 - out1
+        np.add(gene1, gene2, out=out2)
+        out2 -= out1
+    
+    def crossover_batch(self, parents1: np.ndarray, parents2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Perform arithmetic crossover for many parent pairs at once."""
+        offspring1 = np.empty_like(parents1, dtype=np.float64)
+        offspring2 = np.empty_like(parents2, dtype=np.float64)
+        self.crossover_into(parents1, parents2, offspring1, offspring2)
+        return offspring1, offspring2
+
+
+class GeneBoundsArrays:
+    """
+    Gene bounds laid out as arrays aligned with a gene layout.
+    
+    Unbounded genes get infinite ``low_vec``/``high_vec`` (so clipping is a
+    no-op), a ``base_vec`` of 0 and a ``span_vec`` of 1.
+    """
+    __slots__ = ('low_vec', 'high_vec', 'base_vec', 'span_vec', 'has_bounds')
+    
+    def __init__(self, gene_bounds: dict, gene_names: Tuple[str, ...]):
+        """
+        Build bounds arrays.
+        
+        Args:
+            gene_bounds: Dictionary of gene bounds
+            gene_names: Gene layout to align the arrays with
+        """
+        self.has_bounds = np.array([name in gene_bounds for name in gene_names], dtype=bool)
+        self.low_vec = np.full(len(gene_names), -np.inf)
+        self.high_vec = np.full(len(gene_names), np.inf)
+        for i, gene_name in enumerate(gene_names):
+            if self.has_bounds[i]:
+                self.low_vec[i], self.high_vec[i] = gene_bounds[gene_name]
+        self.base_vec = np.where(self.has_bounds, self.low_vec, 0.0)
+        self.span_vec = np.where(self.has_bounds, self.high_vec - self.low_vec, 1.0)
 
 
-class GaussianMutation(MutationOperator):
+class BoundedMutationOperator(MutationOperator):
+    """Base class for mutation operators that work on gene bounds arrays."""
+    
+    gene_bounds: dict
+    _bounds_cache: dict
+    
+    def _bounds_for(self, gene_names: Tuple[str, ...]) -> GeneBoundsArrays:
+        """Get bounds arrays for a gene layout, building them on first use."""
+        arrays = self._bounds_cache.get(gene_names)
+        if arrays is None:
+            arrays = GeneBoundsArrays(self.gene_bounds, gene_names)
+            self._bounds_cache[gene_names] = arrays
+        return arrays
+    
+    def mutate(self, individual: Individual, mutation_rate: float) -> Individual:
+        """Mutate an individual via mutate_batch on a single row."""
+        mutated = individual.copy()
+        mutated.gene_vec = self.mutate_batch(
+            mutated.gene_vec[np.newaxis, :], mutation_rate, mutated.gene_names
+        )[0]
+        
+        # Reset fitness (needs re-evaluation)
+        mutated._reset_eval_state()
+        
+        return mutated
+    
+    @abstractmethod
+    def mutate_batch(
+        self,
+        pop_matrix: np.ndarray,
+        mutation_rate: float,
+        gene_names: Tuple[str, ...]
+    ) -> np.ndarray:
+        """
+        Mutate a whole population at once.
+        
+        Args:
+            pop_matrix: (individuals, genes) matrix of gene values
+            mutation_rate: Per-gene mutation probability
+            gene_names: Gene layout shared by all rows
+            
+        Returns:
+            New matrix with mutated gene values
+        """
+        pass
+
+
+class GaussianMutation(BoundedMutationOperator):
     """Gaussian mutation operator."""
     
-    def __init__(self, sigma: float = 0.1, gene_bounds: dict = None):
+    def __init__(self, sigma: float = 0.1, gene_bounds: dict = None, seed: Optional[int] = None):
         """
         Initialize Gaussian mutation.
         
         Args:
             sigma: Standard deviation for Gaussian noise (relative to gene range)
             gene_bounds: Dictionary of gene bounds for constraint enforcement
+            seed: Seed for the operator's random number generator (optional)
         """
         if sigma <= 0:
             raise ValueError("Sigma must be positive")
         self.sigma = sigma
         self.gene_bounds = gene_bounds or {}
+        self._bounds_cache = {}
+        self._nprng = np.random.default_rng(seed)
     
     def apply(self, *args, **kwargs):
         """Apply Gaussian mutation (delegates to mutate method)."""
         return self.mutate(*args, **kwargs)
     
-    def mutate(self, individual: Individual, mutation_rate: float) -> Individual:
-        """Apply Gaussian mutation to individual."""
-        mutated = individual.copy()
-        
-        for gene_name, gene_value in mutated.genes.items():
-            if random.random() < mutation_rate:
-                # Calculate mutation strength based on gene bounds
-                if gene_name in self.gene_bounds:
-                    min_val, max_val = self.gene_bounds[gene_name]
-                    gene_range = max_val - min_val
-                    noise = random.gauss(0, self.sigma * gene_range)
-                else:
-                    # Use absolute sigma if no bounds available
-                    noise = random.gauss(0, self.sigma)
-                
-                # Apply mutation
-                new_value = gene_value + noise
-                
-                # Enforce bounds if available
-                if gene_name in self.gene_bounds:
-                    min_val, max_val = self.gene_bounds[gene_name]
-                    new_value = max(min_val, min(max_val, new_value))
-                
-                mutated.genes[gene_name] = new_value
-        
-        # Reset fitness (needs re-evaluation)
-        mutated.fitness = None
-        mutated.objectives.clear()
-        mutated.constraints_violated.clear()
-        
+    def mutate_batch(
+        self,
+        pop_matrix: np.ndarray,
+        mutation_rate: float,
+        gene_names: Tuple[str, ...]
+    ) -> np.ndarray:
+        """Apply Gaussian mutation to a whole population at once."""
+        bounds = self._bounds_for(gene_names)
+        
+        # Mutation strength is relative to the gene range where bounds exist
+        mask = self._nprng.random(pop_matrix.shape) < mutation_rate
+        mutated = self._nprng.normal(0.0, self.sigma * bounds.span_vec, size=pop_matrix.shape)
+        mutated += pop_matrix
+        
+        # Enforce bounds in one branchless pass; unbounded genes clip to +/-inf
+        np.clip(mutated, bounds.low_vec, bounds.high_vec, out=mutated)
+        np.copyto(mutated, pop_matrix, where=~mask)
         return mutated
 
 
-class UniformMutation(MutationOperator):
+class UniformMutation(BoundedMutationOperator):
     """Uniform mutation operator."""
     
-    def __init__(self, gene_bounds: dict):
+    def __init__(self, gene_bounds: dict, seed: Optional[int] = None):
         """
         Initialize uniform mutation.
         
         Args:
             gene_bounds: Dictionary of gene bounds for mutation range
+            seed: Seed for the operator's random number generator (optional)
         """
         if not gene_bounds:
             raise ValueError("Gene bounds must be provided for uniform mutation")
         self.gene_bounds = gene_bounds
+        self._bounds_cache = {}
+        self._nprng = np.random.default_rng(seed)
     
     def apply(self, *args, **kwargs):
         """Apply uniform mutation (delegates to mutate method)."""
         return self.mutate(*args, **kwargs)
     
-    def mutate(self, individual: Individual, mutation_rate: float) -> Individual:
-        """Apply uniform mutation to individual."""
-        mutated = individual.copy()
-        
-        for gene_name, gene_value in mutated.genes.items():
-            if random.random() < mutation_rate and gene_name in self.gene_bounds:
-                min_val, max_val = self.gene_bounds[gene_name]
-                mutated.genes[gene_name] = random.uniform(min_val, max_val)
-        
-        # Reset fitness (needs re-evaluation)
-        mutated.fitness = None
-        mutated.objectives.clear()
-        mutated.constraints_violated.clear()
-        
-        return mutated
+    def mutate_batch(
+        self,
+        pop_matrix: np.ndarray,
+        mutation_rate: float,
+        gene_names: Tuple[str, ...]
+    ) -> np.ndarray:
+        """Apply uniform mutation to a whole population; unbounded genes are kept."""
+        bounds = self._bounds_for(gene_names)
+        mask = (self._nprng.random(pop_matrix.shape) < mutation_rate) & bounds.has_bounds
+        resampled = bounds.base_vec + self._nprng.random(pop_matrix.shape) * bounds.span_vec
+        return np.where(mask, resampled, pop_matrix)
 
 
-class PolynomialMutation(MutationOperator):
+class PolynomialMutation(BoundedMutationOperator):
     """Polynomial mutation operator (commonly used in NSGA-II)."""
     
-    def __init__(self, eta: float = 20.0, gene_bounds: dict = None):
+    def __init__(self, eta: float = 20.0, gene_bounds: dict = None, seed: Optional[int] = None):
         """
         Initialize polynomial mutation.
         
         Args:
             eta: Distribution index (higher values = lower mutation strength)
             gene_bounds: Dictionary of gene bounds for constraint enforcement
+            seed: Seed for the operator's random number generator (optional)
         """
         if eta <= 0:
             raise ValueError("Eta must be positive")
         self.eta = eta
         self.gene_bounds = gene_bounds or {}
+        self._inv_eta = 1.0 / (eta + 1.0)
+        self._bounds_cache = {}
+        self._nprng = np.random.default_rng(seed)
     
     def apply(self, *args, **kwargs):
         """Apply polynomial mutation (delegates to mutate method)."""
         return self.mutate(*args, **kwargs)
     
-    def mutate(self, individual: Individual, mutation_rate: float) -> Individual:
-        """Apply polynomial mutation to individual."""
-        mutated = individual.copy()
-        
-        for gene_name, gene_value in mutated.genes.items():
-            if random.random() < mutation_rate and gene_name in self.gene_bounds:
-                min_val, max_val = self.gene_bounds[gene_name]
-                
-                # Normalize gene value
-                normalized_value = (gene_value - min_val) / (max_val - min_val)
-                
-                # Generate random number
-                u = random.random()
-                
-                # Calculate delta
-                if u <= 0.5:
-                    delta = (2 * u) ** (1 / (self.eta + 1)) - 1
-                else:
-                    delta = 1 - (2 * (1 - u)) ** (1 / (self.eta + 1))
-                
-                # Apply mutation
-                new_normalized = normalized_value + delta
-                new_normalized = max(0, min(1, new_normalized))  # Clamp to [0, 1]
-                
-                # Denormalize
-                mutated.genes[gene_name] = min_val + new_normalized * (max_val - min_val)
-        
-        # Reset fitness (needs re-evaluation)
-        mutated.fitness = None
-        mutated.objectives.clear()
-        mutated.constraints_violated.clear()
-        
-        return mutated
+    def mutate_batch(
+        self,
+        pop_matrix: np.ndarray,
+        mutation_rate: float,
+        gene_names: Tuple[str, ...]
+    ) -> np.ndarray:
+        """Apply polynomial mutation to a whole population; unbounded genes are kept."""
+        bounds = self._bounds_for(gene_names)
+        mask = (self._nprng.random(pop_matrix.shape) < mutation_rate) & bounds.has_bounds
+        u = self._nprng.random(pop_matrix.shape)
+        
+        # Fused JIT kernel when Numba is installed, NumPy otherwise
+        if NUMBA_AVAILABLE:
+            mutated = np.array(pop_matrix, dtype=np.float64)
+            _polynomial_mutation_kernel(
+                mutated, mask, u, bounds.base_vec, bounds.span_vec, self._inv_eta
+            )
+            return mutated
+        
+        return _polynomial_mutation_numpy(
+            pop_matrix, mask, u, bounds.base_vec, bounds.span_vec, self._inv_eta
+        )
 
 
 class AdaptiveMutation(MutationOperator):
     """Adaptive mutation that adjusts strength based on population diversity."""
     
-    def __init__(self, base_sigma: float = 0.1, gene_bounds: dict = None):
+    # Number of diversity measurements kept for adaptation
+    HISTORY_SIZE = 10
+    
+    def __init__(self, base_sigma: float = 0.1, gene_bounds: dict = None, seed: Optional[int] = None):
         """
         Initialize adaptive mutation.
         
         Args:
             base_sigma: Base mutation strength
             gene_bounds: Dictionary of gene bounds for constraint enforcement
+            seed: Seed for the operator's random number generator (optional)
         """
         self.base_sigma = base_sigma
         self.gene_bounds = gene_bounds or {}
-        self.diversity_history = []
+        self.diversity_history = deque(maxlen=self.HISTORY_SIZE)
+        self._gaussian = GaussianMutation(base_sigma, self.gene_bounds, seed=seed)
     
     def apply(self, *args, **kwargs):
         """Apply adaptive mutation (delegates to mutate method)."""
@@ -425,16 +660,20 @@ class AdaptiveMutation(MutationOperator):
         """Apply adaptive mutation to individual."""
         # Use Gaussian mutation with adaptive sigma
         # (Adaptation logic would be implemented in the GA main loop)
-        gaussian_mutator = GaussianMutation(self.base_sigma, self.gene_bounds)
-        return gaussian_mutator.mutate(individual, mutation_rate)
+        return self._gaussian.mutate(individual, mutation_rate)
+    
+    def mutate_batch(
+        self,
+        pop_matrix: np.ndarray,
+        mutation_rate: float,
+        gene_names: Tuple[str, ...]
+    ) -> np.ndarray:
+        """Apply adaptive mutation to a whole population at once."""
+        return self._gaussian.mutate_batch(pop_matrix, mutation_rate, gene_names)
     
     def update_diversity(self, diversity: float):
-        """Update diversity history for adaptation."""
+        """Update diversity history for adaptation (oldest entries drop off)."""
         self.diversity_history.append(diversity)
-        
-        # Keep only recent history
-        if len(self.diversity_history) > 10:
-            self.diversity_history.pop(0)
     
     def get_adaptive_sigma(self) -> float:
         """Calculate adaptive sigma based on diversity history."""
@@ -442,10 +681,124 @@ class AdaptiveMutation(MutationOperator):
             return self.base_sigma
         
         # Increase mutation when diversity is low
-        recent_diversity = np.mean(self.diversity_history[-5:])
+        recent = islice(self.diversity_history, max(0, len(self.diversity_history) - 5), None)
+        recent_diversity = np.mean(np.fromiter(recent, dtype=np.float64))
         if recent_diversity < 0.1:  # Low diversity threshold
             return self.base_sigma * 2.0
         elif recent_diversity > 0.5:  # High diversity threshold
             return self.base_sigma * 0.5
         else:
-            return self.base_sigma
\ No newline at end of file
+            return self.base_sigma
+
+
+class BanditOperatorSelector(GeneticOperator):
+    """
+    Epsilon-greedy choice between several operators of the same kind.
+    
+    Each operator's score is an exponential moving average of how much its
+    offspring improved on the mean fitness of the generation they were bred
+    from. Most calls go to the best-scoring operator; a fraction ``epsilon``
+    explores the others. Scores are updated through ``record_generation``,
+    which the GA calls once the offspring have been evaluated.
+    """
+    
+    def __init__(
+        self,
+        operators: Dict[str, GeneticOperator],
+        epsilon: float = 0.1,
+        decay: float = 0.9,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize bandit operator selector.
+        
+        Args:
+            operators: Operators to choose from, keyed by name
+            epsilon: Probability of picking a random operator
+            decay: EMA weight kept from previous scores
+            seed: Seed for the selector's random number generator (optional)
+        """
+        if not operators:
+            raise ValueError("At least one operator must be provided")
+        if not 0 <= epsilon <= 1:
+            raise ValueError("Epsilon must be between 0 and 1")
+        if not 0 <= decay < 1:
+            raise ValueError("Decay must be in [0, 1)")
+        self.operators = dict(operators)
+        self.epsilon = epsilon
+        self.decay = decay
+        self.ema: Dict[str, float] = dict.fromkeys(self.operators, 0.0)
+        self._names = list(self.operators)
+        self._rng = random.Random(seed)
+        self._pending: Dict[UUID, str] = {}
+        self._baseline: Optional[float] = None
+    
+    def choose(self) -> str:
+        """Pick the name of the operator to apply next."""
+        if self._rng.random() < self.epsilon:
+            return self._rng.choice(self._names)
+        return max(self._names, key=self.ema.__getitem__)
+    
+    def record_generation(self, population: Population):
+        """Update operator scores from an evaluated population."""
+        fitness_values = [
+            ind.fitness for ind in population
+            if ind.is_evaluated and math.isfinite(ind.fitness)
+        ]
+        
+        if self._baseline is not None:
+            improvements: Dict[str, List[float]] = {}
+            for individual in population:
+                if not individual.is_evaluated or not math.isfinite(individual.fitness):
+                    continue
+                name = self._pending.get(individual.id)
+                if name is None:
+                    # Offspring mutated after crossover are copies of the tracked child
+                    name = next(
+                        (self._pending[pid] for pid in individual.parent_ids if pid in self._pending),
+                        None
+                    )
+                if name is not None:
+                    improvements.setdefault(name, []).append(individual.fitness - self._baseline)
+            
+            for name, values in improvements.items():
+                self.ema[name] = self.decay * self.ema[name] + (1 - self.decay) * float(np.mean(values))
+        
+        self._pending.clear()
+        if fitness_values:
+            self._baseline = float(np.mean(fitness_values))
+    
+    def _track(self, name: str, offspring: Tuple[Individual, ...]):
+        """Remember which operator produced the given offspring."""
+        for individual in offspring:
+            self._pending[individual.id] = name
+
+
+class BanditCrossover(BanditOperatorSelector, CrossoverOperator):
+    """Crossover that adaptively picks among several crossover operators."""
+    
+    def apply(self, *args, **kwargs):
+        """Apply bandit crossover (delegates to crossover method)."""
+        return self.crossover(*args, **kwargs)
+    
+    def crossover(self, parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
+        """Perform crossover with the currently preferred operator."""
+        name = self.choose()
+        offspring = self.operators[name].crossover(parent1, parent2)
+        self._track(name, offspring)
+        return offspring
+
+
+class BanditMutation(BanditOperatorSelector, MutationOperator):
+    """Mutation that adaptively picks among several mutation operators."""
+    
+    def apply(self, *args, **kwargs):
+        """Apply bandit mutation (delegates to mutate method)."""
+        return self.mutate(*args, **kwargs)
+    
+    def mutate(self, individual: Individual, mutation_rate: float) -> Individual:
+        """Mutate with the currently preferred operator."""
+        name = self.choose()
+        mutated = self.operators[name].mutate(individual, mutation_rate)
+        self._track(name, (mutated,))
+        return mutated
@@ -6,15 +6,20 @@ and trajectory planning algorithms including Hohmann transfers and bi-elliptic t
 """
 
 import math
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
-from enum import Enum
+from typing import Dict, Tuple, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 import numpy as np
-from pydantic import BaseModel, Field
 
 from ..models.mission import CelestialBody, TransferType
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 # Physical constants
 G = 6.67430e-11  # Gravitational constant (m³/kg⋅s²)
@@ -72,11 +77,32 @@ CELESTIAL_BODIES = {
     }
 }
 
+# Plain (x, y, z) vector returned by the scalar state-vector path
+Vector3 = Tuple[float, float, float]
+
 # Sun data for interplanetary calculations
 SUN_MU = 1.32712440018e20  # m³/s²
 
+# Structure-of-arrays copy of CELESTIAL_BODIES for vectorized calculations
+_BODY_ORDER: Tuple[CelestialBody, ...] = tuple(CELESTIAL_BODIES)
+_BODY_INDEX: Dict[CelestialBody, int] = {body: k for k, body in enumerate(_BODY_ORDER)}
+_BODY_TABLE = np.zeros(len(_BODY_ORDER), dtype=[
+    ('mass', 'f8'),
+    ('radius', 'f8'),
+    ('mu', 'f8'),
+    ('soi', 'f8'),
+    ('orbital_radius', 'f8'),
+    ('orbital_period', 'f8')
+])
+for _k, _body in enumerate(_BODY_ORDER):
+    _BODY_TABLE[_k] = tuple(CELESTIAL_BODIES[_body][field] for field in _BODY_TABLE.dtype.names)
+del _k, _body
+
+# Below this eccentricity the O(e³) true-anomaly series is within ~2e-7 rad
+_NU_SERIES_MAX_ECCENTRICITY = 0.02
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class OrbitalElements:
     """Classical orbital elements."""
     semi_major_axis: float      # a (m)
@@ -85,11 +111,12 @@ class OrbitalElements:
     longitude_of_ascending_node: float  # Ω (radians)
     argument_of_periapsis: float       # ω (radians)
     true_anomaly: float         # ν (radians)
+    _pqw_cache: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def semi_minor_axis(self) -> float:
         """Calculate semi-minor axis."""
-        return self.semi_major_axis * math.sqrt(1 - self.eccentricity**2)
+        return self.semi_major_axis * math.sqrt(1.0 - self.eccentricity * self.eccentricity)
     
     @property
     def periapsis(self) -> float:
@@ -101,50 +128,389 @@ class OrbitalElements:
         """Calculate apoapsis distance."""
         return self.semi_major_axis * (1 + self.eccentricity)
     
+    @property
+    def pqw_to_eci(self) -> np.ndarray:
+        """Rotation matrix from the perifocal frame to the inertial frame (read-only)."""
+        R = self._pqw_cache
+        if R is None:
+            R = _pqw_rotation(
+                float(self.inclination),
+                float(self.longitude_of_ascending_node),
+                float(self.argument_of_periapsis)
+            )
+            R.flags.writeable = False
+            # Frozen instance: populate the cache slot directly
+            object.__setattr__(self, '_pqw_cache', R)
+        return R
+    
     def orbital_period(self, mu: float) -> float:
         """Calculate orbital period using Kepler's third law."""
-        return 2 * math.pi * math.sqrt(self.semi_major_axis**3 / mu)
+        a = self.semi_major_axis
+        return 2 * math.pi * a * math.sqrt(a / mu)
     
     def orbital_velocity(self, mu: float, radius: float) -> float:
         """Calculate orbital velocity at given radius using vis-viva equation."""
         return math.sqrt(mu * (2/radius - 1/self.semi_major_axis))
 
 
+def _kepler_solve(M: float, e: float, tolerance: float, max_iterations: int) -> float:
+    """Danby iteration for Kepler's equation (see OrbitalMechanics.kepler_equation_solver)."""
+    # Mikkola's cubic starter, defined on M in [-pi, pi)
+    offset = 2 * math.pi * math.floor((M + math.pi) / (2 * math.pi))
+    M_wrapped = M - offset
+    denom = 4 * e + 0.5
+    alpha = (1 - e) / denom
+    beta = M_wrapped / (2 * denom)
+    z = beta + math.copysign(math.sqrt(beta * beta + alpha * alpha * alpha), beta)
+    z = math.copysign(abs(z) ** (1.0 / 3.0), z)
+    s = z - alpha / z if z != 0.0 else 0.0
+    s = s - 0.078 * s**5 / (1 + e)
+    E = M_wrapped + e * s * (3 - 4 * s * s) + offset
+    
+    for _ in range(max_iterations):
+        e_sin = e * math.sin(E)
+        e_cos = e * math.cos(E)
+        f = E - e_sin - M
+        fp = 1 - e_cos
+        
+        d1 = -f / fp
+        d2 = -f / (fp + d1 * e_sin / 2)
+        d3 = -f / (fp + d1 * (e_sin + d2 * d2 * e_cos / 3) / 2)
+        E += d3
+        
+        if abs(d3) < tolerance:
+            break
+    
+    return E
+
+
+def _nu_from_E(E: float, e: float) -> float:
+    """True anomaly from eccentric anomaly (half-angle form)."""
+    # Adjacent sin/cos of the same angle lower to a single sincos when jitted
+    half_E = E * 0.5
+    sin_half = math.sin(half_E)
+    cos_half = math.cos(half_E)
+    return 2.0 * math.atan2(math.sqrt(1.0 + e) * sin_half, math.sqrt(1.0 - e) * cos_half)
+
+
+def _elements_from_sv(rx: float, ry: float, rz: float, vx: float, vy: float, vz: float,
+                      mu: float) -> Tuple[float, float, float, float, float, float]:
+    """Classical elements (a, e, i, Ω, ω, ν) from a state vector."""
+    # Nested two-argument hypot: overflow-safe, and supported by Numba
+    r = math.hypot(math.hypot(rx, ry), rz)
+    v2 = vx * vx + vy * vy + vz * vz
+    
+    # Specific orbital energy
+    energy = v2 / 2 - mu / r
+    
+    # Semi-major axis
+    a = -mu / (2 * energy)
+    
+    # Angular momentum vector (r × v)
+    hx = ry * vz - rz * vy
+    hy = rz * vx - rx * vz
+    hz = rx * vy - ry * vx
+    h = math.hypot(math.hypot(hx, hy), hz)
+    
+    # Eccentricity vector ((v × h) / mu - r / |r|)
+    ex = (vy * hz - vz * hy) / mu - rx / r
+    ey = (vz * hx - vx * hz) / mu - ry / r
+    ez = (vx * hy - vy * hx) / mu - rz / r
+    e = math.hypot(math.hypot(ex, ey), ez)
+    
+    # Inclination
+    i = math.acos(hz / h)
+    
+    # Node vector (k × h)
+    nx = -hy
+    ny = hx
+    n = math.hypot(nx, ny)
+    
+    # Longitude of ascending node
+    if n > 1e-10:
+        omega_lan = math.acos(nx / n)
+        if ny < 0:
+            omega_lan = 2 * math.pi - omega_lan
+    else:
+        omega_lan = 0.0
+    
+    # Argument of periapsis
+    if n > 1e-10 and e > 1e-10:
+        omega = math.acos((nx * ex + ny * ey) / (n * e))
+        if ez < 0:
+            omega = 2 * math.pi - omega
+    else:
+        omega = 0.0
+    
+    # True anomaly
+    if e > 1e-10:
+        nu = math.acos((ex * rx + ey * ry + ez * rz) / (e * r))
+        if rx * vx + ry * vy + rz * vz < 0:
+            nu = 2 * math.pi - nu
+    else:
+        nu = 0.0
+    
+    return a, e, i, omega_lan, omega, nu
+
+
+def _pqw_rotation(inc: float, raan: float, argp: float) -> np.ndarray:
+    """Rotation matrix from the perifocal (PQW) frame to the inertial frame."""
+    cos_omega = math.cos(argp)
+    sin_omega = math.sin(argp)
+    cos_i = math.cos(inc)
+    sin_i = math.sin(inc)
+    cos_Omega = math.cos(raan)
+    sin_Omega = math.sin(raan)
+    
+    R = np.empty((3, 3))
+    R[0, 0] = cos_omega * cos_Omega - sin_omega * cos_i * sin_Omega
+    R[0, 1] = -(sin_omega * cos_Omega + cos_omega * cos_i * sin_Omega)
+    R[0, 2] = sin_i * sin_Omega
+    R[1, 0] = cos_omega * sin_Omega + sin_omega * cos_i * cos_Omega
+    R[1, 1] = cos_omega * cos_i * cos_Omega - sin_omega * sin_Omega
+    R[1, 2] = -sin_i * cos_Omega
+    R[2, 0] = sin_omega * sin_i
+    R[2, 1] = cos_omega * sin_i
+    R[2, 2] = cos_i
+    return R
+
+
+def _sv_from_elements(a: float, e: float, nu: float, mu: float,
+                      R: np.ndarray) -> Tuple[Vector3, Vector3]:
+    """Inertial position and velocity from in-plane elements and the PQW rotation."""
+    sin_nu = math.sin(nu)
+    cos_nu = math.cos(nu)
+    
+    # Calculate position in orbital plane
+    p = a * (1.0 - e * e)
+    r = p / (1 + e * cos_nu)
+    
+    x_orb = r * cos_nu
+    y_orb = r * sin_nu
+    
+    # Calculate velocity in orbital plane
+    vx_orb = -math.sqrt(mu / p) * sin_nu
+    vy_orb = math.sqrt(mu / p) * (e + cos_nu)
+    
+    # Transform to inertial frame (the PQW W-component is zero)
+    position = (
+        R[0, 0] * x_orb + R[0, 1] * y_orb,
+        R[1, 0] * x_orb + R[1, 1] * y_orb,
+        R[2, 0] * x_orb + R[2, 1] * y_orb
+    )
+    velocity = (
+        R[0, 0] * vx_orb + R[0, 1] * vy_orb,
+        R[1, 0] * vx_orb + R[1, 1] * vy_orb,
+        R[2, 0] * vx_orb + R[2, 1] * vy_orb
+    )
+    
+    return position, velocity
+
+
+def _hohmann_dv(r1: float, r2: float, mu: float) -> Tuple[float, float, float]:
+    """Hohmann transfer delta-V (see DeltaVCalculator.hohmann_transfer)."""
+    # Initial and final circular velocities
+    v1 = math.sqrt(mu / r1)
+    v2 = math.sqrt(mu / r2)
+    
+    # Transfer orbit semi-major axis
+    a_transfer = (r1 + r2) / 2
+    
+    # Transfer orbit velocities at periapsis and apoapsis
+    v_transfer_1 = math.sqrt(mu * (2/r1 - 1/a_transfer))
+    v_transfer_2 = math.sqrt(mu * (2/r2 - 1/a_transfer))
+    
+    # Delta-V requirements
+    delta_v1 = abs(v_transfer_1 - v1)
+    delta_v2 = abs(v2 - v_transfer_2)
+    total_delta_v = delta_v1 + delta_v2
+    
+    return delta_v1, delta_v2, total_delta_v
+
+
+def _bi_elliptic_dv(r1: float, r2: float, r3: float, mu: float) -> Tuple[float, float, float, float]:
+    """Bi-elliptic transfer delta-V (see DeltaVCalculator.bi_elliptic_transfer)."""
+    # Initial and final circular velocities
+    v1 = math.sqrt(mu / r1)
+    v2 = math.sqrt(mu / r2)
+    
+    # First transfer orbit (r1 to r3)
+    a1 = (r1 + r3) / 2
+    v1_transfer = math.sqrt(mu * (2/r1 - 1/a1))
+    v3_transfer1 = math.sqrt(mu * (2/r3 - 1/a1))
+    
+    # Second transfer orbit (r3 to r2)
+    a2 = (r3 + r2) / 2
+    v3_transfer2 = math.sqrt(mu * (2/r3 - 1/a2))
+    v2_transfer = math.sqrt(mu * (2/r2 - 1/a2))
+    
+    # Delta-V requirements
+    delta_v1 = abs(v1_transfer - v1)
+    delta_v2 = abs(v3_transfer2 - v3_transfer1)
+    delta_v3 = abs(v2 - v2_transfer)
+    total_delta_v = delta_v1 + delta_v2 + delta_v3
+    
+    return delta_v1, delta_v2, delta_v3, total_delta_v
+
+
+def _hohmann_time(r1: float, r2: float, mu: float) -> float:
+    """Hohmann transfer time (half the transfer ellipse period)."""
+    a_transfer = (r1 + r2) / 2
+    return math.pi * a_transfer * math.sqrt(a_transfer / mu)
+
+
+def _bi_elliptic_time(r1: float, r2: float, mu: float) -> float:
+    """Bi-elliptic transfer time via an intermediate radius 3x the larger orbit."""
+    r3 = 3 * max(r1, r2)
+    a1 = (r1 + r3) / 2
+    a2 = (r3 + r2) / 2
+    t1 = math.pi * a1 * math.sqrt(a1 / mu)
+    t2 = math.pi * a2 * math.sqrt(a2 / mu)
+    return t1 + t2
+
+
+def _direct_time(r1: float, r2: float, mu: float) -> float:
+    """Simplified direct transfer time (faster than Hohmann)."""
+    a_transfer = (r1 + r2) / 2
+    return 0.7 * math.pi * a_transfer * math.sqrt(a_transfer / mu)
+
+
+# Compile the scalar kernels to machine code when Numba is installed
+if NUMBA_AVAILABLE:
+    _kepler_solve = njit(cache=True, fastmath=True)(_kepler_solve)
+    _nu_from_E = njit(cache=True, fastmath=True)(_nu_from_E)
+    _elements_from_sv = njit(cache=True, fastmath=True)(_elements_from_sv)
+    _pqw_rotation = njit(cache=True, fastmath=True)(_pqw_rotation)
+    _sv_from_elements = njit(cache=True, fastmath=True)(_sv_from_elements)
+    _hohmann_dv = njit(cache=True, fastmath=True)(_hohmann_dv)
+    _bi_elliptic_dv = njit(cache=True, fastmath=True)(_bi_elliptic_dv)
+    _hohmann_time = njit(cache=True, fastmath=True)(_hohmann_time)
+    _bi_elliptic_time = njit(cache=True, fastmath=True)(_bi_elliptic_time)
+    _direct_time = njit(cache=True, fastmath=True)(_direct_time)
+
+# Transfer time by type; unlisted types fall back to Hohmann
+_TRANSFER_TIME_FNS = {
+    TransferType.HOHMANN: _hohmann_time,
+    TransferType.BI_ELLIPTIC: _bi_elliptic_time,
+    TransferType.DIRECT: _direct_time
+}
+
+
 class OrbitalMechanics:
     """Core orbital mechanics calculations."""
     
     @staticmethod
     def kepler_equation_solver(mean_anomaly: float, eccentricity: float, 
-                              tolerance: float = 1e-8, max_iterations: int = 100) -> float:
+                              tolerance: float = 1e-8, max_iterations: int = 5) -> float:
         """
         Solve Kepler's equation M = E - e*sin(E) for eccentric anomaly E.
-        Uses Newton-Raphson method.
+        Uses Danby's quartic-convergent iteration, which reuses sin(E) and
+        cos(E) for the higher derivatives, from Mikkola's cubic starter; this
+        converges in two steps for any 0 <= e < 1.
+        """
+        return _kepler_solve(float(mean_anomaly), float(eccentricity), tolerance, max_iterations)
+    
+    @staticmethod
+    def kepler_equation_solver_vec(mean_anomaly: np.ndarray, eccentricity: float) -> np.ndarray:
         """
-        # Initial guess
-        E = mean_anomaly if eccentricity < 0.8 else math.pi
+        Solve Kepler's equation for an array of mean anomalies at once.
         
-        for _ in range(max_iterations):
-            f = E - eccentricity * math.sin(E) - mean_anomaly
-            df = 1 - eccentricity * math.cos(E)
-            
-            if abs(df) < 1e-12:  # Avoid division by zero
-                break
-                
-            E_new = E - f / df
-            
-            if abs(E_new - E) < tolerance:
-                return E_new
-                
-            E = E_new
+        Uses Markley's (1995) non-iterative cubic starter followed by a single
+        fifth-order Halley-type correction, which is accurate to machine
+        precision for 0 <= e < 1.
+        
+        Args:
+            mean_anomaly: Array of mean anomalies (radians)
+            eccentricity: Orbital eccentricity
         
-        return E
+        Returns:
+            Array of eccentric anomalies (radians), same shape as mean_anomaly
+        """
+        M_in = np.asarray(mean_anomaly, dtype=float)
+        e = eccentricity
+        
+        # Wrap into [-pi, pi) and remember the offset so E tracks the input branch
+        M = np.mod(M_in + math.pi, 2 * math.pi) - math.pi
+        offset = M_in - M
+        
+        # Markley's cubic starter
+        ome = 1.0 - e
+        pi2 = math.pi * math.pi
+        alpha = (3 * pi2 + 1.6 * math.pi * (math.pi - np.abs(M)) / (1 + e)) / (pi2 - 6)
+        d = 3 * ome + alpha * e
+        M2 = M * M
+        q = 2 * alpha * d * ome - M2
+        r = 3 * alpha * d * (d - ome) * M + M2 * M
+        q2 = q * q
+        w = (np.abs(r) + np.sqrt(q2 * q + r * r)) ** (2.0 / 3.0)
+        E1 = (2 * r * w / (w * w + w * q + q2) + M) / d
+        
+        # Single high-order correction sharing one sin/cos evaluation
+        e_sin = e * np.sin(E1)
+        e_cos = e * np.cos(E1)
+        f0 = E1 - e_sin - M
+        f1 = 1 - e_cos
+        f2 = e_sin
+        f3 = e_cos
+        d3 = -f0 / (f1 - 0.5 * f0 * f2 / f1)
+        d4 = -f0 / (f1 + 0.5 * d3 * f2 + d3 * d3 * f3 / 6)
+        d5 = -f0 / (f1 + 0.5 * d4 * f2 + d4 * d4 * f3 / 6 - d4 * d4 * d4 * f2 / 24)
+        
+        return E1 + d5 + offset
     
     @staticmethod
     def true_anomaly_from_eccentric(eccentric_anomaly: float, eccentricity: float) -> float:
         """Convert eccentric anomaly to true anomaly."""
-        cos_nu = (math.cos(eccentric_anomaly) - eccentricity) / (1 - eccentricity * math.cos(eccentric_anomaly))
-        sin_nu = math.sqrt(1 - eccentricity**2) * math.sin(eccentric_anomaly) / (1 - eccentricity * math.cos(eccentric_anomaly))
-        return math.atan2(sin_nu, cos_nu)
+        return _nu_from_E(float(eccentric_anomaly), float(eccentricity))
+    
+    @staticmethod
+    def true_anomaly_from_eccentric_vec(eccentric_anomaly: np.ndarray, eccentricity: float) -> np.ndarray:
+        """
+        Convert an array of eccentric anomalies to true anomalies.
+        
+        Args:
+            eccentric_anomaly: Array of eccentric anomalies (radians), e.g. from
+                kepler_equation_solver_vec
+            eccentricity: Orbital eccentricity
+        
+        Returns:
+            Array of true anomalies (radians)
+        """
+        half_E = 0.5 * np.asarray(eccentric_anomaly, dtype=np.float64)
+        return 2.0 * np.arctan2(
+            math.sqrt(1.0 + eccentricity) * np.sin(half_E),
+            math.sqrt(1.0 - eccentricity) * np.cos(half_E)
+        )
+    
+    @staticmethod
+    def true_anomaly_from_mean_vec(mean_anomaly: np.ndarray, eccentricity: float) -> np.ndarray:
+        """
+        Convert an array of mean anomalies directly to true anomalies.
+        
+        Near-circular orbits use the equation-of-center series
+        nu = M + (2e - e³/4) sin M + (5e²/4) sin 2M + (13e³/12) sin 3M
+        in Horner form, skipping the Kepler solve; more eccentric orbits go
+        through kepler_equation_solver_vec and true_anomaly_from_eccentric_vec.
+        
+        Args:
+            mean_anomaly: Array of mean anomalies (radians)
+            eccentricity: Orbital eccentricity
+        
+        Returns:
+            Array of true anomalies (radians, equivalent modulo 2π)
+        """
+        M = np.asarray(mean_anomaly, dtype=np.float64)
+        e = eccentricity
+        
+        if e < _NU_SERIES_MAX_ECCENTRICITY:
+            sin_M = np.sin(M)
+            cos_M = np.cos(M)
+            sin_2M = 2.0 * sin_M * cos_M
+            sin_3M = sin_M * (3.0 - 4.0 * sin_M * sin_M)
+            return M + e * (2.0 * sin_M + e * (1.25 * sin_2M + e * (13.0 / 12.0 * sin_3M - 0.25 * sin_M)))
+        
+        E = OrbitalMechanics.kepler_equation_solver_vec(M, e)
+        return OrbitalMechanics.true_anomaly_from_eccentric_vec(E, e)
     
     @staticmethod
     def orbital_elements_from_state_vector(position: np.ndarray, velocity: np.ndarray, mu: float) -> OrbitalElements:
@@ -156,53 +522,13 @@ class OrbitalMechanics:
             velocity: Velocity vector [vx, vy, vz] in m/s
             mu: Standard gravitational parameter in m³/s²
         """
-        r = np.linalg.norm(position)
-        v = np.linalg.norm(velocity)
-        
-        # Specific orbital energy
-        energy = v**2 / 2 - mu / r
-        
-        # Semi-major axis
-        a = -mu / (2 * energy)
-        
-        # Angular momentum vector
-        h_vec = np.cross(position, velocity)
-        h = np.linalg.norm(h_vec)
-        
-        # Eccentricity vector
-        e_vec = np.cross(velocity, h_vec) / mu - position / r
-        e = np.linalg.norm(e_vec)
-        
-        # Inclination
-        i = math.acos(h_vec[2] / h)
-        
-        # Node vector
-        n_vec = np.cross([0, 0, 1], h_vec)
-        n = np.linalg.norm(n_vec)
-        
-        # Longitude of ascending node
-        if n > 1e-10:
-            omega_lan = math.acos(n_vec[0] / n)
-            if n_vec[1] < 0:
-                omega_lan = 2 * math.pi - omega_lan
-        else:
-            omega_lan = 0
-        
-        # Argument of periapsis
-        if n > 1e-10 and e > 1e-10:
-            omega = math.acos(np.dot(n_vec, e_vec) / (n * e))
-            if e_vec[2] < 0:
-                omega = 2 * math.pi - omega
-        else:
-            omega = 0
-        
-        # True anomaly
-        if e > 1e-10:
-            nu = math.acos(np.dot(e_vec, position) / (e * r))
-            if np.dot(position, velocity) < 0:
-                nu = 2 * math.pi - nu
-        else:
-            nu = 0
+        rx, ry, rz = position
+        vx, vy, vz = velocity
+        a, e, i, omega_lan, omega, nu = _elements_from_sv(
+            float(rx), float(ry), float(rz),
+            float(vx), float(vy), float(vz),
+            float(mu)
+        )
         
         return OrbitalElements(
             semi_major_axis=a,
@@ -214,46 +540,64 @@ class OrbitalMechanics:
         )
     
     @staticmethod
-    def state_vector_from_orbital_elements(elements: OrbitalElements, mu: float) -> Tuple[np.ndarray, np.ndarray]:
+    def state_vector_from_orbital_elements(elements: OrbitalElements, mu: float,
+                                           as_ndarray: bool = False) -> Tuple[Vector3, Vector3]:
         """
         Calculate position and velocity vectors from orbital elements.
         
+        Args:
+            elements: Orbital elements
+            mu: Standard gravitational parameter in m³/s²
+            as_ndarray: Return NumPy arrays instead of plain (x, y, z) tuples
+        
         Returns:
             Tuple of (position, velocity) vectors in meters and m/s
         """
-        # Calculate position in orbital plane
-        r = elements.semi_major_axis * (1 - elements.eccentricity**2) / (1 + elements.eccentricity * math.cos(elements.true_anomaly))
-        
-        x_orb = r * math.cos(elements.true_anomaly)
-        y_orb = r * math.sin(elements.true_anomaly)
-        
-        # Calculate velocity in orbital plane
-        p = elements.semi_major_axis * (1 - elements.eccentricity**2)
-        vx_orb = -math.sqrt(mu / p) * math.sin(elements.true_anomaly)
-        vy_orb = math.sqrt(mu / p) * (elements.eccentricity + math.cos(elements.true_anomaly))
-        
-        # Rotation matrices
-        cos_omega = math.cos(elements.argument_of_periapsis)
-        sin_omega = math.sin(elements.argument_of_periapsis)
-        cos_i = math.cos(elements.inclination)
-        sin_i = math.sin(elements.inclination)
-        cos_Omega = math.cos(elements.longitude_of_ascending_node)
-        sin_Omega = math.sin(elements.longitude_of_ascending_node)
-        
-        # Transform to inertial frame
-        position = np.array([
-            x_orb * (cos_omega * cos_Omega - sin_omega * cos_i * sin_Omega) - y_orb * (sin_omega * cos_Omega + cos_omega * cos_i * sin_Omega),
-            x_orb * (cos_omega * sin_Omega + sin_omega * cos_i * cos_Omega) + y_orb * (cos_omega * cos_i * cos_Omega - sin_omega * sin_Omega),
-            x_orb * (sin_omega * sin_i) + y_orb * (cos_omega * sin_i)
-        ])
-        
-        velocity = np.array([
-            vx_orb * (cos_omega * cos_Omega - sin_omega * cos_i * sin_Omega) - vy_orb * (sin_omega * cos_Omega + cos_omega * cos_i * sin_Omega),
-            vx_orb * (cos_omega * sin_Omega + sin_omega * cos_i * cos_Omega) + vy_orb * (cos_omega * cos_i * cos_Omega - sin_omega * sin_Omega),
-            vx_orb * (sin_omega * sin_i) + vy_orb * (cos_omega * sin_i)
-        ])
-        
+        position, velocity = _sv_from_elements(
+            float(elements.semi_major_axis),
+            float(elements.eccentricity),
+            float(elements.true_anomaly),
+            float(mu),
+            elements.pqw_to_eci
+        )
+        if as_ndarray:
+            return np.array(position), np.array(velocity)
         return position, velocity
+    
+    @staticmethod
+    def state_vectors_from_elements(elements: OrbitalElements, true_anomalies: np.ndarray,
+                                    mu: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate position and velocity vectors for many points on one orbit.
+        
+        The orbit orientation is shared, so the cached PQW→inertial rotation
+        is applied to every point with a single matrix product.
+        
+        Args:
+            elements: Orbital elements (true_anomaly is ignored)
+            true_anomalies: Array of true anomalies (radians)
+            mu: Standard gravitational parameter in m³/s²
+        
+        Returns:
+            Tuple of (positions, velocities) arrays of shape (N, 3) in meters and m/s
+        """
+        nu = np.asarray(true_anomalies, dtype=np.float64)
+        a = elements.semi_major_axis
+        e = elements.eccentricity
+        
+        cos_nu = np.cos(nu)
+        sin_nu = np.sin(nu)
+        p = a * (1.0 - e * e)
+        r = p / (1 + e * cos_nu)
+        v_scale = math.sqrt(mu / p)
+        
+        # Only the P and Q columns matter for in-plane vectors
+        R_pq = elements.pqw_to_eci[:, :2]
+        
+        positions = R_pq @ np.vstack([r * cos_nu, r * sin_nu])
+        velocities = R_pq @ np.vstack([-v_scale * sin_nu, v_scale * (e + cos_nu)])
+        
+        return positions.T, velocities.T
 
 
 class DeltaVCalculator:
@@ -272,23 +616,7 @@ class DeltaVCalculator:
         Returns:
             Tuple of (delta_v1, delta_v2, total_delta_v) in m/s
         """
-        # Initial and final circular velocities
-        v1 = math.sqrt(mu / r1)
-        v2 = math.sqrt(mu / r2)
-        
-        # Transfer orbit semi-major axis
-        a_transfer = (r1 + r2) / 2
-        
-        # Transfer orbit velocities at periapsis and apoapsis
-        v_transfer_1 = math.sqrt(mu * (2/r1 - 1/a_transfer))
-        v_transfer_2 = math.sqrt(mu * (2/r2 - 1/a_transfer))
-        
-        # Delta-V requirements
-        delta_v1 = abs(v_transfer_1 - v1)
-        delta_v2 = abs(v2 - v_transfer_2)
-        total_delta_v = delta_v1 + delta_v2
-        
-        return delta_v1, delta_v2, total_delta_v
+        return _hohmann_dv(float(r1), float(r2), float(mu))
     
     @staticmethod
     def bi_elliptic_transfer(r1: float, r2: float, r3: float, mu: float) -> Tuple[float, float, float, float]:
@@ -304,27 +632,67 @@ class DeltaVCalculator:
         Returns:
             Tuple of (delta_v1, delta_v2, delta_v3, total_delta_v) in m/s
         """
-        # Initial and final circular velocities
-        v1 = math.sqrt(mu / r1)
-        v2 = math.sqrt(mu / r2)
+        return _bi_elliptic_dv(float(r1), float(r2), float(r3), float(mu))
+    
+    @staticmethod
+    def hohmann_transfer_batch(r1: np.ndarray, r2: np.ndarray,
+                               mu: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate Hohmann transfer delta-V for arrays of orbit radii.
         
-        # First transfer orbit (r1 to r3)
-        a1 = (r1 + r3) / 2
-        v1_transfer = math.sqrt(mu * (2/r1 - 1/a1))
-        v3_transfer1 = math.sqrt(mu * (2/r3 - 1/a1))
+        Args:
+            r1: Initial circular orbit radii (m)
+            r2: Final circular orbit radii (m), broadcastable against r1
+            mu: Standard gravitational parameter (m³/s²)
         
-        # Second transfer orbit (r3 to r2)
-        a2 = (r3 + r2) / 2
-        v3_transfer2 = math.sqrt(mu * (2/r3 - 1/a2))
-        v2_transfer = math.sqrt(mu * (2/r2 - 1/a2))
+        Returns:
+            Tuple of (delta_v1, delta_v2, total_delta_v) arrays in m/s
+        """
+        r1 = np.asarray(r1, dtype=np.float64)
+        r2 = np.asarray(r2, dtype=np.float64)
+        
+        v1 = np.sqrt(mu / r1)
+        v2 = np.sqrt(mu / r2)
+        a_transfer = 0.5 * (r1 + r2)
+        v_transfer_1 = np.sqrt(mu * (2.0 / r1 - 1.0 / a_transfer))
+        v_transfer_2 = np.sqrt(mu * (2.0 / r2 - 1.0 / a_transfer))
+        
+        delta_v1 = np.abs(v_transfer_1 - v1)
+        delta_v2 = np.abs(v2 - v_transfer_2)
+        return delta_v1, delta_v2, delta_v1 + delta_v2
+    
+    @staticmethod
+    def bi_elliptic_transfer_batch(r1: np.ndarray, r2: np.ndarray, r3: np.ndarray,
+                                   mu: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate bi-elliptic transfer delta-V for arrays of orbit radii.
         
-        # Delta-V requirements
-        delta_v1 = abs(v1_transfer - v1)
-        delta_v2 = abs(v3_transfer2 - v3_transfer1)
-        delta_v3 = abs(v2 - v2_transfer)
-        total_delta_v = delta_v1 + delta_v2 + delta_v3
+        Args:
+            r1: Initial circular orbit radii (m)
+            r2: Final circular orbit radii (m)
+            r3: Intermediate apoapsis radii (m); all three broadcast together
+            mu: Standard gravitational parameter (m³/s²)
         
-        return delta_v1, delta_v2, delta_v3, total_delta_v
+        Returns:
+            Tuple of (delta_v1, delta_v2, delta_v3, total_delta_v) arrays in m/s
+        """
+        r1 = np.asarray(r1, dtype=np.float64)
+        r2 = np.asarray(r2, dtype=np.float64)
+        r3 = np.asarray(r3, dtype=np.float64)
+        
+        v1 = np.sqrt(mu / r1)
+        v2 = np.sqrt(mu / r2)
+        a1 = 0.5 * (r1 + r3)
+        a2 = 0.5 * (r3 + r2)
+        v1_transfer = np.sqrt(mu * (2.0 / r1 - 1.0 / a1))
+        v3_transfer1 = np.sqrt(mu * (2.0 / r3 - 1.0 / a1))
+        v3_transfer2 = np.sqrt(mu * (2.0 / r3 - 1.0 / a2))
+        v2_transfer = np.sqrt(mu * (2.0 / r2 - 1.0 / a2))
+        
+        delta_v1 = np.abs(v1_transfer - v1)
+        delta_v2 = np.abs(v3_transfer2 - v3_transfer1)
+        delta_v3 = np.abs(v2 - v2_transfer)
+        return delta_v1, delta_v2, delta_v3, delta_v1 + delta_v2 + delta_v3
     
     @staticmethod
     def plane_change_delta_v(velocity: float, angle_rad: float) -> float:
@@ -359,6 +727,9 @@ class DeltaVCalculator:
         """
         Calculate approximate delta-V requirements for interplanetary transfer.
         
+        Results depend only on the body pair, so they are memoized; each call
+        returns a fresh copy the caller may modify.
+        
         Args:
             departure_body: Starting celestial body
             target_body: Destination celestial body
@@ -366,12 +737,17 @@ class DeltaVCalculator:
         Returns:
             Dictionary with delta-V components
         """
-        if departure_body not in CELESTIAL_BODIES or target_body not in CELESTIAL_BODIES:
+        return dict(DeltaVCalculator._interplanetary_delta_v(departure_body, target_body))
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _interplanetary_delta_v(departure_body: CelestialBody, target_body: CelestialBody) -> Dict[str, float]:
+        """Uncached interplanetary delta-V; see interplanetary_delta_v."""
+        dep_data = CELESTIAL_BODIES.get(departure_body)
+        tgt_data = CELESTIAL_BODIES.get(target_body)
+        if dep_data is None or tgt_data is None:
             raise ValueError("Unsupported celestial body")
         
-        dep_data = CELESTIAL_BODIES[departure_body]
-        tgt_data = CELESTIAL_BODIES[target_body]
-        
         # Simplified calculation using circular orbits
         r1 = dep_data['orbital_radius']
         r2 = tgt_data['orbital_radius']
@@ -399,6 +775,34 @@ class DeltaVCalculator:
             'capture_delta_v': capture_delta_v,
             'total_delta_v': escape_delta_v + delta_v1 + delta_v2 + capture_delta_v
         }
+    
+    @staticmethod
+    def all_transfers() -> Tuple[Tuple[CelestialBody, ...], np.ndarray]:
+        """
+        Calculate approximate interplanetary delta-V between every pair of bodies.
+        
+        Vectorized equivalent of interplanetary_delta_v over the whole body
+        table, for launch-window and destination grid searches.
+        
+        Returns:
+            Tuple of (bodies, total_delta_v) where total_delta_v[i, j] is the
+            total delta-V in m/s from bodies[i] to bodies[j]
+        """
+        radius = _BODY_TABLE['radius']
+        mu = _BODY_TABLE['mu']
+        
+        # Hohmann transfer in heliocentric frame for every (departure, target) pair
+        orbital_radius = _BODY_TABLE['orbital_radius']
+        _, _, helio_delta_v = DeltaVCalculator.hohmann_transfer_batch(
+            orbital_radius[:, np.newaxis], orbital_radius[np.newaxis, :], SUN_MU
+        )
+        
+        # Escape from / capture into a 200 km low orbit (same expression both ways)
+        low_orbit_radius = radius + 200e3
+        escape_delta_v = np.sqrt(2 * mu / low_orbit_radius) - np.sqrt(mu / low_orbit_radius)
+        
+        total = escape_delta_v[:, np.newaxis] + helio_delta_v + escape_delta_v[np.newaxis, :]
+        return _BODY_ORDER, total
 
 
 class TrajectoryCalculator:
@@ -418,28 +822,8 @@ class TrajectoryCalculator:
         Returns:
             Transfer time in seconds
         """
-        if transfer_type == TransferType.HOHMANN:
-            a_transfer = (r1 + r2) / 2
-            return math.pi * math.sqrt(a_transfer**3 / mu)
-        
-        elif transfer_type == TransferType.BI_ELLIPTIC:
-            # Assume intermediate radius is 3 times the larger of r1, r2
-            r3 = 3 * max(r1, r2)
-            a1 = (r1 + r3) / 2
-            a2 = (r3 + r2) / 2
-            t1 = math.pi * math.sqrt(a1**3 / mu)
-            t2 = math.pi * math.sqrt(a2**3 / mu)
-            return t1 + t2
-        
-        elif transfer_type == TransferType.DIRECT:
-            # Simplified direct transfer (faster than Hohmann)
-            a_transfer = (r1 + r2) / 2
-            return 0.7 * math.pi * math.sqrt(a_transfer**3 / mu)
-        
-        else:
-            # Default to Hohmann
-            a_transfer = (r1 + r2) / 2
-            return math.pi * math.sqrt(a_transfer**3 / mu)
+        time_fn = _TRANSFER_TIME_FNS.get(transfer_type, _hohmann_time)
+        return time_fn(float(r1), float(r2), float(mu))
     
     @staticmethod
     def optimize_transfer_type(r1: float, r2: float, mu: float) -> Tuple[TransferType, float]:
@@ -469,6 +853,33 @@ class TrajectoryCalculator:
         
         return TransferType.HOHMANN, hohmann_dv
     
+    @staticmethod
+    def optimize_transfer_type_batch(r1: np.ndarray, r2: np.ndarray,
+                                     mu: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized optimize_transfer_type over a grid of candidate radii.
+        
+        Args:
+            r1: Initial orbit radii (m)
+            r2: Final orbit radii (m), broadcastable against r1
+            mu: Standard gravitational parameter (m³/s²)
+        
+        Returns:
+            Tuple of (use_bi_elliptic, delta_v_requirement) arrays, where
+            use_bi_elliptic is True where a bi-elliptic transfer is optimal
+        """
+        r1 = np.asarray(r1, dtype=np.float64)
+        r2 = np.asarray(r2, dtype=np.float64)
+        
+        _, _, hohmann_dv = DeltaVCalculator.hohmann_transfer_batch(r1, r2, mu)
+        
+        r_max = np.maximum(r1, r2)
+        ratio = r_max / np.minimum(r1, r2)
+        _, _, _, bi_elliptic_dv = DeltaVCalculator.bi_elliptic_transfer_batch(r1, r2, 3 * r_max, mu)
+        
+        use_bi_elliptic = (ratio > 11.94) & (bi_elliptic_dv < hohmann_dv)
+        return use_bi_elliptic, np.where(use_bi_elliptic, bi_elliptic_dv, hohmann_dv)
+    
     @staticmethod
     def calculate_launch_window(departure_body: CelestialBody, target_body: CelestialBody, 
                                start_date: float) -> Tuple[float, float]:
@@ -483,12 +894,11 @@ class TrajectoryCalculator:
         Returns:
             Tuple of (optimal_launch_time, window_duration) in seconds
         """
-        if departure_body not in CELESTIAL_BODIES or target_body not in CELESTIAL_BODIES:
+        dep_data = CELESTIAL_BODIES.get(departure_body)
+        tgt_data = CELESTIAL_BODIES.get(target_body)
+        if dep_data is None or tgt_data is None:
             raise ValueError("Unsupported celestial body")
         
-        dep_data = CELESTIAL_BODIES[departure_body]
-        tgt_data = CELESTIAL_BODIES[target_body]
-        
         # Synodic period calculation
         if dep_data['orbital_period'] != tgt_data['orbital_period']:
             synodic_period = abs(1 / (1/dep_data['orbital_period'] - 1/tgt_data['orbital_period']))
@@ -5,7 +5,8 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy.engine import Row
 
 from ..models.mission import (
     Mission as MissionModel,
@@ -21,9 +22,18 @@ from ..models.mission import (
 )
 
 
+# Requests are validated once and never mutated; unknown fields are rejected
+_REQUEST_CONFIG = ConfigDict(extra='forbid', frozen=True)
+
+# Responses are built from domain models by attribute access
+_RESPONSE_CONFIG = ConfigDict(from_attributes=True, extra='forbid', frozen=True)
+
+
 # Request schemas
 class MissionCreateRequest(BaseModel):
     """Request schema for creating a new mission."""
+    model_config = _REQUEST_CONFIG
+    
     name: str = Field(..., min_length=1, max_length=200)
     description: str = Field(..., min_length=1, max_length=2000)
     objectives: List[str] = Field(..., min_length=1, max_length=10)
@@ -37,6 +47,8 @@ class MissionCreateRequest(BaseModel):
 
 class MissionUpdateRequest(BaseModel):
     """Request schema for updating an existing mission."""
+    model_config = _REQUEST_CONFIG
+    
     name: Optional[str] = Field(None, min_length=1, max_length=200)
     description: Optional[str] = Field(None, min_length=1, max_length=2000)
     objectives: Optional[List[str]] = Field(None, min_length=1, max_length=10)
@@ -50,6 +62,8 @@ class MissionUpdateRequest(BaseModel):
 
 class MissionGenerateRequest(BaseModel):
     """Request schema for AI-powered mission generation."""
+    model_config = _REQUEST_CONFIG
+    
     prompt: str = Field(..., min_length=10, max_length=1000)
     user_id: Optional[str] = Field(None, max_length=100)
     provider_preference: Optional[str] = Field(None, pattern="^(claude|openai|groq)$")
@@ -59,6 +73,8 @@ class MissionGenerateRequest(BaseModel):
 
 class SimulationRequest(BaseModel):
     """Request schema for mission simulation."""
+    model_config = _REQUEST_CONFIG
+    
     mission_id: UUID
     simulation_parameters: Optional[Dict[str, Any]] = Field(default_factory=dict)
     include_detailed_results: bool = Field(default=True)
@@ -66,6 +82,8 @@ class SimulationRequest(BaseModel):
 
 class OptimizationRequest(BaseModel):
     """Request schema for mission optimization."""
+    model_config = _REQUEST_CONFIG
+    
     mission_id: UUID
     optimization_type: str = Field(..., pattern="^(genetic_algorithm|gradient_descent)$")
     objectives: List[str] = Field(..., min_length=1, max_length=5)
@@ -76,6 +94,8 @@ class OptimizationRequest(BaseModel):
 # Response schemas
 class MissionResponse(BaseModel):
     """Response schema for mission data."""
+    model_config = _RESPONSE_CONFIG
+    
     id: UUID
     name: str
     description: str
@@ -94,26 +114,13 @@ class MissionResponse(BaseModel):
     @classmethod
     def from_model(cls, mission: MissionModel) -> "MissionResponse":
         """Create response from mission model."""
-        return cls(
-            id=mission.id,
-            name=mission.name,
-            description=mission.description,
-            objectives=mission.objectives,
-            spacecraft_config=mission.spacecraft_config,
-            trajectory=mission.trajectory,
-            timeline=mission.timeline,
-            constraints=mission.constraints,
-            created_at=mission.created_at,
-            updated_at=mission.updated_at,
-            user_id=mission.user_id,
-            is_public=mission.is_public,
-            difficulty_rating=mission.difficulty_rating,
-            latest_simulation=mission.latest_simulation
-        )
+        return cls.model_validate(mission)
 
 
 class MissionSummaryResponse(BaseModel):
     """Response schema for mission summary (used in lists)."""
+    model_config = _RESPONSE_CONFIG
+    
     id: UUID
     name: str
     description: str
@@ -146,20 +153,30 @@ class MissionSummaryResponse(BaseModel):
             difficulty_rating=mission.difficulty_rating,
             has_simulation_results=mission.latest_simulation is not None
         )
+    
+    @classmethod
+    def from_row(cls, row: Row) -> "MissionSummaryResponse":
+        """Create summary response from a row of labelled summary columns."""
+        return cls.model_validate(row)
 
 
 class MissionListResponse(BaseModel):
     """Response schema for paginated mission lists."""
+    model_config = _RESPONSE_CONFIG
+    
     missions: List[MissionSummaryResponse]
-    total_count: int
+    total_count: Optional[int]  # None on pages fetched with a cursor
     page: int
     page_size: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
 
 
 class SimulationResponse(BaseModel):
     """Response schema for simulation results."""
+    model_config = _RESPONSE_CONFIG
+    
     simulation_id: UUID
     mission_id: UUID
     success_probability: float
@@ -176,24 +193,13 @@ class SimulationResponse(BaseModel):
     @classmethod
     def from_model(cls, result: SimulationResultModel) -> "SimulationResponse":
         """Create response from simulation result model."""
-        return cls(
-            simulation_id=result.simulation_id,
-            mission_id=result.mission_id,
-            success_probability=result.success_probability,
-            total_duration_days=result.total_duration_days,
-            fuel_consumption_kg=result.fuel_consumption_kg,
-            cost_estimate_usd=result.cost_estimate_usd,
-            risk_factors=result.risk_factors,
-            performance_metrics=result.performance_metrics,
-            simulation_timestamp=result.simulation_timestamp,
-            trajectory_data=result.trajectory_data,
-            fuel_usage_timeline=result.fuel_usage_timeline,
-            system_performance=result.system_performance
-        )
+        return cls.model_validate(result)
 
 
 class OptimizationResponse(BaseModel):
     """Response schema for optimization results."""
+    model_config = _RESPONSE_CONFIG
+    
     job_id: UUID
     mission_id: UUID
     status: str
@@ -207,6 +213,8 @@ class OptimizationResponse(BaseModel):
 
 class MissionGenerationResponse(BaseModel):
     """Response schema for AI-generated missions."""
+    model_config = _RESPONSE_CONFIG
+    
     mission: MissionResponse
     alternatives: Optional[List[MissionSummaryResponse]] = None
     generation_metadata: Dict[str, Any] = Field(default_factory=dict)
@@ -214,6 +222,8 @@ class MissionGenerationResponse(BaseModel):
 
 class ErrorResponse(BaseModel):
     """Standard error response schema."""
+    model_config = _RESPONSE_CONFIG
+    
     error_code: str
     message: str
     details: Optional[Dict[str, Any]] = None
@@ -1,15 +1,63 @@
 """
 Pydantic schemas for vehicle preset API endpoints.
 """
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple, cast
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.mission import SpacecraftConfig, VehicleType
 from app.models.database import VehiclePreset
 
+# Response models are built once per row and never mutated afterwards
+_RESPONSE_CONFIG = ConfigDict(frozen=True, extra='ignore')
+
+
+def _spacecraft_config_from_db(configuration: Dict[str, Any]) -> SpacecraftConfig:
+    """Build a SpacecraftConfig from stored JSON without re-running validation.
+    
+    Configurations are validated when a preset is written, so rows read back
+    from the database are trusted. Only the enum field needs coercing.
+    """
+    return SpacecraftConfig.model_construct(
+        **{**configuration, "vehicle_type": VehicleType(configuration["vehicle_type"])}
+    )
+
+
+# Built configs keyed by (preset id, updated_at); any write bumps updated_at
+_SPACECRAFT_CONFIG_CACHE_SIZE = 1024
+_spacecraft_config_cache: "OrderedDict[Tuple[UUID, datetime], SpacecraftConfig]" = OrderedDict()
+
+
+def _spacecraft_config_for(preset: VehiclePreset) -> SpacecraftConfig:
+    """Return the preset's SpacecraftConfig, reusing the parsed config while the row is unchanged.
+    
+    SpacecraftConfig is mutable and callers edit it in place, so every call
+    gets its own copy; the cached instance never leaves this module.
+    """
+    # Loaded instance values, not the Column objects mypy sees on the class
+    preset_id = cast(Optional[UUID], preset.id)
+    updated_at = cast(Optional[datetime], preset.updated_at)
+    configuration = cast(Dict[str, Any], preset.configuration)
+    
+    if preset_id is None or updated_at is None:
+        return _spacecraft_config_from_db(configuration)
+    
+    key = (preset_id, updated_at)
+    config = _spacecraft_config_cache.get(key)
+    if config is not None:
+        _spacecraft_config_cache.move_to_end(key)
+        return config.model_copy()
+    
+    config = _spacecraft_config_from_db(configuration)
+    _spacecraft_config_cache[key] = config
+    if len(_spacecraft_config_cache) > _SPACECRAFT_CONFIG_CACHE_SIZE:
+        _spacecraft_config_cache.popitem(last=False)
+    
+    return config.model_copy()
+
 
 class VehiclePresetCreate(BaseModel):
     """Schema for creating a vehicle preset."""
@@ -30,6 +78,8 @@ class VehiclePresetUpdate(BaseModel):
 
 class VehiclePresetResponse(BaseModel):
     """Schema for vehicle preset response."""
+    model_config = _RESPONSE_CONFIG
+    
     id: UUID = Field(..., description="Preset unique identifier")
     name: str = Field(..., description="Preset name")
     description: Optional[str] = Field(None, description="Preset description")
@@ -47,13 +97,13 @@ class VehiclePresetResponse(BaseModel):
     
     @classmethod
     def from_db_model(cls, preset: VehiclePreset) -> "VehiclePresetResponse":
-        """Create response model from database model."""
-        return cls(
+        """Create response model from database model (trusted, so unvalidated)."""
+        return cls.model_construct(
             id=preset.id,
             name=preset.name,
             description=preset.description,
             vehicle_type=VehicleType(preset.vehicle_type),
-            spacecraft_config=SpacecraftConfig(**preset.configuration),
+            spacecraft_config=_spacecraft_config_for(preset),
             is_public=preset.is_public,
             created_at=preset.created_at,
             updated_at=preset.updated_at,
@@ -66,14 +116,34 @@ class VehiclePresetResponse(BaseModel):
 
 class VehiclePresetListResponse(BaseModel):
     """Schema for vehicle preset list response."""
+    model_config = _RESPONSE_CONFIG
+    
     presets: List[VehiclePresetResponse] = Field(..., description="List of vehicle presets")
     total: int = Field(..., description="Total number of presets returned")
     limit: int = Field(..., description="Maximum number of presets requested")
     offset: int = Field(..., description="Number of presets skipped")
+    
+    @classmethod
+    def from_db_models(
+        cls,
+        presets: List[VehiclePreset],
+        limit: int,
+        offset: int
+    ) -> "VehiclePresetListResponse":
+        """Create list response from database models (trusted, so unvalidated)."""
+        preset_responses = [VehiclePresetResponse.from_db_model(preset) for preset in presets]
+        return cls.model_construct(
+            presets=preset_responses,
+            total=len(preset_responses),
+            limit=limit,
+            offset=offset
+        )
 
 
 class VehiclePresetSummary(BaseModel):
     """Schema for vehicle preset summary (lightweight)."""
+    model_config = _RESPONSE_CONFIG
+    
     id: UUID = Field(..., description="Preset unique identifier")
     name: str = Field(..., description="Preset name")
     vehicle_type: VehicleType = Field(..., description="Vehicle type")
@@ -83,8 +153,8 @@ class VehiclePresetSummary(BaseModel):
     
     @classmethod
     def from_db_model(cls, preset: VehiclePreset) -> "VehiclePresetSummary":
-        """Create summary model from database model."""
-        return cls(
+        """Create summary model from database model (trusted, so unvalidated)."""
+        return cls.model_construct(
             id=preset.id,
             name=preset.name,
             vehicle_type=VehicleType(preset.vehicle_type),
@@ -96,6 +166,8 @@ class VehiclePresetSummary(BaseModel):
 
 class VehicleTypeStats(BaseModel):
     """Schema for vehicle type statistics."""
+    model_config = _RESPONSE_CONFIG
+    
     vehicle_type: VehicleType = Field(..., description="Vehicle type")
     count: int = Field(..., description="Number of presets of this type")
     avg_mass_kg: float = Field(..., description="Average mass in kg")
@@ -105,6 +177,8 @@ class VehicleTypeStats(BaseModel):
 
 class VehiclePresetStatsResponse(BaseModel):
     """Schema for vehicle preset statistics response."""
+    model_config = _RESPONSE_CONFIG
+    
     total_presets: int = Field(..., description="Total number of presets")
     public_presets: int = Field(..., description="Number of public presets")
     private_presets: int = Field(..., description="Number of private presets")
@@ -1,26 +1,64 @@
 """
 Authentication service for Supabase integration and session management.
 """
+import base64
+import hashlib
+import hmac
+import json
 import logging
+import time
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from uuid import UUID, uuid4
 import secrets
+import threading
 
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import JSON, Update, select, insert, update, delete, and_, cast, func, lambda_stmt
+from sqlalchemy.dialects.postgresql import JSONB
 try:
-    from supabase import create_client, Client
+    import httpx
+    from supabase import create_client, Client, ClientOptions
     try:
-        from gotrue.errors import AuthError
+        from gotrue.errors import AuthError, AuthRetryableError
     except ImportError:
-        # Fallback for different supabase versions
-        from supabase.lib.client_options import ClientOptions
-        AuthError = Exception
+        try:
+            # supabase>=2.8 ships the auth client as supabase_auth
+            from supabase_auth.errors import AuthError, AuthRetryableError
+        except ImportError:
+            # Fallback for different supabase versions
+            from supabase.lib.client_options import ClientOptions
+            AuthError = Exception
+            AuthRetryableError = ()
     SUPABASE_AVAILABLE = True
 except ImportError:
     SUPABASE_AVAILABLE = False
     AuthError = Exception  # Fallback for type hints
+    AuthRetryableError = ()
+
+try:
+    import jwt
+    from jwt import PyJWKClient
+    from jwt.exceptions import (
+        ExpiredSignatureError,
+        ImmatureSignatureError,
+        InvalidTokenError,
+        PyJWKClientError
+    )
+    JWKS_AVAILABLE = True
+except ImportError:
+    JWKS_AVAILABLE = False
+
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
 
 from ..core.config import settings
 from ..models.database import UserSession as DBUserSession
@@ -33,36 +71,579 @@ class AuthenticationError(Exception):
     pass
 
 
-class AuthService:
-    """Service for handling authentication and session management."""
+class _TransientVerificationError(Exception):
+    """Token verification could not complete; the outcome must not be cached."""
+    pass
+
+
+class _TokenCache:
+    """
+    Bounded LRU cache of JWT verification outcomes keyed by token hash.
     
-    def __init__(self, db_session: AsyncSession):
-        """Initialize auth service with database session."""
-        self.db = db_session
-        self.supabase_client = None
+    Entries expire at the earlier of the token's own ``exp`` claim and the
+    configured TTL, so a revoked or expired token is never trusted for longer
+    than ``ttl_seconds``.
+    """
+    
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    
+    @staticmethod
+    def key_for(token: str) -> bytes:
+        """Hash a token so raw credentials are never held as dict keys.
+        
+        A 128-bit BLAKE2b digest is collision-safe at cache scale and cheaper
+        than SHA-256 on the per-request path.
+        """
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+    
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached payload, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, payload = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
         
-        # Initialize Supabase client if credentials are available
-        if SUPABASE_AVAILABLE and settings.SUPABASE_URL and settings.SUPABASE_ANON_KEY:
+        self._entries.move_to_end(key)
+        return dict(payload)
+    
+    def put(self, key: bytes, payload: Dict[str, Any]) -> None:
+        """Store a verified payload, evicting the least recently used entry when full."""
+        if self.ttl_seconds <= 0 or self.maxsize <= 0:
+            return
+        
+        expires_at = time.time() + self.ttl_seconds
+        token_exp = payload.get("exp")
+        if isinstance(token_exp, (int, float)):
+            expires_at = min(expires_at, float(token_exp))
+        
+        self._entries[key] = (expires_at, dict(payload))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+# Shared across AuthService instances, which are created per request
+_verified_tokens = _TokenCache(
+    maxsize=settings.JWT_CACHE_MAX_SIZE,
+    ttl_seconds=settings.JWT_CACHE_TTL_SECONDS
+)
+
+# Recently rejected tokens, so replayed bad tokens never reach Supabase
+_rejected_tokens = _TokenCache(
+    maxsize=settings.JWT_NEGATIVE_CACHE_MAX_SIZE,
+    ttl_seconds=settings.JWT_NEGATIVE_CACHE_TTL_SECONDS
+)
+
+# Payloads verified during the current request, keyed by the raw token. Only
+# populated inside open_request_token_scope(), so tokens never outlive it.
+_request_verified_tokens: ContextVar[Optional[Dict[str, Dict[str, Any]]]] = ContextVar(
+    "_request_verified_tokens", default=None
+)
+
+
+def open_request_token_scope() -> Token:
+    """
+    Start remembering verified JWT payloads for the current request.
+    
+    Repeat verifications of the same token within the request (middleware,
+    dependencies, services) then skip hashing and the shared caches.
+    
+    Returns:
+        Token to pass to ``close_request_token_scope``
+    """
+    return _request_verified_tokens.set({})
+
+
+def close_request_token_scope(scope_token: Token) -> None:
+    """Forget the payloads remembered since ``open_request_token_scope``."""
+    _request_verified_tokens.reset(scope_token)
+
+
+_supabase_client: Optional["Client"] = None
+_supabase_client_lock = threading.Lock()
+
+
+def get_supabase_client() -> Optional["Client"]:
+    """
+    Return the process-wide Supabase client, creating it on first use.
+    
+    AuthService is instantiated per request, so sharing one client keeps its
+    HTTP connection pool and TLS sessions alive across requests.
+    
+    Returns:
+        Shared Supabase client, or None if Supabase is unavailable or unconfigured
+    """
+    global _supabase_client
+    
+    if _supabase_client is not None:
+        return _supabase_client
+    
+    if not (SUPABASE_AVAILABLE and settings.SUPABASE_URL and settings.SUPABASE_ANON_KEY):
+        return None
+    
+    with _supabase_client_lock:
+        if _supabase_client is None:
             try:
-                self.supabase_client = create_client(
+                _supabase_client = create_client(
                     settings.SUPABASE_URL,
-                    settings.SUPABASE_ANON_KEY
+                    settings.SUPABASE_ANON_KEY,
+                    options=_supabase_client_options()
                 )
             except Exception as e:
                 logger.warning(f"Failed to initialize Supabase client: {e}")
-        elif not SUPABASE_AVAILABLE:
+    
+    return _supabase_client
+
+
+def _supabase_client_options() -> Optional["ClientOptions"]:
+    """
+    Options for the shared server-side Supabase client.
+    
+    The client only verifies bearer tokens, so it never holds a user session
+    of its own, and its HTTP pool is sized for concurrent verifications.
+    
+    Returns:
+        Client options, or None if this supabase-py cannot take an HTTP client
+    """
+    try:
+        return ClientOptions(
+            auto_refresh_token=False,
+            persist_session=False,
+            httpx_client=httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=settings.SUPABASE_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.SUPABASE_HTTP_MAX_KEEPALIVE_CONNECTIONS
+                )
+            )
+        )
+    except TypeError:
+        return None
+
+
+def _generate_session_token() -> str:
+    """Generate an unpadded URL-safe session token from 32 random bytes."""
+    return base64.urlsafe_b64encode(secrets.token_bytes(32)).rstrip(b"=").decode("ascii")
+
+
+def _session_token_hash(session_token: str) -> int:
+    """First 8 bytes of the token's SHA-256 as a signed 64-bit integer.
+    
+    Sessions are looked up through a compact BIGINT index on this value; the
+    full token is still compared so a hash collision can never match.
+    """
+    return int.from_bytes(hashlib.sha256(session_token.encode()).digest()[:8], "big", signed=True)
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _decode_jwt_unsafe(token: str) -> Optional[Dict[str, Any]]:
+    """Decode a JWT's claims without verifying its signature.
+    
+    Only use this for tokens whose authenticity is established separately.
+    
+    Args:
+        token: Encoded JWT
+        
+    Returns:
+        Claims dict, or None if the token is malformed
+    """
+    try:
+        _, payload_b64, _ = token.split(".", 2)
+        claims = json.loads(_b64url_decode(payload_b64))
+    except (ValueError, TypeError):
+        return None
+    
+    return claims if isinstance(claims, dict) else None
+
+
+# Supabase signs access tokens with either RSA or ECDSA project keys
+_JWKS_ALGORITHMS = ["RS256", "ES256"]
+
+
+@lru_cache(maxsize=1)
+def _get_jwks_client(jwks_url: str) -> "PyJWKClient":
+    """Return a process-wide JWKS client; signing keys are fetched once and cached."""
+    return PyJWKClient(jwks_url, cache_keys=True, lifespan=settings.JWKS_CACHE_LIFESPAN_SECONDS)
+
+
+def _verify_hs256(token: str, secret: str) -> Dict[str, Any]:
+    """
+    Verify an HS256 JWT with a direct HMAC check.
+    
+    Matches ``jwt.decode(..., algorithms=["HS256"])`` with audience checks
+    disabled, without PyJWT's generic algorithm and claim dispatch.
+    
+    Args:
+        token: Encoded JWT
+        secret: Shared signing secret
+        
+    Returns:
+        Token claims
+        
+    Raises:
+        ExpiredSignatureError: If the token has expired
+        InvalidTokenError: If the token is malformed, not HS256, marks a
+            critical extension, is wrongly signed or is not yet valid
+    """
+    try:
+        signing_input, signature_b64 = token.rsplit(".", 1)
+        header_b64, payload_b64 = signing_input.split(".")
+        header = json.loads(_b64url_decode(header_b64))
+        signature = _b64url_decode(signature_b64)
+    except (ValueError, TypeError) as e:
+        raise InvalidTokenError(f"Malformed token: {e}") from e
+    
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise InvalidTokenError("The specified alg value is not allowed")
+    if "crit" in header:
+        # No critical extensions are understood, so none can be honoured
+        raise InvalidTokenError("Unsupported critical extension")
+    
+    expected = hmac.new(secret.encode(), signing_input.encode(), hashlib.sha256).digest()
+    if not hmac.compare_digest(expected, signature):
+        raise InvalidTokenError("Signature verification failed")
+    
+    try:
+        claims = json.loads(_b64url_decode(payload_b64))
+    except ValueError as e:
+        raise InvalidTokenError(f"Invalid payload: {e}") from e
+    
+    if not isinstance(claims, dict):
+        raise InvalidTokenError("Invalid payload: not a JSON object")
+    
+    now = time.time()
+    for claim in ("exp", "nbf", "iat"):
+        if claim in claims and not isinstance(claims[claim], (int, float)):
+            raise InvalidTokenError(f"The {claim} claim must be a number")
+    
+    if "exp" in claims and claims["exp"] <= now:
+        raise ExpiredSignatureError("Signature has expired")
+    if "nbf" in claims and claims["nbf"] > now:
+        raise ImmatureSignatureError("The token is not yet valid (nbf)")
+    if "iat" in claims and claims["iat"] > now:
+        raise ImmatureSignatureError("The token is not yet valid (iat)")
+    
+    return claims
+
+
+@lru_cache(maxsize=4)
+def _get_secret_jwk(secret: str, algorithm: str) -> "jwt.PyJWK":
+    """Return the shared-secret signing key, parsed once per secret and algorithm."""
+    encoded = base64.urlsafe_b64encode(secret.encode()).rstrip(b"=").decode("ascii")
+    return jwt.PyJWK({"kty": "oct", "k": encoded}, algorithm)
+
+
+class _RedisSessionCache:
+    """
+    Redis read-through cache of active sessions keyed by token hash.
+    
+    Raw tokens are never written to Redis, so its contents cannot be replayed
+    as credentials. Postgres remains the source of truth. Entries never outlive the session's
+    ``expires_at`` and are dropped whenever a session is revoked, rotated or
+    edited. Redis errors are logged and treated as cache misses.
+    """
+    
+    def __init__(self, client: Any, ttl_seconds: int):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+    
+    @staticmethod
+    def _token_hash(session_token: str) -> str:
+        return _TokenCache.key_for(session_token).hex()
+    
+    @staticmethod
+    def _key(token_hash: str) -> str:
+        return f"sess:{token_hash}"
+    
+    @staticmethod
+    def _user_key(user_id: str) -> str:
+        return f"user_sess:{user_id}"
+    
+    async def get(self, session_token: str) -> Optional[DBUserSession]:
+        """Return a detached session built from the cached entry, if any."""
+        try:
+            raw = await self.client.get(self._key(self._token_hash(session_token)))
+        except Exception as e:
+            logger.warning(f"Session cache read failed: {e}")
+            return None
+        
+        if raw is None:
+            return None
+        
+        data = json.loads(raw)
+        return DBUserSession(
+            id=UUID(data["id"]) if data["id"] else None,
+            session_token=session_token,
+            user_id=data["user_id"],
+            email=data["email"],
+            expires_at=datetime.fromisoformat(data["expires_at"]),
+            last_accessed=datetime.fromisoformat(data["last_accessed"]) if data["last_accessed"] else None,
+            is_active=True,
+            preferences=data["preferences"]
+        )
+    
+    async def set(self, session: DBUserSession) -> None:
+        """Cache an active session until the earlier of its expiry and the TTL."""
+        if self.ttl_seconds <= 0 or session.expires_at is None:
+            return
+        
+        ttl = min(self.ttl_seconds, int((session.expires_at - datetime.now()).total_seconds()))
+        if ttl <= 0:
+            return
+        
+        payload = json.dumps({
+            "id": str(session.id) if session.id else None,
+            "user_id": session.user_id,
+            "email": session.email,
+            "expires_at": session.expires_at.isoformat(),
+            "last_accessed": session.last_accessed.isoformat() if session.last_accessed else None,
+            "preferences": session.preferences or {}
+        })
+        
+        token_hash = self._token_hash(session.session_token)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.setex(self._key(token_hash), ttl, payload)
+            if session.user_id:
+                # Index token hashes per user so revoking every session can evict them
+                pipe.sadd(self._user_key(session.user_id), token_hash)
+                pipe.expire(self._user_key(session.user_id), self.ttl_seconds)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Session cache write failed: {e}")
+    
+    async def delete(self, *session_tokens: str) -> None:
+        """Evict sessions by token."""
+        try:
+            await self.client.delete(*(self._key(self._token_hash(token)) for token in session_tokens))
+        except Exception as e:
+            logger.warning(f"Session cache eviction failed: {e}")
+    
+    async def delete_user(self, user_id: str) -> None:
+        """Evict every cached session belonging to a user."""
+        try:
+            user_key = self._user_key(user_id)
+            token_hashes = await self.client.smembers(user_key)
+            await self.client.delete(user_key, *(self._key(token_hash) for token_hash in token_hashes))
+        except Exception as e:
+            logger.warning(f"Session cache eviction failed: {e}")
+
+
+@lru_cache(maxsize=1)
+def _get_session_cache(redis_url: str) -> _RedisSessionCache:
+    """Return a process-wide session cache sharing one Redis connection pool."""
+    return _RedisSessionCache(
+        redis_asyncio.from_url(redis_url, decode_responses=True),
+        settings.SESSION_CACHE_TTL_SECONDS
+    )
+
+
+class _LocalSessionCache:
+    """
+    In-process session cache used when Redis is not configured.
+    
+    Stores plain snapshots of the fields callers read rather than ORM objects,
+    keyed by token hash, and hands out a fresh detached session on every hit.
+    Has the same async interface as ``_RedisSessionCache``.
+    """
+    
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._user_keys: Dict[str, set] = {}
+    
+    async def get(self, session_token: str) -> Optional[DBUserSession]:
+        """Return a detached session built from the cached snapshot, if any."""
+        key = _TokenCache.key_for(session_token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        cached_until, data = entry
+        if cached_until <= time.time() or data["expires_at"] <= datetime.now():
+            self._evict(key)
+            return None
+        
+        self._entries.move_to_end(key)
+        return DBUserSession(
+            id=data["id"],
+            session_token=session_token,
+            user_id=data["user_id"],
+            email=data["email"],
+            expires_at=data["expires_at"],
+            last_accessed=data["last_accessed"],
+            is_active=True,
+            preferences=dict(data["preferences"])
+        )
+    
+    async def set(self, session: DBUserSession) -> None:
+        """Cache an active session until the earlier of its expiry and the TTL."""
+        if self.ttl_seconds <= 0 or self.maxsize <= 0 or session.expires_at is None:
+            return
+        
+        key = _TokenCache.key_for(session.session_token)
+        self._evict(key)
+        self._entries[key] = (time.time() + self.ttl_seconds, {
+            "id": session.id,
+            "user_id": session.user_id,
+            "email": session.email,
+            "expires_at": session.expires_at,
+            "last_accessed": session.last_accessed,
+            "preferences": dict(session.preferences or {})
+        })
+        if session.user_id:
+            self._user_keys.setdefault(session.user_id, set()).add(key)
+        
+        while len(self._entries) > self.maxsize:
+            self._evict(next(iter(self._entries)))
+    
+    async def delete(self, *session_tokens: str) -> None:
+        """Evict sessions by token."""
+        for token in session_tokens:
+            self._evict(_TokenCache.key_for(token))
+    
+    async def delete_user(self, user_id: str) -> None:
+        """Evict every cached session belonging to a user."""
+        for key in self._user_keys.pop(user_id, ()):
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop all cached sessions."""
+        self._entries.clear()
+        self._user_keys.clear()
+    
+    def _evict(self, key: bytes) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        
+        user_id = entry[1]["user_id"]
+        keys = self._user_keys.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._user_keys[user_id]
+
+
+_local_session_cache = _LocalSessionCache(
+    maxsize=settings.SESSION_LOCAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.SESSION_LOCAL_CACHE_TTL_SECONDS
+)
+
+
+class AuthService:
+    """Service for handling authentication and session management."""
+    
+    def __init__(self, db_session: AsyncSession):
+        """Initialize auth service with database session."""
+        self.db = db_session
+        
+        # Shared Supabase client if credentials are available
+        self.supabase_client = get_supabase_client()
+        if not SUPABASE_AVAILABLE:
             logger.warning("Supabase client not available - install supabase-py for full authentication support")
+        
+        # Verify tokens locally against the project's published signing keys
+        self.jwks_client = None
+        if JWKS_AVAILABLE and settings.SUPABASE_URL:
+            self.jwks_client = _get_jwks_client(
+                f"{settings.SUPABASE_URL.rstrip('/')}/auth/v1/.well-known/jwks.json"
+            )
+        
+        # Serve hot session lookups from Redis when configured, otherwise
+        # from a short-lived per-process cache
+        self.session_cache = None
+        if REDIS_AVAILABLE and settings.REDIS_URL:
+            self.session_cache = _get_session_cache(settings.REDIS_URL)
+        elif settings.SESSION_LOCAL_CACHE_TTL_SECONDS > 0:
+            self.session_cache = _local_session_cache
     
-    async def verify_jwt_token(self, token: str) -> Optional[Dict[str, Any]]:
+    async def verify_jwt_token(self, token: str, strict: bool = False) -> Optional[Dict[str, Any]]:
         """
         Verify JWT token from Supabase.
         
+        Outcomes are cached briefly by token hash so repeated requests with
+        the same bearer token skip the Supabase round-trip. Rejections are
+        remembered too, except when verification failed for transient reasons.
+        
+        Args:
+            token: JWT token to verify
+            strict: Ask Supabase whether the token is still valid instead of
+                trusting a cached or locally verified result, for operations
+                that must respect server-side revocation
+            
+        Returns:
+            Token payload if valid, None otherwise
+        """
+        request_scope = _request_verified_tokens.get()
+        if not strict and request_scope is not None and token in request_scope:
+            return dict(request_scope[token])
+        
+        cache_key = _TokenCache.key_for(token)
+        if not strict:
+            cached = _verified_tokens.get(cache_key)
+            if cached is not None:
+                if request_scope is not None:
+                    request_scope[token] = dict(cached)
+                return cached
+        
+        if _rejected_tokens.get(cache_key) is not None:
+            return None
+        
+        try:
+            payload = await self._verify_jwt_uncached(token, strict=strict)
+        except _TransientVerificationError:
+            return None
+        
+        if payload is not None:
+            _verified_tokens.put(cache_key, payload)
+            if request_scope is not None:
+                request_scope[token] = dict(payload)
+        else:
+            _rejected_tokens.put(cache_key, {})
+        
+        return payload
+    
+    async def _verify_jwt_uncached(self, token: str, strict: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Verify JWT token without consulting the verification cache.
+        
+        Tokens are verified offline against the project JWKS when possible;
+        Supabase introspection is used when no signing key can be resolved,
+        or always in strict mode.
+        
         Args:
             token: JWT token to verify
+            strict: Skip offline verification and introspect with Supabase
             
         Returns:
             Token payload if valid, None otherwise
+            
+        Raises:
+            _TransientVerificationError: If verification failed unexpectedly
         """
+        if self.jwks_client is not None and not strict and self._has_jwks_header(token):
+            try:
+                return self._verify_jwt_offline(token)
+            except PyJWKClientError as e:
+                # No matching key or JWKS unreachable; let Supabase decide
+                logger.warning(f"JWKS verification unavailable, falling back to Supabase: {e}")
+        
         try:
             if not self.supabase_client:
                 logger.warning("Supabase client not initialized")
@@ -73,22 +654,87 @@ class AuthService:
             user = self.supabase_client.auth.get_user(token)
             
             if user and user.user:
+                # Supabase vouched for the token, so its exp claim can be trusted
+                # to bound how long the cached verification stays valid
+                claims = _decode_jwt_unsafe(token) or {}
                 return {
                     "user_id": user.user.id,
                     "email": user.user.email,
                     "metadata": user.user.user_metadata or {},
                     "aud": user.user.aud,
-                    "role": user.user.role
+                    "role": user.user.role,
+                    "exp": claims.get("exp")
                 }
             
             return None
             
+        except AuthRetryableError as e:
+            logger.warning(f"JWT token verification unavailable: {e}")
+            raise _TransientVerificationError(str(e)) from e
         except AuthError as e:
             logger.warning(f"JWT token verification failed: {e}")
             return None
         except Exception as e:
             logger.error(f"Unexpected error verifying JWT token: {e}")
+            raise _TransientVerificationError(str(e)) from e
+    
+    @staticmethod
+    def _has_jwks_header(token: str) -> bool:
+        """
+        Check whether a token could be signed by a JWKS key.
+        
+        Opaque session tokens and kid-less HS256 tokens are skipped so they
+        never trigger a JWKS refetch looking for a key that cannot exist.
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+        except InvalidTokenError:
+            return False
+        
+        return bool(header.get("kid")) and header.get("alg") in _JWKS_ALGORITHMS
+    
+    def _verify_jwt_offline(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Verify JWT signature and claims locally using the cached JWKS.
+        
+        Args:
+            token: JWT token to verify
+            
+        Returns:
+            Token payload if valid, None otherwise
+            
+        Raises:
+            PyJWKClientError: If no signing key could be resolved for the token
+        """
+        try:
+            signing_key = self.jwks_client.get_signing_key_from_jwt(token)
+        except InvalidTokenError as e:
+            logger.warning(f"JWT token verification failed: {e}")
+            return None
+        
+        try:
+            payload = jwt.decode(
+                token,
+                signing_key.key,
+                algorithms=_JWKS_ALGORITHMS,
+                audience=settings.SUPABASE_JWT_AUDIENCE
+            )
+        except InvalidTokenError as e:
+            logger.warning(f"JWT token verification failed: {e}")
             return None
+        
+        if "sub" not in payload:
+            return None
+        
+        return {
+            "user_id": payload["sub"],
+            "email": payload.get("email"),
+            "metadata": payload.get("user_metadata", {}),
+            "aud": payload.get("aud"),
+            "role": payload.get("role", "authenticated"),
+            "exp": payload.get("exp"),
+            "iat": payload.get("iat")
+        }
     
     async def _verify_jwt_fallback(self, token: str) -> Optional[Dict[str, Any]]:
         """
@@ -107,12 +753,16 @@ class AuthService:
             # Try with JWT secret if available
             if settings.JWT_SECRET_KEY:
                 try:
-                    payload = jwt.decode(
-                        token,
-                        settings.JWT_SECRET_KEY,
-                        algorithms=[settings.JWT_ALGORITHM],
-                        options={"verify_aud": False}  # Supabase uses different audience validation
-                    )
+                    if settings.JWT_ALGORITHM == "HS256":
+                        # Supabase's default; verified with a direct HMAC check
+                        payload = _verify_hs256(token, settings.JWT_SECRET_KEY)
+                    else:
+                        payload = jwt.decode(
+                            token,
+                            _get_secret_jwk(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM),
+                            algorithms=[settings.JWT_ALGORITHM],
+                            options={"verify_aud": False}  # Supabase uses different audience validation
+                        )
                     
                     # Validate required fields
                     if "sub" in payload:
@@ -134,21 +784,18 @@ class AuthService:
             
             # For development/testing, allow unverified tokens
             if settings.ENVIRONMENT == "development":
-                try:
-                    # Decode without verification (for testing only)
-                    payload = jwt.decode(token, options={"verify_signature": False})
-                    
-                    # Basic validation of required fields
-                    if "sub" in payload:
-                        return {
-                            "user_id": payload["sub"],
-                            "email": payload.get("email"),
-                            "metadata": payload.get("user_metadata", {}),
-                            "aud": payload.get("aud"),
-                            "role": payload.get("role", "authenticated")
-                        }
-                except InvalidTokenError:
-                    pass
+                # Decode without verification (for testing only)
+                payload = _decode_jwt_unsafe(token)
+                
+                # Basic validation of required fields
+                if payload and "sub" in payload:
+                    return {
+                        "user_id": payload["sub"],
+                        "email": payload.get("email"),
+                        "metadata": payload.get("user_metadata", {}),
+                        "aud": payload.get("aud"),
+                        "role": payload.get("role", "authenticated")
+                    }
             
             return None
             
@@ -174,12 +821,13 @@ class AuthService:
         Returns:
             Session token
         """
+        session_token = _generate_session_token()
+        expires_at = datetime.now() + timedelta(days=30)  # 30-day anonymous sessions
+        
         try:
-            session_token = secrets.token_urlsafe(32)
-            expires_at = datetime.now() + timedelta(days=30)  # 30-day anonymous sessions
-            
             db_session = DBUserSession(
                 session_token=session_token,
+                token_hash=_session_token_hash(session_token),
                 user_id=None,  # Anonymous
                 email=email,
                 expires_at=expires_at,
@@ -218,25 +866,32 @@ class AuthService:
         Returns:
             Session token
         """
+        session_token = _generate_session_token()
+        expires_at = datetime.now() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        
         try:
-            session_token = secrets.token_urlsafe(32)
-            expires_at = datetime.now() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-            
-            # Deactivate any existing sessions for this user
-            await self._deactivate_user_sessions(user_id)
+            # Deactivate any existing sessions for this user and insert the new
+            # one in a single statement via a data-modifying CTE
+            deactivated = self._deactivate_user_sessions_stmt(user_id).returning(
+                DBUserSession.id
+            ).cte("deactivated_sessions")
             
-            db_session = DBUserSession(
+            stmt = insert(DBUserSession).values(
                 session_token=session_token,
+                token_hash=_session_token_hash(session_token),
                 user_id=user_id,
                 email=email,
                 expires_at=expires_at,
                 is_active=True,
                 preferences=preferences or {}
-            )
+            ).add_cte(deactivated)
             
-            self.db.add(db_session)
+            await self.db.execute(stmt)
             await self.db.commit()
             
+            if self.session_cache is not None:
+                await self.session_cache.delete_user(user_id)
+            
             logger.info(f"Created authenticated session for user {user_id}")
             
             return session_token
@@ -250,6 +905,35 @@ class AuthService:
         """
         Get session by token.
         
+        Session cache hits (Redis, or the per-process fallback) are returned
+        as detached session objects without touching the database.
+        
+        Args:
+            session_token: Session token
+            
+        Returns:
+            Session object if valid and active, None otherwise
+        """
+        if self.session_cache is not None:
+            cached = await self.session_cache.get(session_token)
+            if cached is not None:
+                return cached
+        
+        session = await self._load_session(session_token)
+        if session is not None and self.session_cache is not None:
+            await self.session_cache.set(session)
+        
+        return session
+    
+    async def _load_session(self, session_token: str) -> Optional[DBUserSession]:
+        """
+        Load a session from the database, bypassing the session cache.
+        
+        ``last_accessed`` is only written back once it is older than
+        ``SESSION_TOUCH_INTERVAL_SECONDS``, so most lookups are read-only.
+        The write re-checks staleness in SQL, so concurrent requests for the
+        same session touch the row at most once per interval.
+        
         Args:
             session_token: Session token
             
@@ -257,21 +941,32 @@ class AuthService:
             Session object if valid and active, None otherwise
         """
         try:
-            query = select(DBUserSession).where(
+            token_hash = _session_token_hash(session_token)
+            now = datetime.now()
+            query = lambda_stmt(lambda: select(DBUserSession).where(
                 and_(
+                    DBUserSession.token_hash == token_hash,
                     DBUserSession.session_token == session_token,
                     DBUserSession.is_active == True,
-                    DBUserSession.expires_at > datetime.now()
+                    DBUserSession.expires_at > now
                 )
-            )
+            ))
             
             result = await self.db.execute(query)
             session = result.scalar_one_or_none()
             
-            if session:
-                # Update last accessed time
-                session.last_accessed = datetime.now()
+            if session and self._is_touch_due(session, now):
+                # Update last accessed time, unless a concurrent request already did
+                session_id = session.id
+                touch_before = now - timedelta(seconds=settings.SESSION_TOUCH_INTERVAL_SECONDS)
+                await self.db.execute(lambda_stmt(lambda: update(DBUserSession).where(
+                    and_(
+                        DBUserSession.id == session_id,
+                        DBUserSession.last_accessed < touch_before
+                    )
+                ).values(last_accessed=now)))
                 await self.db.commit()
+                set_committed_value(session, "last_accessed", now)
             
             return session
             
@@ -279,36 +974,61 @@ class AuthService:
             logger.error(f"Failed to get session: {e}")
             return None
     
+    @staticmethod
+    def _is_touch_due(session: DBUserSession, now: datetime) -> bool:
+        """Whether a session's last_accessed is stale enough to write back."""
+        if session.last_accessed is None:
+            return True
+        return now - session.last_accessed >= timedelta(seconds=settings.SESSION_TOUCH_INTERVAL_SECONDS)
+    
     async def refresh_session(self, session_token: str) -> Optional[str]:
         """
         Refresh an existing session.
         
+        The token is rotated with one conditional ``UPDATE ... RETURNING``,
+        so an expired or revoked session is never refreshed.
+        
         Args:
             session_token: Current session token
             
         Returns:
             New session token if successful, None otherwise
         """
+        # Create new session token
+        new_token = _generate_session_token()
+        now = datetime.now()
+        new_expires_at = now + timedelta(
+            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
+        )
+        
         try:
-            session = await self.get_session(session_token)
-            
-            if not session:
-                return None
+            # Rotate the token on the live session
+            stmt = update(DBUserSession).where(
+                and_(
+                    DBUserSession.token_hash == _session_token_hash(session_token),
+                    DBUserSession.session_token == session_token,
+                    DBUserSession.is_active == True,
+                    DBUserSession.expires_at > now
+                )
+            ).values(
+                session_token=new_token,
+                token_hash=_session_token_hash(new_token),
+                expires_at=new_expires_at,
+                last_accessed=now
+            ).returning(DBUserSession.user_id)
             
-            # Create new session token
-            new_token = secrets.token_urlsafe(32)
-            new_expires_at = datetime.now() + timedelta(
-                minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-            )
+            result = await self.db.execute(stmt)
+            refreshed = result.first()
             
-            # Update session
-            session.session_token = new_token
-            session.expires_at = new_expires_at
-            session.last_accessed = datetime.now()
+            if refreshed is None:
+                return None
             
             await self.db.commit()
             
-            logger.info(f"Refreshed session for user {session.user_id or 'anonymous'}")
+            if self.session_cache is not None:
+                await self.session_cache.delete(session_token)
+            
+            logger.info(f"Refreshed session for user {refreshed.user_id or 'anonymous'}")
             
             return new_token
             
@@ -328,21 +1048,28 @@ class AuthService:
             True if revoked successfully, False otherwise
         """
         try:
-            query = select(DBUserSession).where(
-                DBUserSession.session_token == session_token
-            )
+            token_hash = _session_token_hash(session_token)
+            stmt = lambda_stmt(lambda: update(DBUserSession).where(
+                and_(
+                    DBUserSession.token_hash == token_hash,
+                    DBUserSession.session_token == session_token,
+                    DBUserSession.is_active == True
+                )
+            ).values(is_active=False).returning(DBUserSession.user_id))
             
-            result = await self.db.execute(query)
-            session = result.scalar_one_or_none()
+            result = await self.db.execute(stmt)
+            revoked = result.first()
             
-            if session:
-                session.is_active = False
-                await self.db.commit()
-                
-                logger.info(f"Revoked session for user {session.user_id or 'anonymous'}")
-                return True
+            if revoked is None:
+                return False
             
-            return False
+            await self.db.commit()
+            
+            if self.session_cache is not None:
+                await self.session_cache.delete(session_token)
+            
+            logger.info(f"Revoked session for user {revoked.user_id or 'anonymous'}")
+            return True
             
         except Exception as e:
             await self.db.rollback()
@@ -360,7 +1087,13 @@ class AuthService:
             Number of sessions revoked
         """
         try:
-            return await self._deactivate_user_sessions(user_id)
+            count = await self._deactivate_user_sessions(user_id)
+            await self.db.commit()
+            
+            if self.session_cache is not None:
+                await self.session_cache.delete_user(user_id)
+            
+            return count
             
         except Exception as e:
             await self.db.rollback()
@@ -371,24 +1104,31 @@ class AuthService:
         """
         Clean up expired sessions.
         
+        Expired rows are deleted in batches of ``SESSION_CLEANUP_BATCH_SIZE``
+        (located through the ``expires_at`` index) so each transaction holds
+        its locks only briefly and the table does not accumulate dead sessions.
+        Rows locked by concurrent session writes are skipped rather than
+        waited on; they are picked up by a later run.
+        
         Returns:
             Number of sessions cleaned up
         """
         try:
-            from sqlalchemy import update
+            batch_size = settings.SESSION_CLEANUP_BATCH_SIZE
+            expired_ids = select(DBUserSession.id).where(
+                DBUserSession.expires_at < datetime.now()
+            ).limit(batch_size).with_for_update(skip_locked=True).scalar_subquery()
+            stmt = delete(DBUserSession).where(DBUserSession.id.in_(expired_ids))
             
-            # Deactivate expired sessions
-            stmt = update(DBUserSession).where(
-                and_(
-                    DBUserSession.expires_at < datetime.now(),
-                    DBUserSession.is_active == True
-                )
-            ).values(is_active=False)
-            
-            result = await self.db.execute(stmt)
-            await self.db.commit()
+            count = 0
+            while True:
+                result = await self.db.execute(stmt)
+                await self.db.commit()
+                
+                count += result.rowcount
+                if result.rowcount <= 0 or result.rowcount < batch_size:
+                    break
             
-            count = result.rowcount
             if count > 0:
                 logger.info(f"Cleaned up {count} expired sessions")
             
@@ -445,6 +1185,70 @@ class AuthService:
             logger.error(f"Failed to get user sessions: {e}")
             return []
     
+    async def get_user_sessions_page(
+        self,
+        user_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        columns: Tuple[str, ...] = ("session_token", "created_at", "last_accessed", "expires_at")
+    ) -> List[Row]:
+        """
+        Get a page of a user's active sessions as plain rows.
+        
+        Only the requested columns are selected and rows are not loaded into
+        ORM objects, which keeps listing cheap for users with many sessions.
+        
+        Args:
+            user_id: User ID
+            limit: Maximum number of sessions to return
+            offset: Number of sessions to skip
+            columns: Session columns to select
+            
+        Returns:
+            Rows of the requested columns, most recently accessed first
+        """
+        try:
+            query = select(*(getattr(DBUserSession, column) for column in columns)).where(
+                and_(
+                    DBUserSession.user_id == user_id,
+                    DBUserSession.is_active == True,
+                    DBUserSession.expires_at > datetime.now()
+                )
+            ).order_by(DBUserSession.last_accessed.desc()).limit(limit).offset(offset)
+            
+            result = await self.db.execute(query)
+            return list(result.all())
+            
+        except Exception as e:
+            logger.error(f"Failed to get user sessions: {e}")
+            return []
+    
+    async def count_user_sessions(self, user_id: str) -> int:
+        """
+        Count a user's active sessions.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Number of active sessions
+        """
+        try:
+            query = select(func.count()).select_from(DBUserSession).where(
+                and_(
+                    DBUserSession.user_id == user_id,
+                    DBUserSession.is_active == True,
+                    DBUserSession.expires_at > datetime.now()
+                )
+            )
+            
+            result = await self.db.execute(query)
+            return result.scalar_one()
+            
+        except Exception as e:
+            logger.error(f"Failed to count user sessions: {e}")
+            return 0
+    
     async def update_session_preferences(
         self,
         session_token: str,
@@ -453,6 +1257,10 @@ class AuthService:
         """
         Update session preferences.
         
+        On PostgreSQL the new keys are merged into the stored preferences
+        server-side with jsonb ``||`` in one statement, so concurrent updates
+        of different keys do not overwrite each other.
+        
         Args:
             session_token: Session token
             preferences: New preferences
@@ -460,6 +1268,9 @@ class AuthService:
         Returns:
             True if updated successfully, False otherwise
         """
+        if self.db.get_bind().dialect.name == "postgresql":
+            return await self._merge_session_preferences(session_token, preferences)
+        
         try:
             session = await self.get_session(session_token)
             
@@ -467,12 +1278,74 @@ class AuthService:
                 return False
             
             # Merge with existing preferences
-            current_prefs = session.preferences or {}
+            current_prefs = dict(session.preferences or {})
             current_prefs.update(preferences)
+            attached = session in self.db
             session.preferences = current_prefs
             
+            if not attached:
+                # Sessions served from the cache are detached; write the row directly
+                await self.db.execute(
+                    update(DBUserSession).where(
+                        and_(
+                            DBUserSession.token_hash == _session_token_hash(session_token),
+                            DBUserSession.session_token == session_token
+                        )
+                    ).values(preferences=current_prefs)
+                )
+            
+            await self.db.commit()
+            
+            if self.session_cache is not None:
+                await self.session_cache.delete(session_token)
+            
+            logger.info(f"Updated preferences for session {session_token[:8]}...")
+            
+            return True
+            
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to update session preferences: {e}")
+            return False
+    
+    async def _merge_session_preferences(
+        self,
+        session_token: str,
+        preferences: Dict[str, Any]
+    ) -> bool:
+        """
+        Merge preferences into a live session with a single jsonb UPDATE.
+        
+        Args:
+            session_token: Session token
+            preferences: New preferences
+            
+        Returns:
+            True if updated successfully, False otherwise
+        """
+        try:
+            merged = cast(DBUserSession.preferences, JSONB).op("||")(cast(preferences, JSONB))
+            stmt = update(DBUserSession).where(
+                and_(
+                    DBUserSession.token_hash == _session_token_hash(session_token),
+                    DBUserSession.session_token == session_token,
+                    DBUserSession.is_active == True,
+                    DBUserSession.expires_at > datetime.now()
+                )
+            ).values(
+                preferences=cast(merged, JSON),
+                last_accessed=datetime.now()
+            ).returning(DBUserSession.id)
+            
+            result = await self.db.execute(stmt)
+            if result.first() is None:
+                return False
+            
             await self.db.commit()
             
+            if self.session_cache is not None:
+                await self.session_cache.delete(session_token)
+            
             logger.info(f"Updated preferences for session {session_token[:8]}...")
             
             return True
@@ -492,18 +1365,25 @@ class AuthService:
         Returns:
             Number of sessions deactivated
         """
-        from sqlalchemy import update
-        
-        stmt = update(DBUserSession).where(
+        result = await self.db.execute(self._deactivate_user_sessions_stmt(user_id))
+        return result.rowcount
+    
+    @staticmethod
+    def _deactivate_user_sessions_stmt(user_id: str) -> Update:
+        """Build the UPDATE that deactivates all active sessions for a user."""
+        return update(DBUserSession).where(
             and_(
                 DBUserSession.user_id == user_id,
                 DBUserSession.is_active == True
             )
         ).values(is_active=False)
-        
-        result = await self.db.execute(stmt)
-        return result.rowcount
 
 
 # Export service
-__all__ = ['AuthService', 'AuthenticationError']
\ No newline at end of file
+__all__ = [
+    'AuthService',
+    'AuthenticationError',
+    'get_supabase_client',
+    'open_request_token_scope',
+    'close_request_token_scope'
+]
\ No newline at end of file
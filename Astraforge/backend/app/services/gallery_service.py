@@ -1,15 +1,34 @@
 """
 Gallery service for managing mission collections, examples, and search functionality.
 """
+import asyncio
+import base64
+import json
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Any
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta
 
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, desc, asc, text
+from sqlalchemy import (
+    String, Text, select, func, and_, or_, desc, asc, text, cast, column, lambda_stmt,
+    literal_column, table, tuple_
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import Select
 from sqlalchemy.orm import selectinload
 
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal
 from ..models.database import Mission as DBMission, SimulationResult as DBSimulationResult
 from ..models.mission import Mission as MissionModel
 from ..schemas.mission import MissionSummaryResponse, MissionListResponse
@@ -17,6 +36,166 @@ from .mission_service import MissionService
 
 logger = logging.getLogger(__name__)
 
+# Weighted name/description/objectives document maintained by Postgres (see
+# migration 0006). It is not mapped on the model so other dialects can still
+# create the table; they fall back to substring matching.
+MISSION_SEARCH_VECTOR = literal_column("missions.search_vec", TSVECTOR)
+
+# Rendered with literal keys so Postgres can match them against the expression
+# indexes from migrations 0008 and 0009; a bound key hides the index from
+# generic plans. SQLite reads the same ->> syntax.
+MISSION_TARGET_BODY = literal_column("missions.trajectory->>'target_body'", String)
+MISSION_VEHICLE_TYPE = literal_column("missions.spacecraft_config->>'vehicle_type'", String)
+
+# Pages larger than this are read through a server-side cursor in batches of
+# this many rows rather than buffered whole (e.g. exports)
+SEARCH_STREAM_BATCH_SIZE = 200
+
+# Public-mission aggregates refreshed on a schedule (see migration 0007 and
+# run_gallery_stats_refresh). Other dialects aggregate missions directly.
+GALLERY_STATS_VIEW = table(
+    "mv_gallery_stats",
+    column("total_missions"),
+    column("simulated_missions"),
+    column("recent_missions"),
+)
+MISSION_CATEGORIES_VIEW = table(
+    "mv_mission_categories",
+    column("target_body"),
+    column("count"),
+)
+DIFFICULTY_DISTRIBUTION_VIEW = table(
+    "mv_difficulty_distribution",
+    column("difficulty_rating"),
+    column("count"),
+)
+
+# Whether a mission has any simulation results: a single probe of
+# idx_simulation_results_mission_id, and never multiplies mission rows
+MISSION_HAS_SIMULATION = select(DBSimulationResult.id).where(
+    DBSimulationResult.mission_id == DBMission.id
+).correlate_except(DBSimulationResult).exists()
+
+# Just what a MissionSummaryResponse shows: the JSON documents are reduced to
+# the few scalars it needs instead of being fetched and parsed whole
+MISSION_SUMMARY_COLUMNS = (
+    DBMission.id,
+    DBMission.name,
+    DBMission.description,
+    DBMission.objectives,
+    MISSION_TARGET_BODY.label('target_body'),
+    MISSION_VEHICLE_TYPE.label('vehicle_type'),
+    DBMission.trajectory['total_delta_v'].as_float().label('total_delta_v'),
+    DBMission.trajectory['flight_time_days'].as_float().label('flight_time_days'),
+    DBMission.created_at,
+    DBMission.user_id,
+    DBMission.is_public,
+    DBMission.difficulty_rating,
+    MISSION_HAS_SIMULATION.label('has_simulation_results'),
+)
+
+# JSON codecs for cached gallery payloads
+_SUMMARIES_ADAPTER = TypeAdapter(List[MissionSummaryResponse])
+_CATEGORIES_ADAPTER = TypeAdapter(Dict[str, int])
+_DIFFICULTY_ADAPTER = TypeAdapter(Dict[int, int])
+_STATS_ADAPTER = TypeAdapter(Dict[str, Any])
+
+
+def _encode_cursor(created_at: datetime, mission_id: UUID) -> str:
+    """Build the opaque keyset cursor for the row a page ended on."""
+    raw = json.dumps([created_at.isoformat(), str(mission_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Parse a cursor built by ``_encode_cursor``.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, mission_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(created_at), UUID(mission_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+class _RedisGalleryCache:
+    """
+    Redis cache of gallery listings and aggregates.
+    
+    Entries are fields of a single hash so a mission write can drop them all
+    with one DEL. The hash expires ``ttl_seconds`` after it is first filled,
+    which bounds staleness from writes that bypass MissionService. Redis
+    errors and payloads that no longer validate, e.g. after a schema change,
+    are logged and treated as cache misses.
+    """
+    
+    KEY = "gallery:cache"
+    
+    def __init__(self, client: Any, ttl_seconds: int):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+    
+    async def get(self, field: str, adapter: TypeAdapter) -> Optional[Any]:
+        """Return the decoded cached value for a field, if any."""
+        try:
+            raw = await self.client.hget(self.KEY, field)
+        except Exception as e:
+            logger.warning(f"Gallery cache read failed: {e}")
+            return None
+        
+        if raw is None:
+            return None
+        
+        try:
+            return adapter.validate_json(raw)
+        except ValueError as e:
+            logger.warning(f"Discarding unreadable gallery cache entry {field!r}: {e}")
+            return None
+    
+    async def set(self, field: str, adapter: TypeAdapter, value: Any) -> None:
+        """Cache a value under a field until the hash expires."""
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.hset(self.KEY, field, adapter.dump_json(value))
+            pipe.ttl(self.KEY)
+            _, ttl = await pipe.execute()
+            if ttl < 0:
+                # Only a freshly created hash lacks an expiry; EXPIRE NX would
+                # do this in one round trip but needs Redis 7
+                await self.client.expire(self.KEY, self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Gallery cache write failed: {e}")
+    
+    async def clear(self) -> None:
+        """Drop every cached gallery entry."""
+        try:
+            await self.client.delete(self.KEY)
+        except Exception as e:
+            logger.warning(f"Gallery cache eviction failed: {e}")
+
+
+@lru_cache(maxsize=1)
+def _get_redis_gallery_cache(redis_url: str) -> _RedisGalleryCache:
+    """Return a process-wide gallery cache sharing one Redis connection pool."""
+    return _RedisGalleryCache(redis_asyncio.from_url(redis_url), settings.GALLERY_CACHE_TTL_SECONDS)
+
+
+def get_gallery_cache() -> Optional[_RedisGalleryCache]:
+    """Return the shared gallery cache, or None when Redis is not configured."""
+    if REDIS_AVAILABLE and settings.REDIS_URL and settings.GALLERY_CACHE_TTL_SECONDS > 0:
+        return _get_redis_gallery_cache(settings.REDIS_URL)
+    return None
+
+
+async def invalidate_gallery_cache() -> None:
+    """Drop cached gallery entries after a mission write."""
+    cache = get_gallery_cache()
+    if cache is not None:
+        await cache.clear()
+
 
 class GalleryService:
     """Service for mission gallery and search functionality."""
@@ -25,6 +204,7 @@ class GalleryService:
         """Initialize gallery service with database session."""
         self.db = db_session
         self.mission_service = MissionService(db_session)
+        self.cache = get_gallery_cache()
     
     async def get_featured_missions(
         self,
@@ -47,29 +227,33 @@ class GalleryService:
         Returns:
             List of featured mission summaries
         """
+        cache_field = f"featured:{limit}"
+        if self.cache is not None:
+            cached = await self.cache.get(cache_field, _SUMMARIES_ADAPTER)
+            if cached is not None:
+                return cached
+        
         try:
-            # Build query for featured missions
-            query = select(DBMission).where(
+            # Build query for featured missions, ordered by difficulty and
+            # recency; cached as a lambda so it is compiled once
+            query = lambda_stmt(lambda: select(*MISSION_SUMMARY_COLUMNS).where(
                 DBMission.is_public == True
-            )
-            
-            # Order by difficulty and recency for featured content
-            query = query.order_by(
+            ).order_by(
                 desc(DBMission.difficulty_rating),
                 desc(DBMission.created_at)
-            ).limit(limit)
+            ).limit(limit))
             
             result = await self.db.execute(query)
-            db_missions = result.scalars().all()
             
             # Convert to response models
-            featured_missions = []
-            for db_mission in db_missions:
-                mission_model = self.mission_service._db_to_model(db_mission)
-                featured_missions.append(MissionSummaryResponse.from_model(mission_model))
+            from_row = MissionSummaryResponse.from_row
+            featured_missions = [from_row(row) for row in result.all()]
             
             logger.info(f"Retrieved {len(featured_missions)} featured missions")
             
+            if self.cache is not None:
+                await self.cache.set(cache_field, _SUMMARIES_ADAPTER, featured_missions)
+            
             return featured_missions
             
         except Exception as e:
@@ -97,37 +281,35 @@ class GalleryService:
             List of example mission summaries
         """
         try:
-            # Build query for example missions
-            query = select(DBMission).where(
+            # Build query for example missions; each filter combination is
+            # compiled once and cached
+            query = lambda_stmt(lambda: select(*MISSION_SUMMARY_COLUMNS).where(
                 DBMission.is_public == True
-            )
+            ))
             
             # Apply category filter (target body)
             if category:
-                query = query.where(
-                    DBMission.trajectory['target_body'].astext == category
+                query += lambda s: s.where(
+                    MISSION_TARGET_BODY == category
                 )
             
             # Apply difficulty filter
             if difficulty:
-                query = query.where(
+                query += lambda s: s.where(
                     DBMission.difficulty_rating == difficulty
                 )
             
             # Order by difficulty and creation date
-            query = query.order_by(
+            query += lambda s: s.order_by(
                 asc(DBMission.difficulty_rating),
                 desc(DBMission.created_at)
             ).limit(limit)
             
             result = await self.db.execute(query)
-            db_missions = result.scalars().all()
             
             # Convert to response models
-            example_missions = []
-            for db_mission in db_missions:
-                mission_model = self.mission_service._db_to_model(db_mission)
-                example_missions.append(MissionSummaryResponse.from_model(mission_model))
+            from_row = MissionSummaryResponse.from_row
+            example_missions = [from_row(row) for row in result.all()]
             
             logger.info(f"Retrieved {len(example_missions)} example missions for category {category}")
             
@@ -163,28 +345,26 @@ class GalleryService:
                 "month": 30
             }
             days_back = time_thresholds.get(time_period, 7)
+            # Bound as a parameter so the statement text is the same for every period;
+            # created_at is stored as naive local time
+            threshold = datetime.now() - timedelta(days=days_back)
             
-            # Build query for popular missions
-            query = select(DBMission).where(
+            # Build query for popular missions, ordered by creation date (proxy
+            # for popularity); cached as a lambda so it is compiled once
+            query = lambda_stmt(lambda: select(*MISSION_SUMMARY_COLUMNS).where(
                 and_(
                     DBMission.is_public == True,
-                    DBMission.created_at >= func.now() - text(f"INTERVAL '{days_back} days'")
+                    DBMission.created_at >= threshold
                 )
-            )
-            
-            # Order by creation date (proxy for popularity)
-            query = query.order_by(
+            ).order_by(
                 desc(DBMission.created_at)
-            ).limit(limit)
+            ).limit(limit))
             
             result = await self.db.execute(query)
-            db_missions = result.scalars().all()
             
             # Convert to response models
-            popular_missions = []
-            for db_mission in db_missions:
-                mission_model = self.mission_service._db_to_model(db_mission)
-                popular_missions.append(MissionSummaryResponse.from_model(mission_model))
+            from_row = MissionSummaryResponse.from_row
+            popular_missions = [from_row(row) for row in result.all()]
             
             logger.info(f"Retrieved {len(popular_missions)} popular missions for {time_period}")
             
@@ -200,25 +380,32 @@ class GalleryService:
         filters: Dict[str, Any],
         user_id: Optional[str] = None,
         page: int = 1,
-        page_size: int = 20
+        page_size: int = 20,
+        cursor: Optional[str] = None
     ) -> MissionListResponse:
         """
         Advanced mission search with multiple filters and ranking.
         
+        Results ordered newest first carry a ``next_cursor``. Passing it back
+        seeks straight past the previous page instead of using OFFSET; such
+        pages leave ``total_count`` unset because counting every remaining
+        match would cost as much as the OFFSET scan. Other orderings page by
+        ``page`` alone.
+        
         Args:
             query: Search query string
             filters: Dictionary of search filters
             user_id: Optional user ID for access control
             page: Page number
             page_size: Items per page
+            cursor: ``next_cursor`` from the previous page
             
         Returns:
             Paginated search results
         """
         try:
             # Build base search query
-            search_query = select(DBMission)
-            count_query = select(func.count(DBMission.id))
+            search_query = select(*MISSION_SUMMARY_COLUMNS)
             
             # Access control
             access_filters = []
@@ -230,76 +417,63 @@ class GalleryService:
             if access_filters:
                 access_condition = or_(*access_filters)
                 search_query = search_query.where(access_condition)
-                count_query = count_query.where(access_condition)
             
             # Text search with ranking
+            full_text = self._uses_full_text_search()
+            # Accepts quoted phrases, "or" and -exclusions as typed into a search box
+            ts_query = func.websearch_to_tsquery('english', query)
             if query:
-                # Create search conditions with ranking
-                search_conditions = []
-                
-                # Exact name match (highest priority)
-                search_conditions.append(
-                    DBMission.name.ilike(f"%{query}%")
-                )
-                
-                # Description match
-                search_conditions.append(
-                    DBMission.description.ilike(f"%{query}%")
-                )
-                
-                # Objectives match
-                search_conditions.append(
-                    func.array_to_string(DBMission.objectives, ' ').ilike(f"%{query}%")
-                )
+                if full_text:
+                    # Index probe on the GIN-indexed search vector
+                    text_search_condition = MISSION_SEARCH_VECTOR.op('@@')(ts_query)
+                else:
+                    text_search_condition = or_(
+                        DBMission.name.ilike(f"%{query}%"),
+                        DBMission.description.ilike(f"%{query}%"),
+                        cast(DBMission.objectives, Text).ilike(f"%{query}%")
+                    )
                 
-                # Combine search conditions
-                text_search_condition = or_(*search_conditions)
                 search_query = search_query.where(text_search_condition)
-                count_query = count_query.where(text_search_condition)
             
             # Apply additional filters
             if filters.get("target_body"):
                 search_query = search_query.where(
-                    DBMission.trajectory['target_body'].astext == filters["target_body"]
-                )
-                count_query = count_query.where(
-                    DBMission.trajectory['target_body'].astext == filters["target_body"]
+                    MISSION_TARGET_BODY == filters["target_body"]
                 )
             
             if filters.get("vehicle_type"):
                 search_query = search_query.where(
-                    DBMission.spacecraft_config['vehicle_type'].astext == filters["vehicle_type"]
-                )
-                count_query = count_query.where(
-                    DBMission.spacecraft_config['vehicle_type'].astext == filters["vehicle_type"]
+                    MISSION_VEHICLE_TYPE == filters["vehicle_type"]
                 )
             
             if filters.get("difficulty_min"):
                 search_query = search_query.where(
                     DBMission.difficulty_rating >= filters["difficulty_min"]
                 )
-                count_query = count_query.where(
-                    DBMission.difficulty_rating >= filters["difficulty_min"]
-                )
             
             if filters.get("difficulty_max"):
                 search_query = search_query.where(
                     DBMission.difficulty_rating <= filters["difficulty_max"]
                 )
-                count_query = count_query.where(
-                    DBMission.difficulty_rating <= filters["difficulty_max"]
-                )
             
             if filters.get("has_simulation"):
-                # Join with simulation results to filter missions with simulations
-                search_query = search_query.join(DBSimulationResult)
-                count_query = count_query.join(DBSimulationResult)
+                # Semi-join so a mission with several simulations is listed once
+                search_query = search_query.where(MISSION_HAS_SIMULATION)
             
             # Sorting with relevance ranking
             sort_by = filters.get("sort_by", "relevance")
             sort_order = filters.get("sort_order", "desc")
-            
-            if sort_by == "relevance" and query:
+            newest_first = False
+            
+            if sort_by == "relevance" and query and full_text:
+                # Sort by cover density rank over the stored lexeme positions,
+                # then by creation date; selected so ORDER BY reuses it
+                rank = func.ts_rank_cd(MISSION_SEARCH_VECTOR, ts_query).label('rank')
+                search_query = search_query.add_columns(rank).order_by(
+                    desc(rank),
+                    desc(DBMission.created_at)
+                )
+            elif sort_by == "relevance" and query:
                 # Sort by relevance: exact name matches first, then by creation date
                 search_query = search_query.order_by(
                     DBMission.name.ilike(f"%{query}%").desc(),
@@ -308,27 +482,63 @@ class GalleryService:
             else:
                 # Standard sorting
                 sort_column = getattr(DBMission, sort_by, DBMission.created_at)
-                if sort_order.lower() == "desc":
+                newest_first = sort_column is DBMission.created_at and sort_order.lower() == "desc"
+                if newest_first:
+                    # id breaks created_at ties so the keyset is a total order
+                    search_query = search_query.order_by(desc(DBMission.created_at), desc(DBMission.id))
+                elif sort_order.lower() == "desc":
                     search_query = search_query.order_by(desc(sort_column))
                 else:
                     search_query = search_query.order_by(asc(sort_column))
             
-            # Pagination
-            offset = (page - 1) * page_size
-            search_query = search_query.offset(offset).limit(page_size)
-            
-            # Execute queries
-            missions_result = await self.db.execute(search_query)
-            count_result = await self.db.execute(count_query)
-            
-            db_missions = missions_result.scalars().all()
-            total_count = count_result.scalar()
+            seeking = newest_first and cursor is not None
+            if seeking:
+                # Seek past the cursor row on the (created_at, id) order instead
+                # of scanning and discarding OFFSET rows; one extra row tells
+                # whether another page follows
+                after_created_at, after_id = _decode_cursor(cursor)
+                offset = None
+                paged_query = search_query.where(
+                    tuple_(DBMission.created_at, DBMission.id) < tuple_(after_created_at, after_id)
+                ).limit(page_size + 1)
+            else:
+                # Pagination; the window count returns the total with the page
+                offset = (page - 1) * page_size
+                paged_query = search_query.add_columns(
+                    func.count().over().label('total_count')
+                ).offset(offset).limit(page_size)
             
             # Convert to response models
+            from_row = MissionSummaryResponse.from_row
             mission_summaries = []
-            for db_mission in db_missions:
-                mission_model = self.mission_service._db_to_model(db_mission)
-                mission_summaries.append(MissionSummaryResponse.from_model(mission_model))
+            append = mission_summaries.append
+            total_count = None
+            async for row in self._iter_rows(paged_query, page_size + 1 if seeking else page_size):
+                if total_count is None and not seeking:
+                    total_count = row.total_count
+                append(from_row(row))
+            
+            if seeking:
+                has_next = len(mission_summaries) > page_size
+                del mission_summaries[page_size:]
+            elif total_count is None and page > 1:
+                # Past the last page there is no row to carry the total
+                count_result = await self.db.execute(
+                    select(func.count()).select_from(
+                        search_query.with_only_columns(DBMission.id).order_by(None).subquery()
+                    )
+                )
+                total_count = count_result.scalar()
+            elif total_count is None:
+                total_count = 0
+            
+            if not seeking:
+                has_next = offset + page_size < total_count
+            
+            next_cursor = None
+            if newest_first and has_next and mission_summaries:
+                last = mission_summaries[-1]
+                next_cursor = _encode_cursor(last.created_at, last.id)
             
             logger.info(f"Advanced search returned {len(mission_summaries)} results for query '{query}'")
             
@@ -337,14 +547,55 @@ class GalleryService:
                 total_count=total_count,
                 page=page,
                 page_size=page_size,
-                has_next=offset + page_size < total_count,
-                has_previous=page > 1
+                has_next=has_next,
+                has_previous=page > 1 or seeking,
+                next_cursor=next_cursor
             )
             
         except Exception as e:
             logger.error(f"Failed to perform advanced search: {e}")
             raise ValueError(f"Search failed: {str(e)}")
     
+    async def _iter_rows(self, query: Select, expected_rows: int) -> AsyncIterator[Row]:
+        """
+        Yield the rows of a query.
+        
+        Results that may exceed SEARCH_STREAM_BATCH_SIZE rows are streamed from a
+        server-side cursor so the raw result is never buffered whole; smaller
+        ones are fetched in a single round trip.
+        
+        Args:
+            query: Statement to execute
+            expected_rows: Upper bound on the number of rows returned
+        """
+        if expected_rows > SEARCH_STREAM_BATCH_SIZE:
+            result = await self.db.stream(
+                query.execution_options(yield_per=SEARCH_STREAM_BATCH_SIZE)
+            )
+            async for row in result:
+                yield row
+        else:
+            result = await self.db.execute(query)
+            for row in result.all():
+                yield row
+    
+    def _uses_full_text_search(self) -> bool:
+        """Whether the missions table carries the search vector column."""
+        return self.db.get_bind().dialect.name == "postgresql"
+    
+    def _uses_stats_views(self) -> bool:
+        """Whether the materialized gallery views exist for this database."""
+        return self.db.get_bind().dialect.name == "postgresql"
+    
+    async def refresh_stats_views(self) -> None:
+        """Recompute the materialized gallery aggregates and commit."""
+        if not self._uses_stats_views():
+            return
+        
+        for view in (GALLERY_STATS_VIEW, MISSION_CATEGORIES_VIEW, DIFFICULTY_DISTRIBUTION_VIEW):
+            await self.db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view.name}"))
+        await self.db.commit()
+    
     async def get_mission_categories(self) -> Dict[str, int]:
         """
         Get available mission categories with counts.
@@ -352,22 +603,35 @@ class GalleryService:
         Returns:
             Dictionary mapping category names to mission counts
         """
+        if self.cache is not None:
+            cached = await self.cache.get("categories", _CATEGORIES_ADAPTER)
+            if cached is not None:
+                return cached
+        
         try:
-            # Get target body distribution
-            target_body_query = select(
-                DBMission.trajectory['target_body'].astext.label('target_body'),
-                func.count(DBMission.id).label('count')
-            ).where(
-                DBMission.is_public == True
-            ).group_by(
-                DBMission.trajectory['target_body'].astext
-            )
+            if self._uses_stats_views():
+                target_body_query = select(
+                    MISSION_CATEGORIES_VIEW.c.target_body,
+                    MISSION_CATEGORIES_VIEW.c.count
+                )
+            else:
+                target_body_query = select(
+                    MISSION_TARGET_BODY.label('target_body'),
+                    func.count(DBMission.id).label('count')
+                ).where(
+                    DBMission.is_public == True
+                ).group_by(
+                    MISSION_TARGET_BODY
+                )
             
             result = await self.db.execute(target_body_query)
             categories = dict(result.fetchall())
             
             logger.info(f"Retrieved {len(categories)} mission categories")
             
+            if self.cache is not None:
+                await self.cache.set("categories", _CATEGORIES_ADAPTER, categories)
+            
             return categories
             
         except Exception as e:
@@ -381,23 +645,39 @@ class GalleryService:
         Returns:
             Dictionary mapping difficulty levels to mission counts
         """
+        if self.cache is not None:
+            cached = await self.cache.get("difficulty", _DIFFICULTY_ADAPTER)
+            if cached is not None:
+                return cached
+        
         try:
-            difficulty_query = select(
-                DBMission.difficulty_rating,
-                func.count(DBMission.id).label('count')
-            ).where(
-                DBMission.is_public == True
-            ).group_by(
-                DBMission.difficulty_rating
-            ).order_by(
-                DBMission.difficulty_rating
-            )
+            if self._uses_stats_views():
+                difficulty_query = select(
+                    DIFFICULTY_DISTRIBUTION_VIEW.c.difficulty_rating,
+                    DIFFICULTY_DISTRIBUTION_VIEW.c.count
+                ).order_by(
+                    DIFFICULTY_DISTRIBUTION_VIEW.c.difficulty_rating
+                )
+            else:
+                difficulty_query = select(
+                    DBMission.difficulty_rating,
+                    func.count(DBMission.id).label('count')
+                ).where(
+                    DBMission.is_public == True
+                ).group_by(
+                    DBMission.difficulty_rating
+                ).order_by(
+                    DBMission.difficulty_rating
+                )
             
             result = await self.db.execute(difficulty_query)
             distribution = dict(result.fetchall())
             
             logger.info(f"Retrieved difficulty distribution: {distribution}")
             
+            if self.cache is not None:
+                await self.cache.set("difficulty", _DIFFICULTY_ADAPTER, distribution)
+            
             return distribution
             
         except Exception as e:
@@ -411,32 +691,33 @@ class GalleryService:
         Returns:
             Dictionary with gallery statistics
         """
+        if self.cache is not None:
+            cached = await self.cache.get("stats", _STATS_ADAPTER)
+            if cached is not None:
+                return cached
+        
         try:
-            # Total public missions
-            total_query = select(func.count(DBMission.id)).where(
-                DBMission.is_public == True
-            )
-            total_result = await self.db.execute(total_query)
-            total_missions = total_result.scalar()
-            
-            # Missions with simulations
-            simulated_query = select(func.count(func.distinct(DBMission.id))).select_from(
-                DBMission.join(DBSimulationResult)
-            ).where(
-                DBMission.is_public == True
-            )
-            simulated_result = await self.db.execute(simulated_query)
-            simulated_missions = simulated_result.scalar()
-            
-            # Recent missions (last 7 days)
-            recent_query = select(func.count(DBMission.id)).where(
-                and_(
-                    DBMission.is_public == True,
-                    DBMission.created_at >= func.now() - text("INTERVAL '7 days'")
+            if self._uses_stats_views():
+                stats_query = select(
+                    GALLERY_STATS_VIEW.c.total_missions,
+                    GALLERY_STATS_VIEW.c.simulated_missions,
+                    GALLERY_STATS_VIEW.c.recent_missions
+                )
+            else:
+                # One pass over the public missions. EXISTS keeps a mission with
+                # several simulations from being counted more than once.
+                stats_query = select(
+                    func.count(DBMission.id),
+                    func.count(DBMission.id).filter(MISSION_HAS_SIMULATION),
+                    func.count(DBMission.id).filter(
+                        DBMission.created_at >= datetime.now() - timedelta(days=7)
+                    )
+                ).where(
+                    DBMission.is_public == True
                 )
-            )
-            recent_result = await self.db.execute(recent_query)
-            recent_missions = recent_result.scalar()
+            
+            result = await self.db.execute(stats_query)
+            total_missions, simulated_missions, recent_missions = result.one()
             
             stats = {
                 "total_missions": total_missions,
@@ -447,6 +728,9 @@ class GalleryService:
             
             logger.info(f"Retrieved gallery stats: {stats}")
             
+            if self.cache is not None:
+                await self.cache.set("stats", _STATS_ADAPTER, stats)
+            
             return stats
             
         except Exception as e:
@@ -459,5 +743,21 @@ class GalleryService:
             }
 
 
+async def run_gallery_stats_refresh(interval_seconds: float) -> None:
+    """
+    Periodically refresh the materialized gallery views until cancelled.
+    
+    Args:
+        interval_seconds: Delay between refreshes
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with AsyncSessionLocal() as db:
+                await GalleryService(db).refresh_stats_views()
+        except Exception as e:
+            logger.error(f"Failed to refresh gallery stats views: {e}")
+
+
 # Export service
-__all__ = ['GalleryService']
\ No newline at end of file
+__all__ = ['GalleryService', 'invalidate_gallery_cache', 'run_gallery_stats_refresh']
\ No newline at end of file
@@ -89,6 +89,7 @@ class MissionService:
             self.db.add(db_mission)
             await self.db.commit()
             await self.db.refresh(db_mission)
+            await self._invalidate_gallery()
             
             logger.info(f"Created mission {db_mission.id} for user {user_id}")
             
@@ -190,6 +191,7 @@ class MissionService:
             
             await self.db.commit()
             await self.db.refresh(db_mission)
+            await self._invalidate_gallery()
             
             # Convert back to domain model
             mission_model = self._db_to_model(db_mission)
@@ -232,6 +234,7 @@ class MissionService:
             
             await self.db.delete(db_mission)
             await self.db.commit()
+            await self._invalidate_gallery()
             
             logger.info(f"Deleted mission {mission_id} for user {user_id}")
             
@@ -421,6 +424,13 @@ class MissionService:
             logger.error(f"Failed to search missions: {e}")
             return []
     
+    async def _invalidate_gallery(self) -> None:
+        """Drop cached gallery listings so the write shows up immediately."""
+        # Imported here: the gallery service builds on this module
+        from .gallery_service import invalidate_gallery_cache
+        
+        await invalidate_gallery_cache()
+    
     def _db_to_model(self, db_mission: DBMission) -> MissionModel:
         """Convert database model to domain model."""
         from ..models.mission import (
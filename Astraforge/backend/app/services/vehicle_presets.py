@@ -4,12 +4,26 @@ Vehicle preset service for managing spacecraft configurations.
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, case, column, func, table, text
+from sqlalchemy.orm import load_only
 
 from app.models.database import VehiclePreset
 from app.models.mission import SpacecraftConfig, VehicleType
 
 
+# Per-type aggregates over vehicle_presets, kept fresh on every preset write
+# (see migration 0004). Other dialects aggregate the base table directly.
+VEHICLE_TYPE_STATS_VIEW = table(
+    "mv_vehicle_type_stats",
+    column("vehicle_type"),
+    column("count"),
+    column("public_count"),
+    column("avg_mass_kg"),
+    column("avg_thrust_n"),
+    column("avg_specific_impulse_s"),
+)
+
+
 class VehiclePresetService:
     """Service for managing vehicle presets."""
     
@@ -38,6 +52,7 @@ class VehiclePresetService:
         )
         
         self.db.add(preset)
+        await self._refresh_type_stats()
         await self.db.commit()
         await self.db.refresh(preset)
         
@@ -66,8 +81,52 @@ class VehiclePresetService:
         offset: int = 0
     ) -> List[VehiclePreset]:
         """List vehicle presets with optional filtering."""
-        query = select(VehiclePreset)
+        query = self._filter_presets(
+            select(VehiclePreset), vehicle_type, is_public, created_by, limit, offset
+        )
+        
+        result = await self.db.execute(query)
+        return result.scalars().all()
+    
+    async def list_preset_summaries(
+        self,
+        vehicle_type: Optional[VehicleType] = None,
+        is_public: Optional[bool] = None,
+        created_by: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[VehiclePreset]:
+        """List vehicle presets loading only the columns used by summaries.
+        
+        The JSON configuration and other wide columns are deferred, so rows
+        are read and decoded from the indexed scalar columns alone.
+        """
+        query = self._filter_presets(
+            select(VehiclePreset).options(
+                load_only(
+                    VehiclePreset.name,
+                    VehiclePreset.vehicle_type,
+                    VehiclePreset.mass_kg,
+                    VehiclePreset.thrust_n,
+                    VehiclePreset.is_public
+                )
+            ),
+            vehicle_type, is_public, created_by, limit, offset
+        )
         
+        result = await self.db.execute(query)
+        return result.scalars().all()
+    
+    @staticmethod
+    def _filter_presets(
+        query,
+        vehicle_type: Optional[VehicleType],
+        is_public: Optional[bool],
+        created_by: Optional[str],
+        limit: int,
+        offset: int
+    ):
+        """Apply list filters, ordering and pagination to a preset query."""
         conditions = []
         if vehicle_type:
             conditions.append(VehiclePreset.vehicle_type == vehicle_type.value)
@@ -79,10 +138,7 @@ class VehiclePresetService:
         if conditions:
             query = query.where(and_(*conditions))
         
-        query = query.offset(offset).limit(limit).order_by(VehiclePreset.name)
-        
-        result = await self.db.execute(query)
-        return result.scalars().all()
+        return query.offset(offset).limit(limit).order_by(VehiclePreset.name)
     
     async def update_preset(
         self,
@@ -110,6 +166,7 @@ class VehiclePresetService:
         if is_public is not None:
             preset.is_public = is_public
         
+        await self._refresh_type_stats()
         await self.db.commit()
         await self.db.refresh(preset)
         
@@ -122,10 +179,72 @@ class VehiclePresetService:
             return False
         
         await self.db.delete(preset)
+        await self._refresh_type_stats()
         await self.db.commit()
         
         return True
     
+    async def get_preset_stats(self) -> Dict[str, Any]:
+        """Get preset counts and per-vehicle-type averages.
+        
+        On PostgreSQL this reads the handful of rows in the
+        ``mv_vehicle_type_stats`` materialized view instead of scanning
+        every preset.
+        """
+        if self._uses_stats_view():
+            stats = VEHICLE_TYPE_STATS_VIEW.c
+            query = select(
+                stats.vehicle_type,
+                stats.count,
+                stats.public_count,
+                stats.avg_mass_kg,
+                stats.avg_thrust_n,
+                stats.avg_specific_impulse_s
+            )
+        else:
+            query = select(
+                VehiclePreset.vehicle_type,
+                func.count().label("count"),
+                func.sum(case((VehiclePreset.is_public == True, 1), else_=0)).label("public_count"),
+                func.avg(VehiclePreset.mass_kg).label("avg_mass_kg"),
+                func.avg(VehiclePreset.thrust_n).label("avg_thrust_n"),
+                func.avg(VehiclePreset.specific_impulse_s).label("avg_specific_impulse_s")
+            ).group_by(VehiclePreset.vehicle_type)
+        
+        result = await self.db.execute(query.order_by(text("vehicle_type")))
+        rows = result.all()
+        
+        total = sum(row.count for row in rows)
+        public = sum(row.public_count for row in rows)
+        
+        return {
+            "total_presets": total,
+            "public_presets": public,
+            "private_presets": total - public,
+            "vehicle_type_stats": [
+                {
+                    "vehicle_type": VehicleType(row.vehicle_type),
+                    "count": row.count,
+                    "avg_mass_kg": float(row.avg_mass_kg),
+                    "avg_thrust_n": float(row.avg_thrust_n),
+                    "avg_specific_impulse_s": float(row.avg_specific_impulse_s)
+                }
+                for row in rows
+            ]
+        }
+    
+    def _uses_stats_view(self) -> bool:
+        """Whether the materialized stats view exists for this database."""
+        return self.db.get_bind().dialect.name == "postgresql"
+    
+    async def _refresh_type_stats(self) -> None:
+        """Refresh the stats view inside the current write transaction."""
+        if not self._uses_stats_view():
+            return
+        
+        await self.db.flush()
+        await self.db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_vehicle_type_stats"))
+    
     def get_spacecraft_config(self, preset: VehiclePreset) -> SpacecraftConfig:
         """Convert preset configuration to SpacecraftConfig model."""
         return SpacecraftConfig(**preset.configuration)
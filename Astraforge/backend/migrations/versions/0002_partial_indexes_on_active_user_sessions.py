@@ -0,0 +1,37 @@
+"""Partial indexes on active user sessions
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # session_token is already covered by its unique constraint; replace the
+    # duplicate full index with one over live sessions only
+    op.drop_index('idx_user_sessions_token', table_name='user_sessions')
+    op.create_index(
+        'idx_user_sessions_token_active', 'user_sessions', ['session_token'],
+        unique=False, postgresql_where=sa.text('is_active')
+    )
+    op.create_index(
+        'idx_user_sessions_user_id_active', 'user_sessions', ['user_id'],
+        unique=False, postgresql_where=sa.text('is_active')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_user_sessions_user_id_active', table_name='user_sessions')
+    op.drop_index('idx_user_sessions_token_active', table_name='user_sessions')
+    op.create_index('idx_user_sessions_token', 'user_sessions', ['session_token'], unique=False)
@@ -0,0 +1,43 @@
+"""Index user sessions by 64-bit token hash
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('user_sessions', sa.Column('token_hash', sa.BigInteger(), nullable=True))
+    
+    # Leading 64 bits of sha256(session_token) as a signed bigint, matching
+    # the value computed by AuthService for new sessions
+    op.execute(
+        "UPDATE user_sessions SET token_hash = "
+        "('x' || substr(encode(sha256(convert_to(session_token, 'UTF8')), 'hex'), 1, 16))::bit(64)::bigint"
+    )
+    
+    op.drop_index('idx_user_sessions_token_active', table_name='user_sessions')
+    op.create_index(
+        'idx_user_sessions_token_hash_active', 'user_sessions', ['token_hash'],
+        unique=False, postgresql_where=sa.text('is_active')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_user_sessions_token_hash_active', table_name='user_sessions')
+    op.create_index(
+        'idx_user_sessions_token_active', 'user_sessions', ['session_token'],
+        unique=False, postgresql_where=sa.text('is_active')
+    )
+    op.drop_column('user_sessions', 'token_hash')
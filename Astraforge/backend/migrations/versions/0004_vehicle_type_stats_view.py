@@ -0,0 +1,41 @@
+"""Materialized view of per-vehicle-type preset statistics
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_vehicle_type_stats AS
+        SELECT
+            vehicle_type,
+            count(*) AS count,
+            count(*) FILTER (WHERE is_public) AS public_count,
+            avg(mass_kg) AS avg_mass_kg,
+            avg(thrust_n) AS avg_thrust_n,
+            avg(specific_impulse_s) AS avg_specific_impulse_s
+        FROM vehicle_presets
+        GROUP BY vehicle_type
+    """)
+    
+    # A unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        'idx_mv_vehicle_type_stats_type', 'mv_vehicle_type_stats', ['vehicle_type'], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_mv_vehicle_type_stats_type', table_name='mv_vehicle_type_stats')
+    op.execute("DROP MATERIALIZED VIEW mv_vehicle_type_stats")
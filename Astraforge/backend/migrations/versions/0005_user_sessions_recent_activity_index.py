@@ -0,0 +1,36 @@
+"""Order active user sessions by recency in the per-user index
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Listing a user's sessions orders by last_accessed and filters on
+    # expires_at; keying on both lets Postgres skip the sort and the heap
+    # visit for expired rows
+    op.create_index(
+        'idx_user_sessions_user_active_recent', 'user_sessions', ['user_id', 'last_accessed'],
+        unique=False, postgresql_include=['expires_at'], postgresql_where=sa.text('is_active')
+    )
+    op.drop_index('idx_user_sessions_user_id_active', table_name='user_sessions')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'idx_user_sessions_user_id_active', 'user_sessions', ['user_id'],
+        unique=False, postgresql_where=sa.text('is_active')
+    )
+    op.drop_index('idx_user_sessions_user_active_recent', table_name='user_sessions')
@@ -0,0 +1,42 @@
+"""Full-text search vector on missions
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Name outranks description, which outranks objectives. objectives is a
+    # JSON array, so its text form is indexed; the brackets and quotes are
+    # dropped by the parser
+    op.execute("""
+        ALTER TABLE missions ADD COLUMN search_vec tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(objectives::text, '')), 'C')
+        ) STORED
+    """)
+    
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_missions_search_vec', 'missions', ['search_vec'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_missions_search_vec', table_name='missions', postgresql_concurrently=True)
+    op.execute("ALTER TABLE missions DROP COLUMN search_vec")
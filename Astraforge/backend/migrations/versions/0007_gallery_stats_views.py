@@ -0,0 +1,64 @@
+"""Materialized views of public gallery aggregates
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Single-row view; id only exists to carry the unique index
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_gallery_stats AS
+        SELECT
+            1 AS id,
+            (SELECT count(*) FROM missions WHERE is_public) AS total_missions,
+            (SELECT count(DISTINCT m.id)
+             FROM missions m JOIN simulation_results s ON s.mission_id = m.id
+             WHERE m.is_public) AS simulated_missions,
+            (SELECT count(*) FROM missions
+             WHERE is_public AND created_at >= now() - interval '7 days') AS recent_missions
+    """)
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_mission_categories AS
+        SELECT trajectory->>'target_body' AS target_body, count(*) AS count
+        FROM missions
+        WHERE is_public
+        GROUP BY trajectory->>'target_body'
+    """)
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_difficulty_distribution AS
+        SELECT difficulty_rating, count(*) AS count
+        FROM missions
+        WHERE is_public
+        GROUP BY difficulty_rating
+    """)
+    
+    # A unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index('idx_mv_gallery_stats_id', 'mv_gallery_stats', ['id'], unique=True)
+    op.create_index(
+        'idx_mv_mission_categories_target_body', 'mv_mission_categories', ['target_body'], unique=True
+    )
+    op.create_index(
+        'idx_mv_difficulty_distribution_rating', 'mv_difficulty_distribution', ['difficulty_rating'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_mv_difficulty_distribution_rating', table_name='mv_difficulty_distribution')
+    op.drop_index('idx_mv_mission_categories_target_body', table_name='mv_mission_categories')
+    op.drop_index('idx_mv_gallery_stats_id', table_name='mv_gallery_stats')
+    op.execute("DROP MATERIALIZED VIEW mv_difficulty_distribution")
+    op.execute("DROP MATERIALIZED VIEW mv_mission_categories")
+    op.execute("DROP MATERIALIZED VIEW mv_gallery_stats")
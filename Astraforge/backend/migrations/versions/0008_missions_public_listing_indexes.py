@@ -0,0 +1,48 @@
+"""Partial indexes for public mission listings
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Gallery listings only ever read public missions, in these orders, so
+    # LIMIT can stop after the first matching index entries instead of
+    # sorting the whole public set
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_missions_public_difficulty_created', 'missions',
+            [sa.text('difficulty_rating DESC'), sa.text('created_at DESC')],
+            unique=False, postgresql_where=sa.text('is_public'), postgresql_concurrently=True
+        )
+        op.create_index(
+            'idx_missions_public_created', 'missions', [sa.text('created_at DESC')],
+            unique=False, postgresql_where=sa.text('is_public'), postgresql_concurrently=True
+        )
+        op.create_index(
+            'idx_missions_public_target_body', 'missions', [sa.text("(trajectory->>'target_body')")],
+            unique=False, postgresql_where=sa.text('is_public'), postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_missions_public_target_body', table_name='missions', postgresql_concurrently=True
+        )
+        op.drop_index('idx_missions_public_created', table_name='missions', postgresql_concurrently=True)
+        op.drop_index(
+            'idx_missions_public_difficulty_created', table_name='missions', postgresql_concurrently=True
+        )
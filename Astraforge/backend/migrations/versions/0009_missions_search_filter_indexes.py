@@ -0,0 +1,53 @@
+"""Expression indexes for mission search filters
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Search commonly pairs a target body with a difficulty range; keyed on
+    # both, the index also serves target_body alone, so it replaces the
+    # single-column one. Difficulty alone is already led by
+    # idx_missions_public_difficulty_created.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_missions_public_target_body_difficulty', 'missions',
+            [sa.text("(trajectory->>'target_body')"), 'difficulty_rating'],
+            unique=False, postgresql_where=sa.text('is_public'), postgresql_concurrently=True
+        )
+        op.create_index(
+            'idx_missions_public_vehicle_type', 'missions',
+            [sa.text("(spacecraft_config->>'vehicle_type')")],
+            unique=False, postgresql_where=sa.text('is_public'), postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_missions_public_target_body', table_name='missions', postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_missions_public_target_body', 'missions', [sa.text("(trajectory->>'target_body')")],
+            unique=False, postgresql_where=sa.text('is_public'), postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_missions_public_vehicle_type', table_name='missions', postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_missions_public_target_body_difficulty', table_name='missions',
+            postgresql_concurrently=True
+        )
@@ -1,17 +1,38 @@
 """
 Tests for authentication API endpoints.
 """
+import asyncio
+import json
+import jwt
 import pytest
-from datetime import datetime, timedelta
+import time
+from cryptography.hazmat.primitives.asymmetric import rsa
+from datetime import datetime, timedelta, timezone
+from jwt.exceptions import PyJWKClientError
+from pydantic import ValidationError
 from uuid import uuid4
 from unittest.mock import AsyncMock, patch, MagicMock
 
 from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.auth import AuthMiddleware, run_session_cleanup
+from app.core.config import Settings
 from app.main import app
 from app.models.database import UserSession as DBUserSession
-from app.services.auth_service import AuthService
+from app.services import auth_service as auth_service_module
+from app.services.auth_service import (
+    AuthService,
+    _RedisSessionCache,
+    _TokenCache,
+    _local_session_cache,
+    _rejected_tokens,
+    _session_token_hash,
+    _verified_tokens,
+    close_request_token_scope,
+    open_request_token_scope
+)
 
 # Configure pytest-asyncio
 pytestmark = pytest.mark.asyncio
@@ -67,7 +88,7 @@ class TestAuthenticationEndpoints:
             assert data["is_authenticated"] == True
             
             # Verify service calls
-            mock_service.verify_jwt_token.assert_called_once_with("valid-jwt-token")
+            mock_service.verify_jwt_token.assert_called_once_with("valid-jwt-token", strict=True)
             mock_service.create_authenticated_session.assert_called_once()
     
     @patch('app.api.auth.get_db')
@@ -285,7 +306,7 @@ class TestAuthenticationEndpoints:
         mock_session.last_accessed = datetime.now()
         mock_session.expires_at = datetime.now() + timedelta(hours=1)
         
-        mock_service.get_user_sessions.return_value = [mock_session]
+        mock_service.get_user_sessions_page.return_value = [mock_session]
         
         # Make request
         response = client.get("/api/v1/auth/sessions")
@@ -299,7 +320,8 @@ class TestAuthenticationEndpoints:
         assert len(data["sessions"]) == 1
         
         # Verify service call
-        mock_service.get_user_sessions.assert_called_once_with("test-user-123")
+        mock_service.get_user_sessions_page.assert_called_once_with("test-user-123", limit=50, offset=0)
+        mock_service.count_user_sessions.assert_not_called()
     
     @patch('app.api.auth.get_db')
     @patch('app.services.auth_service.AuthService')
@@ -347,6 +369,17 @@ class TestAuthService:
         """Auth service with mocked database."""
         return AuthService(mock_db_session)
     
+    @pytest.fixture(autouse=True)
+    def clear_token_caches(self):
+        """Isolate tests from JWT verifications and sessions cached by others."""
+        _verified_tokens.clear()
+        _rejected_tokens.clear()
+        _local_session_cache.clear()
+        yield
+        _verified_tokens.clear()
+        _rejected_tokens.clear()
+        _local_session_cache.clear()
+    
     async def test_create_anonymous_session(self, auth_service, mock_db_session):
         """Test creating anonymous session."""
         # Mock database operations
@@ -366,6 +399,57 @@ class TestAuthService:
         # Verify database operations
         mock_db_session.add.assert_called_once()
         mock_db_session.commit.assert_called_once()
+        
+        # Session is indexed by its 64-bit token hash
+        db_session = mock_db_session.add.call_args.args[0]
+        assert db_session.token_hash == _session_token_hash(token)
+        assert -2**63 <= db_session.token_hash < 2**63
+    
+    async def test_create_authenticated_session_single_statement(self, auth_service, mock_db_session):
+        """Test deactivation and insert are sent as one statement."""
+        mock_db_session.commit = AsyncMock()
+        
+        token = await auth_service.create_authenticated_session(
+            user_id="test-user",
+            email="test@example.com",
+            jwt_token="jwt-token"
+        )
+        
+        assert len(token) > 20
+        mock_db_session.execute.assert_called_once()
+        sql = str(mock_db_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("WITH deactivated_sessions AS")
+        assert "INSERT INTO user_sessions" in sql
+        mock_db_session.commit.assert_called_once()
+    
+    async def test_supabase_client_shared(self, mock_db_session):
+        """Test the Supabase client is created once and shared across services."""
+        with patch.object(auth_service_module, '_supabase_client', None), \
+             patch.object(auth_service_module, 'SUPABASE_AVAILABLE', True), \
+             patch.object(auth_service_module, 'JWKS_AVAILABLE', False), \
+             patch.object(auth_service_module, 'settings') as mock_settings, \
+             patch.object(auth_service_module, '_supabase_client_options') as mock_options, \
+             patch.object(auth_service_module, 'create_client', create=True) as mock_create_client:
+            mock_settings.SUPABASE_URL = "https://example.supabase.co"
+            mock_settings.SUPABASE_ANON_KEY = "anon-key"
+            mock_settings.SESSION_LOCAL_CACHE_TTL_SECONDS = 0
+            
+            first = AuthService(mock_db_session)
+            second = AuthService(mock_db_session)
+            
+            assert first.supabase_client is second.supabase_client
+            mock_create_client.assert_called_once_with(
+                "https://example.supabase.co", "anon-key", options=mock_options.return_value
+            )
+    
+    async def test_supabase_client_options_pooled(self):
+        """Test the shared Supabase client gets a pooled HTTP client and no user session."""
+        options = auth_service_module._supabase_client_options()
+        
+        assert options.httpx_client is not None
+        assert options.persist_session is False
+        assert options.auto_refresh_token is False
+        options.httpx_client.close()
     
     async def test_verify_jwt_token_no_supabase(self, auth_service):
         """Test JWT token verification when Supabase is not configured."""
@@ -376,6 +460,154 @@ class TestAuthService:
         
         assert result is None
     
+    async def test_verify_jwt_token_cached(self, auth_service):
+        """Test repeated verification of the same token skips Supabase."""
+        mock_user = MagicMock()
+        mock_user.user.id = "test-user"
+        mock_user.user.email = "test@example.com"
+        mock_user.user.user_metadata = {}
+        auth_service.supabase_client = MagicMock()
+        auth_service.supabase_client.auth.get_user.return_value = mock_user
+        
+        first = await auth_service.verify_jwt_token("cached-token")
+        first["email"] = "mutated@example.com"
+        second = await auth_service.verify_jwt_token("cached-token")
+        
+        assert second["user_id"] == "test-user"
+        assert second["email"] == "test@example.com"
+        auth_service.supabase_client.auth.get_user.assert_called_once_with("cached-token")
+    
+    async def test_verify_jwt_token_cache_bounded_by_expiry(self, auth_service):
+        """Test a Supabase-verified token is not cached past its own exp claim."""
+        mock_user = MagicMock()
+        mock_user.user.id = "test-user"
+        auth_service.supabase_client = MagicMock()
+        auth_service.supabase_client.auth.get_user.return_value = mock_user
+        expired_at = int(time.time()) - 1
+        token = jwt.encode({"sub": "test-user", "exp": expired_at}, "secret", algorithm="HS256")
+        
+        first = await auth_service.verify_jwt_token(token)
+        await auth_service.verify_jwt_token(token)
+        
+        assert first["exp"] == expired_at
+        assert auth_service.supabase_client.auth.get_user.call_count == 2
+    
+    async def test_verify_jwt_token_request_scope(self, auth_service):
+        """Test a token verified earlier in the request is reused without the shared caches."""
+        mock_user = MagicMock()
+        mock_user.user.id = "test-user"
+        auth_service.supabase_client = MagicMock()
+        auth_service.supabase_client.auth.get_user.return_value = mock_user
+        
+        scope = open_request_token_scope()
+        try:
+            await auth_service.verify_jwt_token("request-token")
+            _verified_tokens.clear()
+            with patch.object(_TokenCache, 'key_for') as mock_key_for:
+                result = await auth_service.verify_jwt_token("request-token")
+                mock_key_for.assert_not_called()
+        finally:
+            close_request_token_scope(scope)
+        
+        assert result["user_id"] == "test-user"
+        auth_service.supabase_client.auth.get_user.assert_called_once_with("request-token")
+        
+        # Outside the request the shared cache (now empty) is consulted again
+        await auth_service.verify_jwt_token("request-token")
+        assert auth_service.supabase_client.auth.get_user.call_count == 2
+    
+    async def test_verify_jwt_token_rejection_cached(self, auth_service):
+        """Test rejected tokens are not re-sent to Supabase while cached."""
+        auth_service.supabase_client = MagicMock()
+        auth_service.supabase_client.auth.get_user.return_value = None
+        
+        assert await auth_service.verify_jwt_token("bad-token") is None
+        assert await auth_service.verify_jwt_token("bad-token") is None
+        
+        auth_service.supabase_client.auth.get_user.assert_called_once_with("bad-token")
+    
+    async def test_verify_jwt_token_transient_failure_not_cached(self, auth_service):
+        """Test unexpected verification errors are retried rather than cached."""
+        auth_service.supabase_client = MagicMock()
+        auth_service.supabase_client.auth.get_user.side_effect = ConnectionError("network down")
+        
+        assert await auth_service.verify_jwt_token("flaky-token") is None
+        assert await auth_service.verify_jwt_token("flaky-token") is None
+        
+        assert auth_service.supabase_client.auth.get_user.call_count == 2
+    
+    async def test_verify_jwt_token_offline_jwks(self, auth_service):
+        """Test tokens signed by a JWKS key are verified without Supabase."""
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        token = jwt.encode(
+            {
+                "sub": "jwks-user",
+                "email": "jwks@example.com",
+                "aud": "authenticated",
+                "exp": datetime.now(timezone.utc) + timedelta(minutes=5)
+            },
+            private_key,
+            algorithm="RS256",
+            headers={"kid": "project-key"}
+        )
+        auth_service.jwks_client = MagicMock()
+        auth_service.jwks_client.get_signing_key_from_jwt.return_value.key = private_key.public_key()
+        auth_service.supabase_client = MagicMock()
+        
+        result = await auth_service.verify_jwt_token(token)
+        
+        assert result["user_id"] == "jwks-user"
+        assert result["email"] == "jwks@example.com"
+        auth_service.supabase_client.auth.get_user.assert_not_called()
+    
+    async def test_verify_jwt_token_strict_introspects(self, auth_service):
+        """Test strict verification asks Supabase even when a result is cached."""
+        mock_user = MagicMock()
+        mock_user.user.id = "test-user"
+        auth_service.jwks_client = MagicMock()
+        auth_service.supabase_client = MagicMock()
+        auth_service.supabase_client.auth.get_user.return_value = mock_user
+        
+        await auth_service.verify_jwt_token("strict-token", strict=True)
+        result = await auth_service.verify_jwt_token("strict-token", strict=True)
+        
+        assert result["user_id"] == "test-user"
+        auth_service.jwks_client.get_signing_key_from_jwt.assert_not_called()
+        assert auth_service.supabase_client.auth.get_user.call_count == 2
+    
+    async def test_verify_jwt_token_jwks_unavailable_falls_back(self, auth_service):
+        """Test an unresolvable signing key falls back to Supabase verification."""
+        auth_service.jwks_client = MagicMock()
+        auth_service.jwks_client.get_signing_key_from_jwt.side_effect = PyJWKClientError("no key")
+        auth_service.supabase_client = MagicMock()
+        auth_service.supabase_client.auth.get_user.return_value = None
+        
+        result = await auth_service.verify_jwt_token("legacy-token")
+        
+        assert result is None
+        auth_service.supabase_client.auth.get_user.assert_called_once_with("legacy-token")
+    
+    async def test_verify_jwt_token_jwks_skips_non_jwks_tokens(self, auth_service):
+        """Test opaque and HS256 tokens never reach the JWKS lookup."""
+        auth_service.jwks_client = MagicMock()
+        auth_service.supabase_client = MagicMock()
+        auth_service.supabase_client.auth.get_user.return_value = None
+        hs256_token = jwt.encode({"sub": "u"}, "test-secret-with-at-least-32-bytes!", algorithm="HS256")
+        
+        for token in ["garbage", "a.b.c", "", "Zq3v_opaque-session-token", hs256_token]:
+            assert await auth_service.verify_jwt_token(token) is None
+        
+        auth_service.jwks_client.get_signing_key_from_jwt.assert_not_called()
+    
+    async def test_verify_jwt_token_jwks_decode_error(self, auth_service):
+        """Test a token the JWKS client cannot parse is rejected, not raised."""
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        token = jwt.encode({"sub": "u"}, private_key, algorithm="RS256", headers={"kid": "project-key"})
+        auth_service.jwks_client = MagicMock()
+        auth_service.jwks_client.get_signing_key_from_jwt.side_effect = jwt.DecodeError("Invalid header padding")
+        
+        assert await auth_service.verify_jwt_token(token) is None
+    
     async def test_get_session_valid(self, auth_service, mock_db_session):
         """Test getting valid session."""
         # Mock database query
@@ -385,7 +617,7 @@ class TestAuthService:
             email="test@example.com",
             expires_at=datetime.now() + timedelta(hours=1),
             is_active=True,
-            last_accessed=datetime.now()
+            last_accessed=datetime.now() - timedelta(hours=1)
         )
         
         mock_result = MagicMock()
@@ -401,10 +633,145 @@ class TestAuthService:
         assert session.session_token == "test-token"
         assert session.user_id == "test-user"
         
-        # Verify database operations
-        mock_db_session.execute.assert_called_once()
+        # Verify database operations: lookup, then a touch guarded by staleness
+        assert mock_db_session.execute.call_count == 2
+        touch = mock_db_session.execute.call_args_list[1].args[0]
+        sql = str(touch.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE user_sessions SET last_accessed")
+        assert "user_sessions.last_accessed <" in sql
+        
+        # Expiry is judged by the same app clock that writes expires_at
+        lookup = mock_db_session.execute.call_args_list[0].args[0].compile(dialect=postgresql.dialect())
+        assert "LOCALTIMESTAMP" not in str(lookup)
+        assert any(isinstance(v, datetime) for v in lookup.params.values())
         mock_db_session.commit.assert_called_once()
     
+    async def test_get_session_recently_touched(self, auth_service, mock_db_session):
+        """Test a recently accessed session is returned without a write."""
+        last_accessed = datetime.now() - timedelta(seconds=5)
+        mock_session = DBUserSession(
+            session_token="test-token",
+            user_id="test-user",
+            expires_at=datetime.now() + timedelta(hours=1),
+            is_active=True,
+            last_accessed=last_accessed
+        )
+        
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_session
+        mock_db_session.execute.return_value = mock_result
+        
+        session = await auth_service.get_session("test-token")
+        
+        assert session is mock_session
+        assert session.last_accessed == last_accessed
+        mock_db_session.commit.assert_not_called()
+    
+    @pytest.fixture
+    def mock_redis(self):
+        """Mock asyncio Redis client."""
+        client = MagicMock()
+        client.get = AsyncMock(return_value=None)
+        client.delete = AsyncMock()
+        client.pipeline.return_value.execute = AsyncMock()
+        return client
+    
+    async def test_get_session_from_cache(self, auth_service, mock_db_session, mock_redis):
+        """Test a cached session is returned without querying the database."""
+        expires_at = datetime.now() + timedelta(hours=1)
+        mock_redis.get.return_value = json.dumps({
+            "id": str(uuid4()),
+            "user_id": "test-user",
+            "email": "test@example.com",
+            "expires_at": expires_at.isoformat(),
+            "last_accessed": None,
+            "preferences": {"theme": "dark"}
+        })
+        auth_service.session_cache = _RedisSessionCache(mock_redis, ttl_seconds=60)
+        
+        session = await auth_service.get_session("test-token")
+        
+        assert session.session_token == "test-token"
+        assert session.user_id == "test-user"
+        assert session.expires_at == expires_at
+        assert session.preferences == {"theme": "dark"}
+        mock_redis.get.assert_awaited_once_with(f"sess:{_TokenCache.key_for('test-token').hex()}")
+        mock_db_session.execute.assert_not_called()
+    
+    async def test_get_session_populates_cache(self, auth_service, mock_db_session, mock_redis):
+        """Test a cache miss loads from the database and caches the session."""
+        mock_session = DBUserSession(
+            session_token="test-token",
+            user_id="test-user",
+            expires_at=datetime.now() + timedelta(hours=1),
+            is_active=True,
+            last_accessed=datetime.now(),
+            preferences={}
+        )
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_session
+        mock_db_session.execute.return_value = mock_result
+        auth_service.session_cache = _RedisSessionCache(mock_redis, ttl_seconds=60)
+        
+        session = await auth_service.get_session("test-token")
+        
+        assert session is mock_session
+        pipe = mock_redis.pipeline.return_value
+        key, ttl, _ = pipe.setex.call_args.args
+        token_hash = _TokenCache.key_for("test-token").hex()
+        assert key == f"sess:{token_hash}"
+        assert "test-token" not in key
+        assert 0 < ttl <= 60
+        pipe.sadd.assert_called_once_with("user_sess:test-user", token_hash)
+        pipe.execute.assert_awaited_once()
+    
+    async def test_revoke_session_evicts_cache(self, auth_service, mock_db_session, mock_redis):
+        """Test revoking a session drops its cache entry."""
+        mock_result = MagicMock()
+        mock_result.first.return_value = MagicMock(user_id="test-user")
+        mock_db_session.execute.return_value = mock_result
+        auth_service.session_cache = _RedisSessionCache(mock_redis, ttl_seconds=60)
+        
+        assert await auth_service.revoke_session("test-token") == True
+        
+        mock_redis.delete.assert_awaited_once_with(f"sess:{_TokenCache.key_for('test-token').hex()}")
+    
+    async def test_session_cache_delete_user_evicts_hashed_keys(self, mock_redis):
+        """Test per-user eviction works from stored token hashes alone."""
+        token_hash = _TokenCache.key_for("test-token").hex()
+        mock_redis.smembers = AsyncMock(return_value={token_hash})
+        cache = _RedisSessionCache(mock_redis, ttl_seconds=60)
+        
+        await cache.delete_user("test-user")
+        
+        mock_redis.delete.assert_awaited_once_with("user_sess:test-user", f"sess:{token_hash}")
+    
+    async def test_get_session_local_cache(self, auth_service, mock_db_session):
+        """Test sessions are served from the in-process cache until revoked."""
+        mock_session = DBUserSession(
+            session_token="test-token",
+            user_id="test-user",
+            expires_at=datetime.now() + timedelta(hours=1),
+            is_active=True,
+            last_accessed=datetime.now(),
+            preferences={"theme": "dark"}
+        )
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_session
+        mock_db_session.execute.return_value = mock_result
+        auth_service.session_cache = _local_session_cache
+        
+        await auth_service.get_session("test-token")
+        cached = await auth_service.get_session("test-token")
+        
+        assert cached is not mock_session
+        assert cached.user_id == "test-user"
+        assert cached.preferences == {"theme": "dark"}
+        mock_db_session.execute.assert_called_once()
+        
+        await _local_session_cache.delete_user("test-user")
+        assert await _local_session_cache.get("test-token") is None
+    
     async def test_get_session_expired(self, auth_service, mock_db_session):
         """Test getting expired session."""
         # Mock database query returning None (expired session filtered out)
@@ -420,15 +787,9 @@ class TestAuthService:
     
     async def test_revoke_session(self, auth_service, mock_db_session):
         """Test revoking a session."""
-        # Mock database query
-        mock_session = DBUserSession(
-            session_token="test-token",
-            user_id="test-user",
-            is_active=True
-        )
-        
+        # Mock conditional update returning the revoked row
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_session
+        mock_result.first.return_value = MagicMock(user_id="test-user")
         mock_db_session.execute.return_value = mock_result
         mock_db_session.commit = AsyncMock()
         
@@ -437,10 +798,61 @@ class TestAuthService:
         
         # Assertions
         assert result == True
-        assert mock_session.is_active == False
+        sql = str(mock_db_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE user_sessions SET is_active")
+        assert "RETURNING" in sql
         
         # Verify database operations
+        mock_db_session.execute.assert_called_once()
+        mock_db_session.commit.assert_called_once()
+    
+    async def test_revoke_session_already_inactive(self, auth_service, mock_db_session):
+        """Test revoking an unknown or already revoked session."""
+        mock_result = MagicMock()
+        mock_result.first.return_value = None
+        mock_db_session.execute.return_value = mock_result
+        
+        result = await auth_service.revoke_session("revoked-token")
+        
+        assert result == False
+        mock_db_session.commit.assert_not_called()
+    
+    async def test_revoke_all_user_sessions(self, auth_service, mock_db_session):
+        """Test revoking all sessions commits one UPDATE and evicts the cache."""
+        mock_db_session.execute.return_value = MagicMock(rowcount=3)
+        auth_service.session_cache = MagicMock()
+        auth_service.session_cache.delete_user = AsyncMock()
+        
+        count = await auth_service.revoke_all_user_sessions("test-user")
+        
+        assert count == 3
+        mock_db_session.execute.assert_called_once()
+        sql = str(mock_db_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE user_sessions SET is_active")
         mock_db_session.commit.assert_called_once()
+        auth_service.session_cache.delete_user.assert_called_once_with("test-user")
+    
+    async def test_refresh_session(self, auth_service, mock_db_session):
+        """Test refreshing rotates the token in one statement."""
+        mock_result = MagicMock()
+        mock_result.first.return_value = MagicMock(user_id="test-user")
+        mock_db_session.execute.return_value = mock_result
+        
+        new_token = await auth_service.refresh_session("old-token")
+        
+        assert new_token is not None
+        assert new_token != "old-token"
+        mock_db_session.execute.assert_called_once()
+        mock_db_session.commit.assert_called_once()
+    
+    async def test_refresh_session_invalid(self, auth_service, mock_db_session):
+        """Test refreshing an expired or revoked session."""
+        mock_result = MagicMock()
+        mock_result.first.return_value = None
+        mock_db_session.execute.return_value = mock_result
+        
+        assert await auth_service.refresh_session("expired-token") is None
+        mock_db_session.commit.assert_not_called()
     
     async def test_cleanup_expired_sessions(self, auth_service, mock_db_session):
         """Test cleaning up expired sessions."""
@@ -460,6 +872,36 @@ class TestAuthService:
         mock_db_session.execute.assert_called_once()
         mock_db_session.commit.assert_called_once()
     
+    async def test_cleanup_expired_sessions_batches(self, auth_service, mock_db_session):
+        """Test expired sessions are deleted in batches until one comes back short."""
+        full_batch = MagicMock(rowcount=2)
+        last_batch = MagicMock(rowcount=1)
+        mock_db_session.execute.side_effect = [full_batch, last_batch]
+        
+        with patch('app.services.auth_service.settings.SESSION_CLEANUP_BATCH_SIZE', 2):
+            count = await auth_service.cleanup_expired_sessions()
+        
+        assert count == 3
+        assert mock_db_session.execute.call_count == 2
+        assert mock_db_session.commit.call_count == 2
+        sql = str(mock_db_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("DELETE FROM user_sessions")
+        assert "FOR UPDATE SKIP LOCKED" in sql
+    
+    async def test_cleanup_expired_sessions_stops_on_empty_batch(self, auth_service, mock_db_session):
+        """Test cleanup never loops on a batch that deleted nothing."""
+        mock_db_session.execute.return_value = MagicMock(rowcount=0)
+        
+        with patch('app.services.auth_service.settings.SESSION_CLEANUP_BATCH_SIZE', 0):
+            assert await auth_service.cleanup_expired_sessions() == 0
+        
+        assert mock_db_session.execute.call_count == 1
+    
+    def test_cleanup_batch_size_must_be_positive(self):
+        """Test a non-positive cleanup batch size is rejected at startup."""
+        with pytest.raises(ValidationError):
+            Settings(SESSION_CLEANUP_BATCH_SIZE=0)
+    
     async def test_validate_session_token_valid(self, auth_service, mock_db_session):
         """Test validating a valid session token."""
         # Mock get_session to return a valid session
@@ -519,6 +961,24 @@ class TestAuthService:
         # Verify database operations
         mock_db_session.execute.assert_called_once()
     
+    async def test_get_user_sessions_page(self, auth_service, mock_db_session):
+        """Test paging user sessions selects only the requested columns."""
+        last_accessed = datetime.now()
+        mock_result = MagicMock()
+        mock_result.all.return_value = [("token1", last_accessed)]
+        mock_db_session.execute.return_value = mock_result
+        
+        rows = await auth_service.get_user_sessions_page(
+            "test-user", limit=10, offset=20, columns=("session_token", "last_accessed")
+        )
+        
+        assert rows == [("token1", last_accessed)]
+        query = mock_db_session.execute.call_args.args[0]
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("SELECT user_sessions.session_token, user_sessions.last_accessed \nFROM")
+        assert "ORDER BY user_sessions.last_accessed DESC" in sql
+        assert query.compile().params["param_1"] == 10
+    
     async def test_update_session_preferences(self, auth_service, mock_db_session):
         """Test updating session preferences."""
         # Mock get_session to return a valid session
@@ -545,6 +1005,22 @@ class TestAuthService:
             mock_get_session.assert_called_once_with("test-token")
             mock_db_session.commit.assert_called_once()
     
+    async def test_update_session_preferences_postgres_merge(self, auth_service, mock_db_session):
+        """Test preferences are merged server-side in one UPDATE on PostgreSQL."""
+        mock_db_session.get_bind.return_value.dialect.name = "postgresql"
+        mock_db_session.execute.return_value = MagicMock()
+        
+        with patch.object(auth_service, 'get_session') as mock_get_session:
+            success = await auth_service.update_session_preferences("test-token", {"theme": "dark"})
+        
+        assert success is True
+        mock_get_session.assert_not_called()
+        mock_db_session.execute.assert_called_once()
+        sql = str(mock_db_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "CAST(user_sessions.preferences AS JSONB) || CAST(" in sql
+        assert "RETURNING user_sessions.id" in sql
+        mock_db_session.commit.assert_called_once()
+    
     async def test_jwt_fallback_verification_with_secret(self, auth_service):
         """Test JWT fallback verification with secret key."""
         # Mock settings to have JWT secret
@@ -573,6 +1049,47 @@ class TestAuthService:
             assert result["email"] == "test@example.com"
             assert result["role"] == "authenticated"
     
+    async def test_jwt_fallback_verification_reuses_signing_key(self, auth_service):
+        """Test the shared-secret signing key is parsed once across verifications."""
+        auth_service_module._get_secret_jwk.cache_clear()
+        with patch('app.services.auth_service.settings') as mock_settings:
+            mock_settings.JWT_SECRET_KEY = "test-secret"
+            mock_settings.JWT_ALGORITHM = "HS512"
+            mock_settings.ENVIRONMENT = "production"
+            
+            token = jwt.encode({"sub": "test-user-123"}, "test-secret", algorithm="HS512")
+            forged = jwt.encode({"sub": "test-user-123"}, "other-secret", algorithm="HS512")
+            
+            assert (await auth_service._verify_jwt_fallback(token))["user_id"] == "test-user-123"
+            assert (await auth_service._verify_jwt_fallback(token))["user_id"] == "test-user-123"
+            assert await auth_service._verify_jwt_fallback(forged) is None
+            assert auth_service_module._get_secret_jwk.cache_info().misses == 1
+    
+    async def test_jwt_fallback_verification_hs256_rejections(self, auth_service):
+        """Test the HS256 fast path rejects what PyJWT would reject."""
+        secret = "test-secret-with-at-least-32-bytes!"
+        with patch('app.services.auth_service.settings') as mock_settings:
+            mock_settings.JWT_SECRET_KEY = secret
+            mock_settings.JWT_ALGORITHM = "HS256"
+            mock_settings.ENVIRONMENT = "production"
+            
+            valid = jwt.encode({"sub": "u", "exp": int(time.time()) + 60}, secret, algorithm="HS256")
+            header, payload, signature = valid.split(".")
+            tampered = ".".join([header, jwt.encode({"sub": "admin"}, secret).split(".")[1], signature])
+            
+            assert (await auth_service._verify_jwt_fallback(valid))["user_id"] == "u"
+            for token in [
+                tampered,
+                jwt.encode({"sub": "u"}, "wrong-secret-with-at-least-32-bytes", algorithm="HS256"),
+                jwt.encode({"sub": "u", "exp": int(time.time()) - 1}, secret, algorithm="HS256"),
+                jwt.encode({"sub": "u", "nbf": int(time.time()) + 60}, secret, algorithm="HS256"),
+                jwt.encode({"sub": "u", "iat": int(time.time()) + 60}, secret, algorithm="HS256"),
+                jwt.encode({"sub": "u"}, secret, algorithm="HS256", headers={"crit": ["b64"], "b64": True}),
+                jwt.encode({"sub": "u"}, secret, algorithm="HS512"),
+                "not.a.jwt",
+            ]:
+                assert await auth_service._verify_jwt_fallback(token) is None
+    
     async def test_jwt_fallback_verification_development(self, auth_service):
         """Test JWT fallback verification in development mode."""
         # Mock settings for development
@@ -596,6 +1113,53 @@ class TestAuthService:
             assert result is not None
             assert result["user_id"] == "test-user-123"
             assert result["email"] == "test@example.com"
+    
+    async def test_jwt_fallback_verification_development_malformed(self, auth_service):
+        """Test malformed tokens are rejected in development mode."""
+        with patch('app.services.auth_service.settings') as mock_settings:
+            mock_settings.JWT_SECRET_KEY = ""
+            mock_settings.ENVIRONMENT = "development"
+            
+            assert await auth_service._verify_jwt_fallback("not-a-jwt") is None
+            assert await auth_service._verify_jwt_fallback("a.!!!.c") is None
+
+
+
+class TestSessionCleanupTask:
+    """Test expired-session cleanup runs off the request path."""
+    
+    async def test_run_session_cleanup_repeats_until_cancelled(self):
+        """Test the background loop cleans up after each interval."""
+        with patch('app.core.auth.asyncio.sleep', AsyncMock(side_effect=[None, None, asyncio.CancelledError])), \
+             patch('app.core.auth.cleanup_expired_sessions_once', AsyncMock(return_value=3)) as mock_cleanup:
+            with pytest.raises(asyncio.CancelledError):
+                await run_session_cleanup(60)
+        
+        assert mock_cleanup.call_count == 2
+    
+    async def test_auth_middleware_does_not_wait_for_cleanup(self):
+        """Test a due cleanup is scheduled in the background, not awaited by the request."""
+        cleanup_started = asyncio.Event()
+        release_cleanup = asyncio.Event()
+        
+        async def slow_cleanup():
+            cleanup_started.set()
+            await release_cleanup.wait()
+            return 0
+        
+        downstream = AsyncMock()
+        middleware = AuthMiddleware(downstream)
+        middleware._last_cleanup = datetime.now() - timedelta(hours=2)
+        
+        with patch('app.core.auth.cleanup_expired_sessions_once', slow_cleanup):
+            await middleware({"type": "http"}, AsyncMock(), AsyncMock())
+            await asyncio.wait_for(cleanup_started.wait(), timeout=1)
+            
+            downstream.assert_called_once()
+            assert not middleware._cleanup_task.done()
+            
+            release_cleanup.set()
+            await middleware._cleanup_task
 
 
 if __name__ == "__main__":
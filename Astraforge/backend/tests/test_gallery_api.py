@@ -1,12 +1,17 @@
 """
 Tests for gallery API endpoints.
 """
+import asyncio
 import pytest
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from uuid import uuid4
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from app.main import app
 from app.schemas.mission import MissionSummaryResponse
@@ -354,7 +359,7 @@ class TestGalleryService:
     @pytest.fixture
     def mock_db_session(self):
         """Mock database session."""
-        return AsyncMock()
+        return AsyncMock(spec=AsyncSession)
     
     @pytest.fixture
     def gallery_service(self, mock_db_session):
@@ -365,8 +370,8 @@ class TestGalleryService:
     async def test_get_featured_missions_empty_result(self, gallery_service, mock_db_session):
         """Test getting featured missions when no missions exist."""
         # Mock empty database result
-        mock_result = AsyncMock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
         mock_db_session.execute.return_value = mock_result
         
         # Get featured missions
@@ -376,16 +381,78 @@ class TestGalleryService:
         assert missions == []
         mock_db_session.execute.assert_called_once()
     
+    async def test_get_featured_missions_reuses_cached_statement(self, gallery_service, mock_db_session):
+        """Test featured queries share one cached statement with the limit bound."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_db_session.execute.return_value = mock_result
+        
+        await gallery_service.get_featured_missions(limit=5)
+        await gallery_service.get_featured_missions(limit=25)
+        
+        first, second = (call.args[0] for call in mock_db_session.execute.call_args_list)
+        assert isinstance(first, StatementLambdaElement)
+        assert first._generate_cache_key().key == second._generate_cache_key().key
+        assert 25 in second.compile(dialect=postgresql.dialect()).params.values()
+    
+    async def test_get_featured_missions_projects_summary_columns(self, gallery_service, mock_db_session):
+        """Test that featured missions are built from summary columns only."""
+        mission_id = uuid4()
+        created_at = datetime.now()
+        mock_result = MagicMock()
+        mock_result.all.return_value = [
+            SimpleNamespace(
+                id=mission_id,
+                name="Mars Sample Return",
+                description="A mission to collect samples from Mars",
+                objectives=["Collect samples"],
+                target_body="mars",
+                vehicle_type="probe",
+                total_delta_v=4700.0,
+                flight_time_days=260.0,
+                created_at=created_at,
+                user_id="test-user",
+                is_public=True,
+                difficulty_rating=4,
+                has_simulation_results=True
+            )
+        ]
+        mock_db_session.execute.return_value = mock_result
+        
+        missions = await gallery_service.get_featured_missions(limit=10)
+        
+        assert len(missions) == 1
+        assert missions[0].id == mission_id
+        assert missions[0].target_body.value == "mars"
+        assert missions[0].has_simulation_results is True
+        
+        # The JSON documents are never fetched whole
+        query = mock_db_session.execute.call_args.args[0]
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        assert "missions.trajectory," not in sql
+        assert "missions.spacecraft_config," not in sql
+    
+    async def test_get_popular_missions_binds_time_threshold(self, gallery_service, mock_db_session):
+        """Test the popularity window is a bound datetime, not interpolated SQL."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_db_session.execute.return_value = mock_result
+        
+        await gallery_service.get_popular_missions(time_period="month", limit=10)
+        
+        compiled = mock_db_session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        assert "INTERVAL" not in str(compiled)
+        thresholds = [v for v in compiled.params.values() if isinstance(v, datetime)]
+        assert len(thresholds) == 1
+        assert datetime.now() - thresholds[0] >= timedelta(days=30)
+    
     async def test_search_missions_advanced_with_filters(self, gallery_service, mock_db_session):
         """Test advanced search with multiple filters."""
         # Mock database results
-        mock_missions_result = AsyncMock()
-        mock_missions_result.scalars.return_value.all.return_value = []
+        mock_missions_result = MagicMock()
+        mock_missions_result.all.return_value = []
         
-        mock_count_result = AsyncMock()
-        mock_count_result.scalar.return_value = 0
-        
-        mock_db_session.execute.side_effect = [mock_missions_result, mock_count_result]
+        mock_db_session.execute.return_value = mock_missions_result
         
         # Perform search
         filters = {
@@ -410,23 +477,162 @@ class TestGalleryService:
         assert result.page_size == 20
         assert result.missions == []
         
-        # Verify database calls
+        # The total rides along with the page; no separate count query
+        assert mock_db_session.execute.call_count == 1
+    
+    async def test_search_has_simulation_uses_exists(self, gallery_service, mock_db_session):
+        """Test the simulation filter is a semi-join rather than a row-multiplying JOIN."""
+        mock_missions_result = MagicMock()
+        mock_missions_result.all.return_value = []
+        mock_db_session.execute.return_value = mock_missions_result
+        
+        await gallery_service.search_missions_advanced(query="mars", filters={"has_simulation": True})
+        
+        sql = str(mock_db_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "JOIN" not in sql
+        assert sql.count("EXISTS (SELECT simulation_results.id") == 2
+    
+    async def test_search_filters_match_expression_indexes(self, gallery_service, mock_db_session):
+        """Test JSON filters render the exact expressions the partial indexes are built on."""
+        mock_missions_result = MagicMock()
+        mock_missions_result.all.return_value = []
+        mock_db_session.execute.return_value = mock_missions_result
+        
+        await gallery_service.search_missions_advanced(
+            query="mars",
+            filters={"target_body": "mars", "vehicle_type": "probe", "difficulty_min": 2}
+        )
+        
+        sql = str(mock_db_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "missions.trajectory->>'target_body' = " in sql
+        assert "missions.spacecraft_config->>'vehicle_type' = " in sql
+    
+    async def test_search_missions_takes_total_from_window_count(self, gallery_service, mock_db_session):
+        """Test that the total count is read from the first row of the page."""
+        mock_missions_result = MagicMock()
+        mock_missions_result.all.return_value = []
+        mock_db_session.execute.return_value = mock_missions_result
+        
+        await gallery_service.search_missions_advanced(query="mars", filters={}, page=1, page_size=20)
+        
+        search_query = mock_db_session.execute.call_args.args[0]
+        sql = str(search_query.compile(dialect=postgresql.dialect()))
+        assert "count(*) OVER () AS total_count" in sql
+    
+    async def test_search_missions_streams_large_pages(self, gallery_service, mock_db_session):
+        """Test that pages above the batch size are read through a server-side cursor."""
+        from app.services.gallery_service import SEARCH_STREAM_BATCH_SIZE
+        
+        mock_stream = MagicMock()
+        mock_stream.__aiter__.return_value = []
+        mock_db_session.stream.return_value = mock_stream
+        
+        result = await gallery_service.search_missions_advanced(
+            query="mars", filters={}, page=1, page_size=SEARCH_STREAM_BATCH_SIZE + 1
+        )
+        
+        assert result.total_count == 0
+        mock_db_session.execute.assert_not_called()
+        streamed_query = mock_db_session.stream.call_args.args[0]
+        assert streamed_query.get_execution_options()["yield_per"] == SEARCH_STREAM_BATCH_SIZE
+    
+    async def test_search_missions_counts_separately_past_last_page(self, gallery_service, mock_db_session):
+        """Test that an empty page past the end still reports the total."""
+        mock_missions_result = MagicMock()
+        mock_missions_result.all.return_value = []
+        mock_count_result = MagicMock()
+        mock_count_result.scalar.return_value = 25
+        mock_db_session.execute.side_effect = [mock_missions_result, mock_count_result]
+        
+        result = await gallery_service.search_missions_advanced(query="mars", filters={}, page=3, page_size=20)
+        
+        assert result.total_count == 25
+        assert result.missions == []
+        assert result.has_previous is True
         assert mock_db_session.execute.call_count == 2
     
-    async def test_get_gallery_stats_calculation(self, gallery_service, mock_db_session):
-        """Test gallery stats calculation."""
-        # Mock database results for different queries
-        mock_results = [
-            AsyncMock(),  # total missions
-            AsyncMock(),  # simulated missions  
-            AsyncMock()   # recent missions
+    async def test_search_missions_cursor_seeks_instead_of_offset(self, gallery_service, mock_db_session):
+        """Test that newest-first pages hand out a cursor the next page seeks from."""
+        created_at = datetime.now()
+        rows = [
+            SimpleNamespace(
+                id=uuid4(),
+                name=f"Mission {i}",
+                description="A mission to Mars",
+                objectives=[],
+                target_body="mars",
+                vehicle_type="probe",
+                total_delta_v=4700.0,
+                flight_time_days=260.0,
+                created_at=created_at - timedelta(days=i),
+                user_id="test-user",
+                is_public=True,
+                difficulty_rating=3,
+                has_simulation_results=False,
+                total_count=5
+            )
+            for i in range(3)
         ]
+        mock_first_page = MagicMock()
+        mock_first_page.all.return_value = rows[:2]
+        mock_next_page = MagicMock()
+        mock_next_page.all.return_value = rows[2:]
+        mock_db_session.execute.side_effect = [mock_first_page, mock_next_page]
+        filters = {"sort_by": "created_at", "sort_order": "desc"}
+        
+        first = await gallery_service.search_missions_advanced(query="mars", filters=filters, page_size=2)
+        assert first.total_count == 5
+        assert first.next_cursor is not None
+        
+        second = await gallery_service.search_missions_advanced(
+            query="mars", filters=filters, page_size=2, cursor=first.next_cursor
+        )
         
-        mock_results[0].scalar.return_value = 100  # total
-        mock_results[1].scalar.return_value = 75   # simulated
-        mock_results[2].scalar.return_value = 10   # recent
-        
-        mock_db_session.execute.side_effect = mock_results
+        compiled = mock_db_session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        assert "OFFSET" not in sql
+        assert "OVER ()" not in sql
+        assert "(missions.created_at, missions.id) < (" in sql
+        assert rows[1].created_at in compiled.params.values()
+        assert rows[1].id in compiled.params.values()
+        assert second.total_count is None
+        assert second.has_next is False
+        assert second.has_previous is True
+        assert second.next_cursor is None
+        
+    async def test_search_missions_rejects_invalid_cursor(self, gallery_service, mock_db_session):
+        """Test that a tampered cursor is reported as a validation error."""
+        with pytest.raises(ValueError):
+            await gallery_service.search_missions_advanced(
+                query="mars",
+                filters={"sort_by": "created_at"},
+                cursor="not-a-cursor"
+            )
+        mock_db_session.execute.assert_not_called()
+    
+    async def test_search_missions_uses_full_text_search_on_postgres(self, gallery_service, mock_db_session):
+        """Test that Postgres searches probe the tsvector instead of ILIKE scans."""
+        mock_db_session.get_bind.return_value.dialect.name = "postgresql"
+        
+        mock_missions_result = MagicMock()
+        mock_missions_result.all.return_value = []
+        mock_db_session.execute.return_value = mock_missions_result
+        
+        await gallery_service.search_missions_advanced(query="mars mission", filters={})
+        
+        search_query = mock_db_session.execute.call_args_list[0].args[0]
+        sql = str(search_query.compile(dialect=postgresql.dialect()))
+        assert "missions.search_vec @@ websearch_to_tsquery" in sql
+        assert "ts_rank_cd(missions.search_vec" in sql
+        assert "ORDER BY rank DESC" in sql
+        assert "ILIKE" not in sql.upper()
+    
+    async def test_get_gallery_stats_calculation(self, gallery_service, mock_db_session):
+        """Test gallery stats calculation."""
+        # All three counts come back from a single statement
+        mock_result = MagicMock()
+        mock_result.one.return_value = (100, 75, 10)
+        mock_db_session.execute.return_value = mock_result
         
         # Get stats
         stats = await gallery_service.get_gallery_stats()
@@ -438,7 +644,155 @@ class TestGalleryService:
         assert stats["simulation_rate"] == 0.75
         
         # Verify database calls
-        assert mock_db_session.execute.call_count == 3
+        assert mock_db_session.execute.call_count == 1
+        sql = str(mock_db_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.count("FILTER (WHERE") == 2
+        assert "JOIN" not in sql
+    
+    async def test_example_category_filter_matches_target_body_index(self, gallery_service, mock_db_session):
+        """Test the category filter renders the indexed target_body expression verbatim."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_db_session.execute.return_value = mock_result
+        
+        await gallery_service.get_example_missions(category="mars")
+        
+        query = mock_db_session.execute.call_args.args[0]
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        assert "missions.trajectory->>'target_body' = " in sql
+    
+    async def test_get_mission_categories_reads_view_on_postgres(self, gallery_service, mock_db_session):
+        """Test that Postgres categories come from the materialized view."""
+        mock_db_session.get_bind.return_value.dialect.name = "postgresql"
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = [("mars", 15), ("moon", 8)]
+        mock_db_session.execute.return_value = mock_result
+        
+        categories = await gallery_service.get_mission_categories()
+        
+        assert categories == {"mars": 15, "moon": 8}
+        query = mock_db_session.execute.call_args.args[0]
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        assert "FROM mv_mission_categories" in sql
+        assert "GROUP BY" not in sql
+    
+    async def test_refresh_stats_views(self, gallery_service, mock_db_session):
+        """Test that every gallery view is refreshed concurrently and committed."""
+        mock_db_session.get_bind.return_value.dialect.name = "postgresql"
+        
+        await gallery_service.refresh_stats_views()
+        
+        statements = [str(call.args[0]) for call in mock_db_session.execute.call_args_list]
+        assert statements == [
+            "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_gallery_stats",
+            "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_mission_categories",
+            "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_difficulty_distribution",
+        ]
+        mock_db_session.commit.assert_awaited_once()
+    
+    async def test_gallery_cache_hit_skips_database(self, gallery_service, mock_db_session):
+        """Test cached aggregates are decoded from Redis without querying."""
+        from app.services.gallery_service import _RedisGalleryCache
+        
+        client = MagicMock()
+        client.hget = AsyncMock(return_value=b'{"1": 5, "3": 12}')
+        gallery_service.cache = _RedisGalleryCache(client, 60)
+        
+        distribution = await gallery_service.get_difficulty_distribution()
+        
+        assert distribution == {1: 5, 3: 12}
+        client.hget.assert_awaited_once_with("gallery:cache", "difficulty")
+        mock_db_session.execute.assert_not_called()
+    
+    async def test_gallery_cache_miss_stores_result(self, gallery_service, mock_db_session):
+        """Test a cache miss queries the database and caches the result."""
+        from app.services.gallery_service import _RedisGalleryCache
+        
+        client = MagicMock()
+        client.hget = AsyncMock(return_value=None)
+        client.expire = AsyncMock()
+        pipe = client.pipeline.return_value
+        pipe.execute = AsyncMock(return_value=[1, -1])
+        gallery_service.cache = _RedisGalleryCache(client, 60)
+        
+        mock_result = MagicMock()
+        mock_result.one.return_value = (100, 75, 10)
+        mock_db_session.execute.return_value = mock_result
+        
+        stats = await gallery_service.get_gallery_stats()
+        
+        assert stats["simulation_rate"] == 0.75
+        pipe.hset.assert_called_once()
+        key, field, payload = pipe.hset.call_args.args
+        assert (key, field) == ("gallery:cache", "stats")
+        assert b'"total_missions":100' in payload
+        client.expire.assert_awaited_once_with("gallery:cache", 60)
+    
+    async def test_gallery_cache_keeps_existing_expiry(self):
+        """Test later writes do not push back the hash's expiry."""
+        from app.services.gallery_service import _RedisGalleryCache, _DIFFICULTY_ADAPTER
+        
+        client = MagicMock()
+        client.expire = AsyncMock()
+        client.pipeline.return_value.execute = AsyncMock(return_value=[1, 42])
+        
+        await _RedisGalleryCache(client, 60).set("difficulty", _DIFFICULTY_ADAPTER, {1: 5})
+        
+        client.expire.assert_not_called()
+    
+    async def test_gallery_cache_stale_payload_is_a_miss(self, gallery_service, mock_db_session):
+        """Test an entry that no longer validates is ignored instead of failing the request."""
+        from app.services.gallery_service import _RedisGalleryCache
+        
+        client = MagicMock()
+        client.hget = AsyncMock(return_value=b'{"mars": "many"}')
+        client.pipeline.return_value.execute = AsyncMock(return_value=[0, 30])
+        gallery_service.cache = _RedisGalleryCache(client, 60)
+        
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = [("mars", 15)]
+        mock_db_session.execute.return_value = mock_result
+        
+        assert await gallery_service.get_mission_categories() == {"mars": 15}
+        mock_db_session.execute.assert_awaited_once()
+    
+    async def test_gallery_cache_errors_fall_back_to_database(self, gallery_service, mock_db_session):
+        """Test Redis failures are treated as cache misses."""
+        from app.services.gallery_service import _RedisGalleryCache
+        
+        client = MagicMock()
+        client.hget = AsyncMock(side_effect=ConnectionError("redis down"))
+        client.pipeline.return_value.execute = AsyncMock(side_effect=ConnectionError("redis down"))
+        gallery_service.cache = _RedisGalleryCache(client, 60)
+        
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = [("mars", 15)]
+        mock_db_session.execute.return_value = mock_result
+        
+        assert await gallery_service.get_mission_categories() == {"mars": 15}
+    
+    async def test_invalidate_gallery_cache(self):
+        """Test mission writes drop the whole gallery hash."""
+        from app.services.gallery_service import _RedisGalleryCache, invalidate_gallery_cache
+        
+        client = MagicMock()
+        client.delete = AsyncMock()
+        with patch('app.services.gallery_service.get_gallery_cache', return_value=_RedisGalleryCache(client, 60)):
+            await invalidate_gallery_cache()
+        
+        client.delete.assert_awaited_once_with("gallery:cache")
+    
+    async def test_run_gallery_stats_refresh_repeats_until_cancelled(self):
+        """Test the background loop refreshes the views after each interval."""
+        from app.services.gallery_service import run_gallery_stats_refresh
+        
+        with patch('app.services.gallery_service.asyncio.sleep', AsyncMock(side_effect=[None, None, asyncio.CancelledError])), \
+             patch('app.services.gallery_service.AsyncSessionLocal', MagicMock()), \
+             patch('app.services.gallery_service.GalleryService.refresh_stats_views', AsyncMock()) as mock_refresh:
+            with pytest.raises(asyncio.CancelledError):
+                await run_gallery_stats_refresh(300)
+        
+        assert mock_refresh.await_count == 2
 
 
 if __name__ == "__main__":
@@ -5,22 +5,36 @@ Tests the core GA components including Individual, Population,
 genetic operators, and the main GeneticAlgorithm class.
 """
 
+import pickle
 import pytest
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from uuid import uuid4
 from typing import Dict, List
 
 from app.optimization.genetic_algorithm import (
-    Individual, Population, GeneticAlgorithm, GAConfig,
+    Individual, Population, GeneticAlgorithm, GAConfig, GeneVector,
     SelectionMethod, CrossoverMethod, MutationMethod
 )
 from app.optimization.operators import (
     TournamentSelection, RouletteWheelSelection,
     UniformCrossover, SinglePointCrossover, ArithmeticCrossover,
-    GaussianMutation, UniformMutation, PolynomialMutation
+    GaussianMutation, UniformMutation, PolynomialMutation, AdaptiveMutation,
+    BanditCrossover, BanditMutation,
+    _polynomial_mutation_kernel, _polynomial_mutation_numpy
 )
 
 
+def sphere_fitness(individual: Individual) -> float:
+    """Module-level fitness function so it can be sent to worker processes."""
+    return -sum(x**2 for x in individual.genes.values())
+
+
+def x_below_one(individual: Individual) -> bool:
+    """Module-level constraint function for parallel evaluation tests."""
+    return individual.genes['x'] < 1.0
+
+
 class TestIndividual:
     """Test Individual class."""
     
@@ -78,6 +92,57 @@ class TestIndividual:
         assert individual.genes['y'] == 5.0
         assert individual.genes['z'] == 6.0
     
+    def test_gene_vec_storage(self):
+        """Test that genes are stored as an aligned float array."""
+        individual = Individual(genes={'x': 1.0, 'y': 2.0})
+        
+        assert isinstance(individual.genes, GeneVector)
+        assert individual.gene_names == ('x', 'y')
+        np.testing.assert_array_equal(individual.gene_vec, np.array([1.0, 2.0]))
+        
+        individual.gene_vec = np.array([3.0, 4.0])
+        assert individual.genes == {'x': 3.0, 'y': 4.0}
+        
+        # Copies share the layout but not the values
+        copy = individual.copy()
+        copy.genes['x'] = 10.0
+        assert copy.gene_names is individual.gene_names
+        assert individual.genes['x'] == 3.0
+    
+    def test_reset_eval_state(self):
+        """Test that evaluation results are dropped without touching copies."""
+        original = Individual(
+            genes={'x': 1.0},
+            fitness=2.0,
+            objectives={'obj1': 3.0},
+            constraints_violated=['constraint1']
+        )
+        copy = original.copy()
+        
+        copy._reset_eval_state()
+        
+        assert not copy.is_evaluated
+        assert copy.objectives == {}
+        assert copy.is_feasible
+        assert original.objectives == {'obj1': 3.0}
+    
+    def test_individual_slots(self):
+        """Test that individuals do not carry a per-instance __dict__."""
+        individual = Individual(genes={'x': 1.0})
+        
+        assert not hasattr(individual, '__dict__')
+        with pytest.raises(AttributeError):
+            individual.unknown_attribute = 1.0
+    
+    def test_individual_pickle(self):
+        """Test that individuals survive a pickle round trip."""
+        individual = Individual(genes={'x': 1.0, 'y': 2.0}, fitness=3.0)
+        
+        restored = pickle.loads(pickle.dumps(individual))
+        
+        assert restored == individual
+        assert restored.gene_names == ('x', 'y')
+    
     def test_gene_vector_length_mismatch(self):
         """Test gene vector operations with mismatched lengths."""
         individual = Individual(genes={'x': 1.0, 'y': 2.0})
@@ -293,6 +358,28 @@ class TestTournamentSelection:
         # Higher fitness individuals should be more likely to be selected
         assert all(parent.fitness is not None for parent in parents)
     
+    def test_tournament_selection_distinct_participants(self):
+        """Test that small tournaments draw distinct participants."""
+        selector = TournamentSelection(tournament_size=4, seed=1)
+        candidates = [Individual(genes={'x': float(i)}) for i in range(4)]
+        
+        for _ in range(20):
+            tournament = selector._sample_tournament(candidates, 4)
+            assert len({ind.id for ind in tournament}) == 4
+    
+    def test_tournament_selection_full_tournament(self):
+        """Test that a tournament covering the population picks the best."""
+        selector = TournamentSelection(tournament_size=10)
+        population = Population(max_size=10)
+        
+        for i in range(3):
+            ind = Individual(genes={'x': float(i)})
+            ind.fitness = float(i)
+            population.add_individual(ind)
+        
+        parents = selector.select(population, 3)
+        assert [parent.fitness for parent in parents] == [2.0, 2.0, 2.0]
+    
     def test_tournament_selection_empty_population(self):
         """Test tournament selection with empty population."""
         selector = TournamentSelection(tournament_size=3)
@@ -307,6 +394,28 @@ class TestTournamentSelection:
             TournamentSelection(tournament_size=0)
 
 
+class TestRouletteWheelSelection:
+    """Test RouletteWheelSelection operator."""
+    
+    @pytest.mark.parametrize("scaling_factor", [1.0, 2.0])
+    def test_roulette_wheel_selection(self, scaling_factor):
+        """Test roulette wheel selection with and without fitness scaling."""
+        selector = RouletteWheelSelection(scaling_factor=scaling_factor, seed=7)
+        population = Population(max_size=10)
+        
+        for i in range(5):
+            ind = Individual(genes={'x': float(i)})
+            ind.fitness = float(i - 2)  # Includes negative fitness
+            population.add_individual(ind)
+        
+        parents = selector.select(population, 200)
+        
+        assert len(parents) == 200
+        # Fitter individuals are picked more often
+        counts = [sum(1 for p in parents if p.fitness == f) for f in (-2.0, 2.0)]
+        assert counts[1] > counts[0]
+
+
 class TestUniformCrossover:
     """Test UniformCrossover operator."""
     
@@ -333,12 +442,112 @@ class TestUniformCrossover:
         assert offspring1.fitness is None
         assert offspring2.fitness is None
     
+    def test_uniform_crossover_batch(self):
+        """Test batched uniform crossover over many parent pairs."""
+        parents1 = np.zeros((6, 4))
+        parents2 = np.ones((6, 4))
+        
+        swapped1, swapped2 = UniformCrossover(swap_probability=1.0).crossover_batch(parents1, parents2)
+        np.testing.assert_array_equal(swapped1, parents2)
+        np.testing.assert_array_equal(swapped2, parents1)
+        
+        offspring1, offspring2 = UniformCrossover(seed=0).crossover_batch(parents1, parents2)
+        np.testing.assert_array_equal(offspring1 + offspring2, np.ones((6, 4)))
+    
+    def test_uniform_crossover_different_layouts(self):
+        """Test that only shared genes are swapped between different layouts."""
+        crossover = UniformCrossover(swap_probability=1.0)
+        
+        parent1 = Individual(genes={'x': 1.0, 'y': 2.0})
+        parent2 = Individual(genes={'y': 5.0, 'z': 6.0})
+        
+        offspring1, offspring2 = crossover.crossover(parent1, parent2)
+        
+        assert offspring1.genes == {'x': 1.0, 'y': 5.0}
+        assert offspring2.genes == {'y': 2.0, 'z': 6.0}
+    
     def test_invalid_swap_probability(self):
         """Test invalid swap probability."""
         with pytest.raises(ValueError, match="Swap probability must be between 0 and 1"):
             UniformCrossover(swap_probability=1.5)
 
 
+class TestSinglePointCrossover:
+    """Test SinglePointCrossover operator."""
+    
+    def test_single_point_crossover(self):
+        """Test that offspring are spliced from both parents."""
+        crossover = SinglePointCrossover(seed=3)
+        
+        parent1 = Individual(genes={'x': 1.0, 'y': 2.0, 'z': 3.0})
+        parent2 = Individual(genes={'x': 4.0, 'y': 5.0, 'z': 6.0})
+        
+        offspring1, offspring2 = crossover.crossover(parent1, parent2)
+        
+        values1 = list(offspring1.genes.values())
+        values2 = list(offspring2.genes.values())
+        assert values1 in ([1.0, 5.0, 6.0], [1.0, 2.0, 6.0])
+        assert [a + b for a, b in zip(values1, values2)] == [5.0, 7.0, 9.0]
+        assert offspring1.parent_ids == [parent1.id, parent2.id]
+        assert offspring1.fitness is None
+        
+        # Parents are left untouched
+        assert parent1.genes == {'x': 1.0, 'y': 2.0, 'z': 3.0}
+    
+    def test_single_point_crossover_batch(self):
+        """Test batched single-point crossover keeps a prefix from each parent."""
+        parents1 = np.zeros((10, 5))
+        parents2 = np.ones((10, 5))
+        
+        offspring1, _ = SinglePointCrossover(seed=1).crossover_batch(parents1, parents2)
+        
+        for row in offspring1:
+            point = int(np.argmax(row))
+            assert 1 <= point <= 4
+            assert np.all(row[:point] == 0.0) and np.all(row[point:] == 1.0)
+
+
+class TestArithmeticCrossover:
+    """Test ArithmeticCrossover operator."""
+    
+    def test_arithmetic_crossover(self):
+        """Test arithmetic crossover blends gene vectors."""
+        crossover = ArithmeticCrossover(alpha=0.25)
+        
+        parent1 = Individual(genes={'x': 0.0, 'y': 4.0})
+        parent2 = Individual(genes={'x': 4.0, 'y': 0.0})
+        
+        offspring1, offspring2 = crossover.crossover(parent1, parent2)
+        
+        assert offspring1.genes == {'x': 3.0, 'y': 1.0}
+        assert offspring2.genes == {'x': 1.0, 'y': 3.0}
+        assert offspring1.fitness is None
+        assert offspring2.fitness is None
+    
+    def test_crossover_into(self):
+        """Test blending into preallocated buffers."""
+        crossover = ArithmeticCrossover(alpha=0.25)
+        out1 = np.empty(2)
+        out2 = np.empty(2)
+        
+        crossover.crossover_into(np.array([0.0, 4.0]), np.array([4.0, 0.0]), out1, out2)
+        
+        np.testing.assert_allclose(out1, [3.0, 1.0])
+        np.testing.assert_allclose(out2, [1.0, 3.0])
+    
+    def test_arithmetic_crossover_different_layouts(self):
+        """Test arithmetic crossover with only partially shared genes."""
+        crossover = ArithmeticCrossover(alpha=0.5)
+        
+        parent1 = Individual(genes={'x': 0.0, 'y': 4.0})
+        parent2 = Individual(genes={'y': 0.0, 'z': 4.0})
+        
+        offspring1, offspring2 = crossover.crossover(parent1, parent2)
+        
+        assert offspring1.genes == {'x': 0.0, 'y': 2.0}
+        assert offspring2.genes == {'y': 2.0, 'z': 4.0}
+
+
 class TestGaussianMutation:
     """Test GaussianMutation operator."""
     
@@ -358,12 +567,198 @@ class TestGaussianMutation:
         assert 0.0 <= mutated.genes['x'] <= 10.0
         assert 0.0 <= mutated.genes['y'] <= 10.0
     
+    def test_gaussian_mutation_rate_zero(self):
+        """Test that no genes change when mutation rate is zero."""
+        mutator = GaussianMutation(sigma=0.1, gene_bounds={'x': (0.0, 10.0)})
+        
+        original = Individual(genes={'x': 5.0, 'y': 5.0})
+        mutated = mutator.mutate(original, mutation_rate=0.0)
+        
+        assert mutated.genes == original.genes
+    
+    def test_gaussian_mutation_unbounded_gene(self):
+        """Test that genes without bounds are mutated but not clipped."""
+        mutator = GaussianMutation(sigma=100.0, gene_bounds={'x': (0.0, 1.0)})
+        
+        original = Individual(genes={'x': 0.5, 'y': 0.5})
+        mutated = mutator.mutate(original, mutation_rate=1.0)
+        
+        assert 0.0 <= mutated.genes['x'] <= 1.0
+        assert mutated.genes['y'] != 0.5
+    
+    def test_gaussian_mutation_batch(self):
+        """Test batched Gaussian mutation over a population matrix."""
+        gene_bounds = {'x': (0.0, 10.0), 'y': (0.0, 10.0)}
+        mutator = GaussianMutation(sigma=0.5, gene_bounds=gene_bounds)
+        
+        pop_matrix = np.full((20, 2), 5.0)
+        mutated = mutator.mutate_batch(pop_matrix, 1.0, ('x', 'y'))
+        
+        assert mutated.shape == pop_matrix.shape
+        assert np.all((mutated >= 0.0) & (mutated <= 10.0))
+        assert not np.array_equal(mutated, pop_matrix)
+        np.testing.assert_array_equal(pop_matrix, np.full((20, 2), 5.0))
+        
+        unchanged = mutator.mutate_batch(pop_matrix, 0.0, ('x', 'y'))
+        np.testing.assert_array_equal(unchanged, pop_matrix)
+    
+    def test_gaussian_mutation_seeded(self):
+        """Test that operators with the same seed produce the same mutations."""
+        gene_bounds = {'x': (0.0, 10.0), 'y': (0.0, 10.0)}
+        original = Individual(genes={'x': 5.0, 'y': 5.0})
+        
+        mutated1 = GaussianMutation(sigma=0.1, gene_bounds=gene_bounds, seed=42).mutate(original, 1.0)
+        mutated2 = GaussianMutation(sigma=0.1, gene_bounds=gene_bounds, seed=42).mutate(original, 1.0)
+        
+        assert mutated1.genes == mutated2.genes
+    
     def test_invalid_sigma(self):
         """Test invalid sigma."""
         with pytest.raises(ValueError, match="Sigma must be positive"):
             GaussianMutation(sigma=0.0)
 
 
+class TestUniformMutation:
+    """Test UniformMutation operator."""
+    
+    def test_uniform_mutation(self):
+        """Test uniform mutation resamples only bounded genes."""
+        mutator = UniformMutation(gene_bounds={'x': (2.0, 3.0)})
+        
+        original = Individual(genes={'x': 0.0, 'y': 7.0})
+        mutated = mutator.mutate(original, mutation_rate=1.0)
+        
+        assert 2.0 <= mutated.genes['x'] <= 3.0
+        assert mutated.genes['y'] == 7.0
+        assert mutated.fitness is None
+    
+    def test_missing_gene_bounds(self):
+        """Test that uniform mutation requires gene bounds."""
+        with pytest.raises(ValueError, match="Gene bounds must be provided"):
+            UniformMutation(gene_bounds={})
+
+
+class TestPolynomialMutation:
+    """Test PolynomialMutation operator."""
+    
+    def test_polynomial_mutation(self):
+        """Test polynomial mutation keeps bounded genes within bounds."""
+        mutator = PolynomialMutation(eta=5.0, gene_bounds={'x': (0.0, 10.0)})
+        
+        original = Individual(genes={'x': 9.9, 'y': 3.0})
+        for _ in range(20):
+            mutated = mutator.mutate(original, mutation_rate=1.0)
+            
+            assert 0.0 <= mutated.genes['x'] <= 10.0
+            # Genes without bounds are never mutated
+            assert mutated.genes['y'] == 3.0
+            assert mutated.fitness is None
+    
+    def test_polynomial_mutation_batch(self):
+        """Test batched polynomial mutation."""
+        mutator = PolynomialMutation(eta=20.0, gene_bounds={'x': (-1.0, 1.0), 'y': (0.0, 5.0)})
+        
+        pop_matrix = np.tile([0.0, 2.5], (50, 1))
+        mutated = mutator.mutate_batch(pop_matrix, 1.0, ('x', 'y'))
+        
+        assert np.all((mutated[:, 0] >= -1.0) & (mutated[:, 0] <= 1.0))
+        assert np.all((mutated[:, 1] >= 0.0) & (mutated[:, 1] <= 5.0))
+        assert not np.array_equal(mutated, pop_matrix)
+        np.testing.assert_array_equal(mutator.mutate_batch(pop_matrix, 0.0, ('x', 'y')), pop_matrix)
+    
+    def test_polynomial_kernel_matches_numpy(self):
+        """Test that the fused kernel matches the vectorized implementation."""
+        rng = np.random.default_rng(0)
+        pop_matrix = rng.uniform(0.0, 10.0, size=(8, 3))
+        mask = rng.random(pop_matrix.shape) < 0.7
+        u = rng.random(pop_matrix.shape)
+        base_vec = np.zeros(3)
+        span_vec = np.full(3, 10.0)
+        
+        expected = _polynomial_mutation_numpy(pop_matrix, mask, u, base_vec, span_vec, 1 / 21)
+        kernel = getattr(_polynomial_mutation_kernel, 'py_func', _polynomial_mutation_kernel)
+        for run_kernel in {kernel, _polynomial_mutation_kernel}:
+            mutated = pop_matrix.copy()
+            run_kernel(mutated, mask, u, base_vec, span_vec, 1 / 21)
+            np.testing.assert_allclose(mutated, expected)
+
+
+class TestAdaptiveMutation:
+    """Test AdaptiveMutation operator."""
+    
+    def test_adaptive_sigma(self):
+        """Test that sigma follows the most recent diversity measurements."""
+        mutator = AdaptiveMutation(base_sigma=0.1)
+        assert mutator.get_adaptive_sigma() == 0.1
+        
+        for _ in range(5):
+            mutator.update_diversity(0.05)
+        assert mutator.get_adaptive_sigma() == pytest.approx(0.2)
+        
+        for _ in range(20):
+            mutator.update_diversity(0.9)
+        assert len(mutator.diversity_history) == AdaptiveMutation.HISTORY_SIZE
+        assert mutator.get_adaptive_sigma() == pytest.approx(0.05)
+
+
+class TestBanditOperators:
+    """Test adaptive (bandit) operator selection."""
+    
+    def test_prefers_operator_with_better_offspring(self):
+        """Test that scores follow the offspring improvement of each operator."""
+        selector = BanditCrossover(
+            {'uniform': UniformCrossover(), 'arithmetic': ArithmeticCrossover()},
+            epsilon=0.0
+        )
+        
+        parents = Population(max_size=10)
+        for value in (0.0, 2.0):
+            ind = Individual(genes={'x': value})
+            ind.fitness = value
+            parents.add_individual(ind)
+        selector.record_generation(parents)
+        
+        offspring = Population(max_size=10)
+        for name, fitness in (('uniform', 0.0), ('arithmetic', 5.0)):
+            child, _ = selector.operators[name].crossover(parents[0], parents[1])
+            selector._track(name, (child,))
+            child.fitness = fitness
+            offspring.add_individual(child)
+        selector.record_generation(offspring)
+        
+        assert selector.ema['arithmetic'] > 0 > selector.ema['uniform']
+        assert selector.choose() == 'arithmetic'
+    
+    def test_ga_with_bandit_operators(self):
+        """Test a full GA run with bandit crossover and mutation."""
+        gene_bounds = {'x': (-5.0, 5.0), 'y': (-5.0, 5.0)}
+        ga = GeneticAlgorithm(
+            config=GAConfig(population_size=10, max_generations=5),
+            fitness_function=sphere_fitness,
+            gene_bounds=gene_bounds,
+            selection_operator=TournamentSelection(tournament_size=3),
+            crossover_operator=BanditCrossover(
+                {'uniform': UniformCrossover(), 'arithmetic': ArithmeticCrossover()}
+            ),
+            mutation_operator=BanditMutation(
+                {
+                    'gaussian': GaussianMutation(sigma=0.1, gene_bounds=gene_bounds),
+                    'polynomial': PolynomialMutation(gene_bounds=gene_bounds)
+                }
+            )
+        )
+        
+        best_individual, statistics = ga.run()
+        
+        assert best_individual is not None
+        assert statistics['generations'] <= 5
+    
+    def test_invalid_epsilon(self):
+        """Test invalid epsilon."""
+        with pytest.raises(ValueError, match="Epsilon must be between 0 and 1"):
+            BanditMutation({'gaussian': GaussianMutation()}, epsilon=2.0)
+
+
 class TestGeneticAlgorithm:
     """Test GeneticAlgorithm class."""
     
@@ -498,6 +893,39 @@ class TestGeneticAlgorithm:
         diversity = ga.get_population_diversity()
         assert diversity == 0.0
     
+    def test_evolve_generation_batched_crossover(self):
+        """Test a generation with batched arithmetic crossover keeps genes in bounds."""
+        ga = self.create_simple_ga()
+        ga.crossover_operator = ArithmeticCrossover(alpha=0.3)
+        ga.initialize_population()
+        
+        ga.evolve_generation()
+        
+        assert len(ga.population) == ga.config.population_size
+        for individual in ga.population:
+            assert -5.0 <= individual.genes['x'] <= 5.0
+            assert -5.0 <= individual.genes['y'] <= 5.0
+    
+    def test_parallel_evaluation(self):
+        """Test population evaluation on a process pool."""
+        gene_bounds = {'x': (-5.0, 5.0), 'y': (-5.0, 5.0)}
+        config = GAConfig(population_size=12, max_generations=3)
+        
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            ga = GeneticAlgorithm(
+                config=config,
+                fitness_function=sphere_fitness,
+                gene_bounds=gene_bounds,
+                constraint_functions=[x_below_one],
+                evaluation_executor=executor
+            )
+            ga.initialize_population()
+            ga.evaluate_population(ga.population)
+        
+        for individual in ga.population:
+            assert individual.fitness == pytest.approx(sphere_fitness(individual))
+            assert individual.is_feasible == x_below_one(individual)
+    
     def test_empty_gene_bounds_error(self):
         """Test error when gene bounds are empty."""
         def fitness_function(individual: Individual) -> float:
@@ -7,6 +7,7 @@ from uuid import uuid4
 from unittest.mock import AsyncMock, patch
 
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
@@ -15,7 +16,7 @@ from app.models.mission import (
     MissionConstraints, DateRange, VehicleType, CelestialBody, TransferType
 )
 from app.models.database import Mission as DBMission
-from app.schemas.mission import MissionCreateRequest, MissionUpdateRequest
+from app.schemas.mission import MissionCreateRequest, MissionUpdateRequest, MissionResponse
 
 
 @pytest.fixture
@@ -530,5 +531,30 @@ class TestMissionService:
         assert complexity > 1.0  # Mars mission should be moderately complex
 
 
+class TestMissionSchemas:
+    """Test mission schema configuration."""
+    
+    def test_response_from_model_attributes(self, sample_mission_data):
+        """Test responses validate directly from the mission model's attributes."""
+        mission = Mission(**sample_mission_data)
+        response = MissionResponse.from_model(mission)
+        
+        assert response.id == mission.id
+        assert response.trajectory.target_body == CelestialBody.MARS
+        
+        with pytest.raises(ValidationError):
+            response.name = "Renamed"
+    
+    def test_request_rejects_unknown_fields(self, sample_mission_data):
+        """Test request schemas reject unexpected fields."""
+        MissionCreateRequest(**sample_mission_data)
+        
+        with pytest.raises(ValidationError):
+            MissionCreateRequest(**sample_mission_data, unexpected_field=True)
+        
+        with pytest.raises(ValidationError):
+            MissionUpdateRequest(name="Updated", unexpected_field=True)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
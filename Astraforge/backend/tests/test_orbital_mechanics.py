@@ -2,6 +2,7 @@
 Unit tests for orbital mechanics calculations.
 """
 
+import dataclasses
 import math
 import pytest
 import numpy as np
@@ -61,6 +62,31 @@ class TestOrbitalElements:
         velocity = elements.orbital_velocity(mu_earth, 7000e3)
         expected_velocity = math.sqrt(mu_earth / 7000e3)
         assert abs(velocity - expected_velocity) < 1e-6
+    
+    def test_pqw_rotation_is_cached_and_orthonormal(self):
+        """Test the perifocal rotation matrix is cached on frozen elements."""
+        elements = OrbitalElements(
+            semi_major_axis=7000e3,
+            eccentricity=0.1,
+            inclination=math.radians(28.5),
+            longitude_of_ascending_node=math.radians(45),
+            argument_of_periapsis=math.radians(30),
+            true_anomaly=0
+        )
+        
+        R = elements.pqw_to_eci
+        assert R is elements.pqw_to_eci
+        np.testing.assert_allclose(R @ R.T, np.eye(3), atol=1e-12)
+        assert not R.flags.writeable
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            elements.inclination = 0.0
+        
+        # Slotted: no per-instance __dict__, and copies rebuild the cache
+        assert not hasattr(elements, '__dict__')
+        rotated = dataclasses.replace(elements, inclination=0.0)
+        assert rotated.pqw_to_eci[2, 2] == pytest.approx(1.0)
+        assert rotated == dataclasses.replace(elements, inclination=0.0)
 
 
 class TestOrbitalMechanics:
@@ -80,6 +106,28 @@ class TestOrbitalMechanics:
             E = OrbitalMechanics.kepler_equation_solver(mean_anomaly, eccentricity)
             assert abs(E - expected_E) < 1e-8
     
+    def test_kepler_equation_solver_vec(self):
+        """Test vectorized Kepler solver across eccentricities and branches."""
+        mean_anomalies = np.linspace(-4 * math.pi, 4 * math.pi, 1001)
+        
+        for eccentricity in (0.0, 0.3, 0.7, 0.95, 0.999):
+            E = OrbitalMechanics.kepler_equation_solver_vec(mean_anomalies, eccentricity)
+            assert E.shape == mean_anomalies.shape
+            residual = E - eccentricity * np.sin(E) - mean_anomalies
+            assert np.max(np.abs(residual)) < 1e-12
+        
+        # Scalar solver agrees with the batch solver
+        E_vec = OrbitalMechanics.kepler_equation_solver_vec(np.array([1.2]), 0.4)
+        assert OrbitalMechanics.kepler_equation_solver(1.2, 0.4) == pytest.approx(E_vec[0], abs=1e-12)
+    
+    def test_kepler_equation_solver_high_eccentricity(self):
+        """Test the Kepler solver converges in two steps for near-parabolic orbits."""
+        for eccentricity in (0.9, 0.99, 0.999, 0.9999):
+            for mean_anomaly in (0.0, 1e-6, 1e-4, 0.1, 1.0, 3.0, -2.5, 7.0):
+                E = OrbitalMechanics.kepler_equation_solver(mean_anomaly, eccentricity, max_iterations=2)
+                residual = E - eccentricity * math.sin(E) - mean_anomaly
+                assert abs(residual) < 1e-10
+    
     def test_true_anomaly_conversion(self):
         """Test conversion from eccentric to true anomaly."""
         # Test circular orbit (e=0)
@@ -89,6 +137,27 @@ class TestOrbitalMechanics:
         # Test elliptical orbit at periapsis
         nu = OrbitalMechanics.true_anomaly_from_eccentric(0, 0.5)
         assert abs(nu - 0) < 1e-8
+        
+        # Half-angle form matches the cos/sin definition of true anomaly
+        e = 0.7
+        E = np.linspace(-math.pi + 1e-6, math.pi - 1e-6, 101)
+        nu = OrbitalMechanics.true_anomaly_from_eccentric_vec(E, e)
+        expected = np.arctan2(math.sqrt(1 - e**2) * np.sin(E), np.cos(E) - e)
+        np.testing.assert_allclose(nu, expected, atol=1e-12)
+        assert OrbitalMechanics.true_anomaly_from_eccentric(E[10], e) == pytest.approx(nu[10], abs=1e-12)
+    
+    def test_true_anomaly_from_mean_vec(self):
+        """Test the near-circular series and the Kepler path agree with the exact solution."""
+        M = np.linspace(-2 * math.pi, 2 * math.pi, 401)
+        
+        for eccentricity, tolerance in ((0.001, 1e-11), (0.015, 1e-7), (0.3, 1e-12), (0.9, 1e-12)):
+            nu = OrbitalMechanics.true_anomaly_from_mean_vec(M, eccentricity)
+            E = np.array([OrbitalMechanics.kepler_equation_solver(m, eccentricity) for m in M])
+            expected = np.array([OrbitalMechanics.true_anomaly_from_eccentric(x, eccentricity) for x in E])
+            
+            # Compare as angles
+            difference = np.angle(np.exp(1j * (nu - expected)))
+            assert np.max(np.abs(difference)) < tolerance
     
     def test_state_vector_conversion(self):
         """Test conversion between orbital elements and state vectors."""
@@ -106,6 +175,15 @@ class TestOrbitalMechanics:
         
         # Convert to state vectors
         position, velocity = OrbitalMechanics.state_vector_from_orbital_elements(elements, mu_earth)
+        assert isinstance(position, tuple) and len(position) == 3
+        assert isinstance(velocity, tuple) and len(velocity) == 3
+        
+        position_np, velocity_np = OrbitalMechanics.state_vector_from_orbital_elements(
+            elements, mu_earth, as_ndarray=True
+        )
+        assert isinstance(position_np, np.ndarray) and position_np.shape == (3,)
+        np.testing.assert_array_equal(position_np, position)
+        np.testing.assert_array_equal(velocity_np, velocity)
         
         # Convert back to orbital elements
         elements_back = OrbitalMechanics.orbital_elements_from_state_vector(position, velocity, mu_earth)
@@ -114,6 +192,34 @@ class TestOrbitalMechanics:
         assert abs(elements_back.semi_major_axis - elements.semi_major_axis) < 1e3
         assert abs(elements_back.eccentricity - elements.eccentricity) < 1e-6
         assert abs(elements_back.inclination - elements.inclination) < 1e-6
+        assert abs(elements_back.longitude_of_ascending_node - elements.longitude_of_ascending_node) < 1e-6
+        assert abs(elements_back.argument_of_periapsis - elements.argument_of_periapsis) < 1e-6
+        assert abs(elements_back.true_anomaly - elements.true_anomaly) < 1e-6
+    
+    def test_state_vectors_from_elements_batch(self):
+        """Test batched state vectors match the scalar conversion."""
+        mu_earth = CELESTIAL_BODIES[CelestialBody.EARTH]['mu']
+        elements = OrbitalElements(
+            semi_major_axis=7000e3,
+            eccentricity=0.1,
+            inclination=math.radians(28.5),
+            longitude_of_ascending_node=math.radians(45),
+            argument_of_periapsis=math.radians(30),
+            true_anomaly=0
+        )
+        true_anomalies = np.linspace(0, 2 * math.pi, 37)
+        
+        positions, velocities = OrbitalMechanics.state_vectors_from_elements(
+            elements, true_anomalies, mu_earth
+        )
+        assert positions.shape == (37, 3)
+        assert velocities.shape == (37, 3)
+        
+        for k, nu in enumerate(true_anomalies):
+            point = dataclasses.replace(elements, true_anomaly=nu)
+            position, velocity = OrbitalMechanics.state_vector_from_orbital_elements(point, mu_earth)
+            np.testing.assert_allclose(positions[k], position, rtol=1e-12, atol=1e-6)
+            np.testing.assert_allclose(velocities[k], velocity, rtol=1e-12, atol=1e-9)
 
 
 class TestDeltaVCalculator:
@@ -196,6 +302,21 @@ class TestDeltaVCalculator:
         
         # Earth to Mars should require reasonable delta-V (roughly 12-15 km/s)
         assert 10000 < delta_v_data['total_delta_v'] < 20000
+        
+        # Repeat calls are memoized but hand out independent copies
+        delta_v_data['total_delta_v'] = 0.0
+        again = DeltaVCalculator.interplanetary_delta_v(CelestialBody.EARTH, CelestialBody.MARS)
+        assert again['total_delta_v'] == pytest.approx(expected_total)
+    
+    def test_all_transfers_matches_pairwise(self):
+        """Test the vectorized transfer matrix against interplanetary_delta_v."""
+        bodies, totals = DeltaVCalculator.all_transfers()
+        assert totals.shape == (len(bodies), len(bodies))
+        
+        for i, departure in enumerate(bodies):
+            for j, target in enumerate(bodies):
+                expected = DeltaVCalculator.interplanetary_delta_v(departure, target)['total_delta_v']
+                assert totals[i, j] == pytest.approx(expected, rel=1e-12)
 
 
 class TestTrajectoryCalculator:
@@ -241,6 +362,27 @@ class TestTrajectoryCalculator:
         assert transfer_type in [TransferType.HOHMANN, TransferType.BI_ELLIPTIC]
         assert delta_v > 0
     
+    def test_transfer_batches_match_scalar(self):
+        """Test batched transfer calculations against the scalar versions."""
+        mu_earth = CELESTIAL_BODIES[CelestialBody.EARTH]['mu']
+        r1 = np.full(6, 6.571e6)
+        r2 = np.array([1.0e7, 4.2164e7, 8.0e7, 1.0e8, 5.0e8, 2.0e9])
+        
+        hohmann = DeltaVCalculator.hohmann_transfer_batch(r1, r2, mu_earth)
+        bi_elliptic = DeltaVCalculator.bi_elliptic_transfer_batch(r1, r2, 3 * r2, mu_earth)
+        use_bi_elliptic, delta_v = TrajectoryCalculator.optimize_transfer_type_batch(r1, r2, mu_earth)
+        
+        for k in range(len(r2)):
+            expected = DeltaVCalculator.hohmann_transfer(r1[k], r2[k], mu_earth)
+            np.testing.assert_allclose([component[k] for component in hohmann], expected, rtol=1e-12)
+            
+            expected = DeltaVCalculator.bi_elliptic_transfer(r1[k], r2[k], 3 * r2[k], mu_earth)
+            np.testing.assert_allclose([component[k] for component in bi_elliptic], expected, rtol=1e-12)
+            
+            transfer_type, expected_dv = TrajectoryCalculator.optimize_transfer_type(r1[k], r2[k], mu_earth)
+            assert use_bi_elliptic[k] == (transfer_type == TransferType.BI_ELLIPTIC)
+            assert delta_v[k] == pytest.approx(expected_dv, rel=1e-12)
+    
     def test_launch_window_calculation(self):
         """Test launch window calculations."""
         start_date = 0  # Epoch
@@ -4,16 +4,29 @@ Tests for vehicle preset service.
 import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from pydantic import ValidationError
+from sqlalchemy import inspect
 from sqlalchemy.pool import StaticPool
 
+from datetime import datetime
+from unittest.mock import patch
+from uuid import uuid4
+
 from app.models.database import Base, VehiclePreset
 from app.models.mission import SpacecraftConfig, VehicleType
+from app.schemas import vehicle_presets as vehicle_presets_schemas
 from app.services.vehicle_presets import (
     VehiclePresetService, 
     seed_vehicle_presets, 
     validate_spacecraft_config,
     REALISTIC_VEHICLE_PRESETS
 )
+from app.schemas.vehicle_presets import (
+    VehiclePresetListResponse,
+    VehiclePresetResponse,
+    VehiclePresetStatsResponse,
+    VehiclePresetSummary
+)
 
 
 # Test database URL (in-memory SQLite for testing)
@@ -173,6 +186,53 @@ class TestVehiclePresetService:
         assert len(public_presets) == 1
         assert public_presets[0].name == "Medium Sat Preset"
     
+    @pytest.mark.asyncio
+    async def test_list_preset_summaries(self, preset_service: VehiclePresetService, sample_spacecraft_config):
+        """Test summary listing defers the spacecraft configuration column."""
+        await preset_service.create_preset(
+            name="Summary Preset",
+            description="Summary test",
+            spacecraft_config=sample_spacecraft_config
+        )
+        preset_service.db.expunge_all()
+        
+        presets = await preset_service.list_preset_summaries(vehicle_type=VehicleType.MEDIUM_SAT)
+        
+        assert len(presets) == 1
+        assert "configuration" in inspect(presets[0]).unloaded
+        summary = VehiclePresetSummary.from_db_model(presets[0])
+        assert summary.name == "Summary Preset"
+        assert summary.mass_kg == sample_spacecraft_config.mass_kg
+    
+    @pytest.mark.asyncio
+    async def test_get_preset_stats(self, preset_service: VehiclePresetService, sample_spacecraft_config):
+        """Test preset statistics are aggregated per vehicle type."""
+        await preset_service.create_preset(
+            name="Public Stats Preset",
+            description="Stats test",
+            spacecraft_config=sample_spacecraft_config,
+            is_public=True
+        )
+        heavier_config = sample_spacecraft_config.model_copy(update={"mass_kg": sample_spacecraft_config.mass_kg * 3})
+        await preset_service.create_preset(
+            name="Private Stats Preset",
+            description="Stats test",
+            spacecraft_config=heavier_config,
+            is_public=False
+        )
+        
+        stats = await preset_service.get_preset_stats()
+        
+        assert stats["total_presets"] == 2
+        assert stats["public_presets"] == 1
+        assert stats["private_presets"] == 1
+        assert len(stats["vehicle_type_stats"]) == 1
+        type_stats = stats["vehicle_type_stats"][0]
+        assert type_stats["vehicle_type"] == VehicleType.MEDIUM_SAT
+        assert type_stats["count"] == 2
+        assert type_stats["avg_mass_kg"] == pytest.approx(sample_spacecraft_config.mass_kg * 2)
+        VehiclePresetStatsResponse(**stats)
+    
     @pytest.mark.asyncio
     async def test_update_preset(self, preset_service: VehiclePresetService, sample_spacecraft_config):
         """Test updating a preset."""
@@ -375,5 +435,81 @@ class TestVehicleConfigValidation:
         assert any("Rovers should not have propulsive thrust" in error for error in errors)
 
 
+class TestVehiclePresetSchemas:
+    """Test building response schemas from database rows."""
+    
+    @pytest.fixture
+    def db_preset(self, sample_spacecraft_config):
+        """Vehicle preset row as loaded from the database."""
+        return VehiclePreset(
+            id=uuid4(),
+            name="Test Satellite",
+            description="Test description",
+            vehicle_type=VehicleType.MEDIUM_SAT.value,
+            configuration=sample_spacecraft_config.model_dump(mode="json"),
+            is_public=True,
+            created_at=datetime(2025, 1, 1),
+            updated_at=datetime(2025, 1, 2),
+            created_by="tester",
+            mass_kg=1000.0,
+            thrust_n=500.0,
+            specific_impulse_s=300.0
+        )
+    
+    def test_response_from_db_model(self, db_preset, sample_spacecraft_config):
+        """Test trusted rows produce the same payload as validated construction."""
+        response = VehiclePresetResponse.from_db_model(db_preset)
+        
+        assert response.vehicle_type == VehicleType.MEDIUM_SAT
+        assert response.spacecraft_config.vehicle_type == VehicleType.MEDIUM_SAT
+        assert response.spacecraft_config == sample_spacecraft_config
+        assert response.model_dump() == VehiclePresetResponse.model_validate(response.model_dump()).model_dump()
+    
+    def test_spacecraft_config_reused_until_updated(self, db_preset):
+        """Test unchanged rows parse their config once and updates rebuild it."""
+        with patch(
+            'app.schemas.vehicle_presets._spacecraft_config_from_db',
+            wraps=vehicle_presets_schemas._spacecraft_config_from_db
+        ) as build:
+            first = VehiclePresetResponse.from_db_model(db_preset)
+            second = VehiclePresetResponse.from_db_model(db_preset)
+        assert build.call_count == 1
+        assert first.spacecraft_config == second.spacecraft_config
+        
+        # Each response owns its config, so in-place edits cannot leak
+        first.spacecraft_config.mass_kg = 1.0
+        assert second.spacecraft_config.mass_kg != 1.0
+        assert VehiclePresetResponse.from_db_model(db_preset).spacecraft_config.mass_kg != 1.0
+        
+        db_preset.configuration = {**db_preset.configuration, "name": "Renamed"}
+        db_preset.updated_at = datetime(2025, 1, 3)
+        updated = VehiclePresetResponse.from_db_model(db_preset)
+        assert updated.spacecraft_config.name == "Renamed"
+    
+    def test_response_is_frozen(self, db_preset):
+        """Test response schemas reject mutation after construction."""
+        response = VehiclePresetResponse.from_db_model(db_preset)
+        
+        with pytest.raises(ValidationError):
+            response.name = "Changed"
+    
+    def test_summary_from_db_model(self, db_preset):
+        """Test summary is built from the indexed columns."""
+        summary = VehiclePresetSummary.from_db_model(db_preset)
+        
+        assert summary.id == db_preset.id
+        assert summary.vehicle_type == VehicleType.MEDIUM_SAT
+        assert summary.mass_kg == 1000.0
+    
+    def test_list_response_from_db_models(self, db_preset):
+        """Test list response wraps every row and serializes in one pass."""
+        response = VehiclePresetListResponse.from_db_models([db_preset, db_preset], limit=10, offset=0)
+        
+        assert response.total == 2
+        assert all(isinstance(preset, VehiclePresetResponse) for preset in response.presets)
+        payload = VehiclePresetListResponse.model_validate_json(response.model_dump_json())
+        assert payload == response
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file